@@ -21,15 +21,22 @@ _CLI = os.path.join(PKGDATADIR, "commands", "cli.exe")
 WININST_DIR = os.path.join(PKGDATADIR, "commands", "wininst")
 
 # Parser parameters
-_PICKLED_PARSETAB = os.path.join(PKGDATADIR, "parsetab")
-_OPTIMIZE_LEX = 0
 _DEBUG_YACC = 0
+# bento.info tokenizer: "ply", or "fast" for the (experimental) hand-written
+# one
+_LEXER = os.environ.get("BENTO_LEXER", "ply")
+
+# Reuse the source tree listings of the previous bentomaker run when the
+# directories did not change (set BENTO_NODE_SNAPSHOT=1 to enable)
+_USE_NODE_SNAPSHOT = os.environ.get("BENTO_NODE_SNAPSHOT", "0") != "0"
 
 # Use subdist bento to avoid clashing with distutils ATM
 _SUB_BUILD_DIR = "bento"
 
 CONFIGURED_STATE_DUMP = os.path.join(_SUB_BUILD_DIR, ".config.bin")
 DB_FILE = os.path.join(_SUB_BUILD_DIR, "cache.db")
+NODE_SNAPSHOT = os.path.join(_SUB_BUILD_DIR, "nodes.db")
+EGG_MANIFEST = os.path.join(_SUB_BUILD_DIR, "egg_manifest.json")
 DISTCHECK_DIR = os.path.join(_SUB_BUILD_DIR, "distcheck")
 IPKG_PATH = os.path.join(_SUB_BUILD_DIR, "ipkg.info")
 
@@ -2,7 +2,7 @@ import os.path as op
 
 from bento.utils.utils \
     import \
-        extract_exception
+        extract_exception, pprint
 from bento.core.node_package \
     import \
         translate_name
@@ -12,6 +12,9 @@ from bento.core.subpackage \
 from bento.commands.command_contexts \
     import \
         ConfigureContext, BuildContext
+from bento.commands.core \
+    import \
+        positive_int
 from bento.errors \
     import \
         ConfigurationError
@@ -21,6 +24,10 @@ from bento.backends.core \
 
 import yaku.context
 import yaku.errors
+import yaku.objcache
+import yaku.probecache
+import yaku.scheduler
+import yaku.task_manager
 
 class ConfigureYakuContext(ConfigureContext):
     def __init__(self, global_context, cmd_argv, options_context, pkg, run_node):
@@ -29,6 +36,13 @@ class ConfigureYakuContext(ConfigureContext):
         source_path = run_node._ctx.srcnode.path_from(run_node)
         self.yaku_context = yaku.context.get_cfg(src_path=source_path, build_path=build_path)
 
+        o, a = options_context.parser.parse_args(cmd_argv)
+        if o.probe_cache:
+            self.yaku_context.probe_cache = yaku.probecache.ProbeCache(o.probe_cache)
+        probe_cache = self.yaku_context.probe_cache
+        if o.clear_probe_cache and probe_cache is not None:
+            probe_cache.clear()
+
     def configure(self):
         extensions = get_extensions(self.pkg, self.run_node)
         libraries = get_compiled_libraries(self.pkg, self.run_node)
@@ -41,6 +55,10 @@ class ConfigureYakuContext(ConfigureContext):
                 except yaku.errors.ConfigurationFailure:
                     e = extract_exception()
                     raise ConfigurationError(str(e))
+            probe_cache = yaku_ctx.probe_cache
+            if probe_cache is not None:
+                pprint("PINK", "Probe cache: %d hit(s), %d miss(es)" % \
+                       (probe_cache.hits, probe_cache.misses))
 
     def finish(self):
         super(ConfigureYakuContext, self).finish()
@@ -72,13 +90,36 @@ class BuildYakuContext(BuildContext):
         self.verbose = o.verbose
         self.jobs = jobs
 
+        if o.object_cache:
+            if o.object_cache_size:
+                max_size = positive_int(o.object_cache_size, "--object-cache-size") * 1024 * 1024
+            else:
+                max_size = yaku.objcache.DEFAULT_MAX_SIZE
+            self.yaku_context.object_cache = yaku.objcache.ObjectCache(o.object_cache, max_size)
+        if self.trace_file:
+            self.tracer.task_graph = yaku.task_manager.task_graph
+            self.yaku_context.tracer = self.tracer
+
         def _builder_factory(category, builder):
             def _build(extension, include_dirs=None, **kw):
                 env = kw.get("env", {})
                 if include_dirs:
                     env["include_dirs"] = include_dirs
 
-                outputs = builder(self.yaku_context, extension, env=env)
+                if category == "extensions":
+                    # Unity builds use one translation unit per job by
+                    # default, an explicit number of units may be given
+                    unity = kw.get("unity_build", extension.unity_build)
+                    if unity is True:
+                        unity = max(1, self.jobs)
+                    elif not unity:
+                        unity = 0
+                    if kw.get("unity_excludes"):
+                        extension.unity_excludes = extension.unity_excludes + \
+                                                   list(kw["unity_excludes"])
+                    outputs = builder(self.yaku_context, extension, env=env, unity=unity)
+                else:
+                    outputs = builder(self.yaku_context, extension, env=env)
                 nodes = [self.build_node.make_node(o) for o in outputs]
 
                 p = self.build_node.find_node(nodes[0].parent.bldpath())
@@ -124,9 +165,16 @@ class BuildYakuContext(BuildContext):
         if self.jobs < 2:
             runner = yaku.scheduler.SerialRunner(bld, task_manager)
         else:
-            runner = yaku.scheduler.ParallelRunner(bld, task_manager, self.jobs)
-        runner.start()
-        runner.run()
+            runner = yaku.scheduler.DependencyRunner(bld, task_manager, self.jobs)
+        object_cache = bld.object_cache
+        try:
+            runner.start()
+            runner.run()
+        finally:
+            if object_cache is not None:
+                object_cache.trim()
+                pprint("PINK", "Object cache: %d hit(s), %d miss(es)" % \
+                       (object_cache.hits, object_cache.misses))
 
         # TODO: inplace support
 
@@ -1,10 +1,11 @@
 import os
+import time
 
 import os.path as op
 
 from bento.utils.utils \
     import \
-        subst_vars
+        subst_vars, pprint
 from bento.installed_package_description \
     import \
         BuildManifest, ipkg_meta_from_pkg
@@ -43,7 +44,16 @@ Usage:   bentomaker build [OPTIONS]."""
                                   dest="jobs"),
                            Option("-v", "--verbose",
                                   help="Verbose output (yaku build only)",
-                                  action="store_true")]
+                                  action="store_true"),
+                           Option("--object-cache",
+                                  help="Directory of the compiled objects cache, shared between builds (yaku build only)",
+                                  dest="object_cache"),
+                           Option("--object-cache-size",
+                                  help="Maximum size of the compiled objects cache in MB (default: 1024)",
+                                  dest="object_cache_size"),
+                           Option("--trace",
+                                  help="Write a trace of the build (Chrome trace-event JSON) to the given file, and print a timing summary",
+                                  dest="trace")]
 
     def run(self, ctx):
         p = ctx.options_context.parser
@@ -52,8 +62,18 @@ Usage:   bentomaker build [OPTIONS]."""
             p.print_help()
             return
 
+        tracer = ctx.tracer
+        start = time.time()
         ctx.compile()
+        tracer.add_event("compile", "bento", start, time.time())
+
+        start = time.time()
         ctx.post_compile()
+        tracer.add_event("post_compile", "bento", start, time.time())
+
+        if ctx.trace_file:
+            tracer.write(ctx.trace_file)
+            pprint("PINK", tracer.summary())
 
     def finish(self, ctx):
         super(BuildCommand, self).finish(ctx)
@@ -1,16 +1,21 @@
 import os
+import sys
+import time
 import warnings
 
 from bento._config \
     import \
-        IPKG_PATH
+        IPKG_PATH, EGG_MANIFEST
 from bento.commands.core \
     import \
         Command, Option
 from bento.commands.egg_utils \
     import \
         EggInfo, egg_filename
-from bento.utils.utils import pprint, extract_exception
+from bento.utils.utils import pprint, cpu_count
+from bento.utils.archive \
+    import \
+        content_key, load_zip_manifest, write_zarchive_incremental, is_executable
 from bento.core \
     import \
         PackageMetadata
@@ -21,7 +26,6 @@ from bento.installed_package_description \
     import \
         BuildManifest, iter_files
 
-import bento.compat.api as compat
 import bento.utils.path
 
 class BuildEggCommand(Command):
@@ -33,7 +37,10 @@ Usage:   bentomaker build_egg [OPTIONS]"""
                         + [Option("--output-dir",
                                   help="Output directory", default="dist"),
                            Option("--output-file",
-                                  help="Output filename")]
+                                  help="Output filename"),
+                           Option("-j", "--jobs",
+                                  help="Number of byte-compilation processes (default: number of CPUs)",
+                                  dest="jobs")]
 
     def run(self, ctx):
         argv = ctx.command_argv
@@ -44,12 +51,67 @@ Usage:   bentomaker build_egg [OPTIONS]"""
             return
         output_dir = o.output_dir
         output_file = o.output_file
+        if o.jobs:
+            jobs = int(o.jobs)
+        else:
+            jobs = cpu_count()
 
         n = ctx.build_node.make_node(IPKG_PATH)
         build_manifest = BuildManifest.from_file(n.abspath())
-        build_egg(build_manifest, ctx.build_node, ctx.build_node, output_dir, output_file)
+        build_egg(build_manifest, ctx.build_node, ctx.build_node, output_dir, output_file, jobs)
+
+def _bcompile_file(filename):
+    try:
+        return bcompile(filename)
+    except PyCompileError:
+        return None
+
+def _bcompile_files(filenames, jobs):
+    """Byte-compile the given files, in parallel processes if jobs > 1. Return
+    the list of bytecodes, with None for the files which failed to compile."""
+    if jobs > 1 and len(filenames) > 1:
+        import multiprocessing
+        pool = multiprocessing.Pool(min(jobs, len(filenames)))
+        try:
+            return pool.map(_bcompile_file, filenames)
+        finally:
+            pool.terminate()
+            pool.join()
+    else:
+        return [_bcompile_file(filename) for filename in filenames]
+
+def _file_content(filename):
+    def _read():
+        f = open(filename, "rb")
+        try:
+            return f.read()
+        finally:
+            f.close()
+    return _read
+
+def _bytecode_content(filename, bytecodes):
+    def _bytecode():
+        try:
+            return bytecodes[filename]
+        except KeyError:
+            return bcompile(filename)
+    return _bytecode
 
-def build_egg(build_manifest, build_node, source_root, output_dir=None, output_file=None):
+def _bytecode_key(filename, source_key):
+    # bytecode depends on the python version and on the source mtime
+    return content_key(("%s:%d:%s" % (sys.version, int(os.stat(filename).st_mtime), source_key)).encode())
+
+def _date_time(filename):
+    # zipimport only uses the bytecode of a .py entry if the entry date
+    # matches the source mtime recorded in the bytecode header
+    return time.localtime(os.stat(filename).st_mtime)[:6]
+
+def build_egg(build_manifest, build_node, source_root, output_dir=None, output_file=None, jobs=1):
+    """Build an egg from the given build manifest.
+
+    The egg is updated incrementally: only the files which changed since the
+    previous egg are byte-compiled (in jobs parallel processes) and
+    compressed again."""
     meta = PackageMetadata.from_ipkg(build_manifest)
     egg_info = EggInfo.from_ipkg(build_manifest, build_node)
 
@@ -70,23 +132,41 @@ def build_egg(build_manifest, build_node, source_root, output_dir=None, output_f
                   "eprefix": source_root.abspath(),
                   "sitedir": source_root.abspath()}
 
-    zid = compat.ZipFile(egg, "w", compat.ZIP_DEFLATED)
-    try:
-        for filename, cnt in egg_info.iter_meta(build_node):
-            zid.writestr(os.path.join("EGG-INFO", filename), cnt)
+    manifest = build_node.make_node(EGG_MANIFEST)
+    manifest.parent.mkdir()
+    old_keys = load_zip_manifest(egg, manifest.abspath())
 
-        for kind, source, target in build_manifest.iter_built_files(source_root, egg_scheme):
-            if not kind in ["executables"]:
-                zid.write(source.abspath(), target.path_from(source_root))
+    entries = []
+    for filename, cnt in egg_info.iter_meta(build_node):
+        if not isinstance(cnt, bytes):
+            cnt = cnt.encode("utf-8")
+        entries.append((os.path.join("EGG-INFO", filename), content_key(cnt), lambda cnt=cnt: cnt,
+                        False, None))
+
+    sources = []
+    to_compile = []
+    for kind, source, target in build_manifest.iter_built_files(source_root, egg_scheme):
+        if not kind in ["executables"]:
+            filename = source.abspath()
+            arcname = target.path_from(source_root)
+            key = content_key(_file_content(filename)())
             if kind == "pythonfiles":
-                try:
-                    bytecode = bcompile(source.abspath())
-                except PyCompileError:
-                    e = extract_exception()
-                    warnings.warn("Error byte-compiling %r" % source.abspath())
-                else:
-                    zid.writestr("%sc" % target.path_from(source_root), bcompile(source.abspath()))
-    finally:
-        zid.close()
-
-    return
+                bytecode_key = _bytecode_key(filename, key)
+                if old_keys.get(("%sc" % arcname).replace(os.sep, "/")) != bytecode_key:
+                    to_compile.append(filename)
+            else:
+                bytecode_key = None
+            sources.append((filename, arcname, key, bytecode_key))
+
+    bytecodes = dict(zip(to_compile, _bcompile_files(to_compile, jobs)))
+    for filename, arcname, key, bytecode_key in sources:
+        date_time = _date_time(filename)
+        entries.append((arcname, key, _file_content(filename), is_executable(filename), date_time))
+        if bytecode_key is not None:
+            if filename in bytecodes and bytecodes[filename] is None:
+                warnings.warn("Error byte-compiling %r" % filename)
+            else:
+                entries.append(("%sc" % arcname, bytecode_key, _bytecode_content(filename, bytecodes),
+                                False, date_time))
+
+    write_zarchive_incremental(egg, entries, manifest.abspath(), jobs)
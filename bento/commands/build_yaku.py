@@ -18,7 +18,7 @@ import yaku.context
 import yaku.scheduler
 import yaku.errors
 
-def build_extension(bld, extension, env=None):
+def build_extension(bld, extension, env=None, unity=0):
     builder = bld.builders["pyext"]
     try:
         if env is None:
@@ -26,7 +26,8 @@ def build_extension(bld, extension, env=None):
         else:
             val = env.get("PYEXT_CPPPATH", [])
             val.extend(extension.include_dirs)
-        tasks = builder.extension(extension.name, extension.sources, env)
+        tasks = builder.extension(extension.name, extension.sources, env,
+                                  unity=unity, unity_excludes=extension.unity_excludes)
         if len(tasks) > 1:
             outputs = tasks[0].gen.outputs
         else:
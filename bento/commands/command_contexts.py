@@ -35,6 +35,10 @@ from bento.installed_package_description \
     import \
         InstalledSection
 
+from bento.utils.trace \
+    import \
+        Tracer
+
 class DummyContextManager(object):
     def __init__(self, pre, post):
         self.pre = pre
@@ -223,6 +227,12 @@ class BuildContext(ContextWithBuildDirectory):
             self.inplace = True
         else:
             self.inplace = False
+
+        if global_context is not None:
+            self.tracer = global_context.tracer
+        else:
+            self.tracer = Tracer()
+        self.trace_file = o.trace
         # Builders signature:
         #   - first argument: name, str. Name of the entity to be built
         #   - second argument: object. Value returned by
@@ -441,13 +451,27 @@ class SdistContext(CmdContext):
                 output = write_template(self.top_node, template, self.pkg, self._meta)
                 self.register_source_node(output, output.bldpath())
 
+class _ShortDescriptions(object):
+    """Mapping command name -> short description, only retrieving (and
+    possibly importing) the commands whose description is asked for."""
+    def __init__(self, global_context):
+        self._global_context = global_context
+
+    def __getitem__(self, cmd_name):
+        if not self._global_context.is_command_registered(cmd_name):
+            raise KeyError(cmd_name)
+        return self._global_context.retrieve_command(cmd_name).short_descr
+
+    def __contains__(self, cmd_name):
+        return self._global_context.is_command_registered(cmd_name)
+
+    def keys(self):
+        return self._global_context.command_names(public_only=False)
+
 class HelpContext(CmdContext):
     def __init__(self, *a, **kw):
         super(HelpContext, self).__init__(*a, **kw)
-        self.short_descriptions = {}
-        for cmd_name in self._global_context.command_names(public_only=False):
-            cmd = self._global_context.retrieve_command(cmd_name)
-            self.short_descriptions[cmd_name] = cmd.short_descr
+        self.short_descriptions = _ShortDescriptions(self._global_context)
 
     def retrieve_options_context(self, cmd_name):
         return self._global_context.retrieve_options_context(cmd_name)
@@ -173,6 +173,13 @@ class ConfigureCommand(Command):
 Purpose: configure the project
 Usage: bentomaker configure [OPTIONS]"""
     short_descr = "configure the project."
+    common_options = Command.common_options \
+                        + [Option("--probe-cache",
+                                  help="Directory of the configuration checks cache, shared between builds (yaku build only)",
+                                  dest="probe_cache"),
+                           Option("--clear-probe-cache",
+                                  help="Empty the configuration checks cache before configuring",
+                                  action="store_true", dest="clear_probe_cache")]
 
     def __init__(self, *a, **kw):
         super(ConfigureCommand, self).__init__(*a, **kw)
@@ -4,6 +4,9 @@ from bento.commands.configure \
 from bento.commands.registries \
     import \
         CommandRegistry, ContextRegistry, OptionsRegistry
+from bento.commands.options \
+    import \
+        OptionsContext
 from bento.commands.dependency \
     import \
         CommandScheduler
@@ -21,6 +24,10 @@ from six.moves \
     import \
         cPickle
 
+from bento.utils.trace \
+    import \
+        Tracer
+
 class GlobalContext(object):
     def __init__(self, command_data_db, commands_registry=None, contexts_registry=None,
             options_registry=None, commands_scheduler=None):
@@ -32,6 +39,8 @@ class GlobalContext(object):
 
         self.backend = None
         self._package_options = None
+        # Timings of bentomaker phases, written out by build --trace
+        self.tracer = Tracer()
 
         self._command_data_db = command_data_db
         if command_data_db is None:
@@ -61,6 +70,24 @@ class GlobalContext(object):
         """
         self._commands_registry.register(cmd_name, cmd, public)
 
+    def register_lazy_command(self, cmd_name, module_name, klass_name, public=True):
+        """Register a command name to a command class given by its location.
+
+        The module is only imported, and the command instantiated, the first
+        time the command is retrieved. The options context of such commands
+        is also only created when retrieved.
+
+        Parameters
+        ----------
+        cmd_name: str
+            name of the command
+        module_name: str
+            full name of the module defining the command class
+        klass_name: str
+            name of the command class (subclass of Command) in module_name
+        """
+        self._commands_registry.register_lazy(cmd_name, module_name, klass_name, public)
+
     def retrieve_command(self, cmd_name):
         """Return the command instance registered for the given command name."""
         return self._commands_registry.retrieve(cmd_name)
@@ -81,6 +108,11 @@ class GlobalContext(object):
     def register_command_context(self, cmd_name, klass):
         self._contexts_registry.register(cmd_name, klass)
 
+    def register_lazy_command_context(self, cmd_name, module_name, klass_name):
+        """Like register_command_context, but the context class is only
+        imported when retrieved."""
+        self._contexts_registry.register_lazy(cmd_name, module_name, klass_name)
+
     def retrieve_command_context(self, cmd_name):
         return self._contexts_registry.retrieve(cmd_name)
 
@@ -107,10 +139,17 @@ class GlobalContext(object):
         return self._options_registry.register(cmd_name, context)
 
     def retrieve_options_context(self, cmd_name):
+        if not self._options_registry.is_registered(cmd_name) \
+                and self._commands_registry.is_lazy(cmd_name):
+            cmd = self.retrieve_command(cmd_name)
+            self.register_options_context(cmd_name, OptionsContext.from_command(cmd))
         return self._options_registry.retrieve(cmd_name)
 
     def is_options_context_registered(self, cmd_name):
-        return self._options_registry.is_registered(cmd_name)
+        # Options contexts of lazily registered commands are created on
+        # demand
+        return self._options_registry.is_registered(cmd_name) \
+                or self._commands_registry.is_lazy(cmd_name)
 
     def add_option_group(self, cmd_name, name, title):
         """Add a new option group for the given command.
@@ -124,7 +163,7 @@ class GlobalContext(object):
         title: str
             title of the group
         """
-        ctx = self._options_registry.retrieve(cmd_name)
+        ctx = self.retrieve_options_context(cmd_name)
         ctx.add_group(name, title)
 
     def add_option(self, cmd_name, option, group=None):
@@ -139,7 +178,7 @@ class GlobalContext(object):
         group: str, None
             group to associated with
         """
-        ctx = self._options_registry.retrieve(cmd_name)
+        ctx = self.retrieve_options_context(cmd_name)
         ctx.add_option(option, group)
 
     def register_package_options(self, package_options):
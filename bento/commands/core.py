@@ -73,6 +73,17 @@ Usage:   bentomaker help [TOPIC] or bentomaker help [COMMAND]."""
         else:
             raise UsageException("error: command %s not recognized" % cmd_name)
 
+def positive_int(value, option):
+    """Convert the value given to option to a positive integer, raising a
+    UsageException if it is not one."""
+    try:
+        ret = int(value)
+    except ValueError:
+        ret = 0
+    if ret < 1:
+        raise UsageException("Invalid value for %s: %r (expected a positive integer)" % (option, value))
+    return ret
+
 def fill_string(s, minlen):
     if len(s) < minlen:
         s += " " * (minlen - len(s))
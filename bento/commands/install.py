@@ -1,7 +1,9 @@
 import os
+import stat
 import shutil
 import subprocess
 import errno
+import threading
 
 from bento._config \
     import \
@@ -10,9 +12,11 @@ from bento.installed_package_description import \
     BuildManifest, iter_files
 
 from bento.commands.core import \
-    Command, Option
+    Command, Option, positive_int
 from bento.utils.utils import \
-    pprint, extract_exception, MODE_755, MODE_777
+    pprint, extract_exception, same_content, cpu_count, MODE_755, MODE_777
+from bento.utils.os2 import \
+    copy_file, copy_times
 
 def _rollback_operation(line):
     operation, arg = line.split()
@@ -25,7 +29,14 @@ def _rollback_operation(line):
             if e.errno != 66:
                 raise
     elif operation == "COPY":
-        os.remove(arg)
+        try:
+            os.remove(arg)
+        except OSError:
+            e = extract_exception()
+            # The install may have been interrupted between the journaling
+            # of the copy and the copy itself
+            if e.errno != errno.ENOENT:
+                raise
     else:
         raise ValueError("Unknown operation: %s" % operation)
 
@@ -55,18 +66,33 @@ class TransactionLog(object):
         open(journal_filename, "w").close()
         self.f = open(journal_filename, "w")
         self.journal_filename = journal_filename
+        self._lock = threading.Lock()
 
     def copy(self, source, target, category):
+        self.start_copy(target)
+        shutil.copy(source, target)
+        if category == "executables":
+            os.chmod(target, MODE_755)
+
+    def start_copy(self, target):
+        """Record the copy of a file to target, before doing it."""
         if os.path.exists(target):
             self.rollback()
             raise ValueError("File %s already exists, rolled back installation" % target)
         d = os.path.dirname(target)
         if not os.path.exists(d):
             self.makedirs(d)
-        self.f.write("COPY %s\n" % target)
-        shutil.copy(source, target)
-        if category == "executables":
-            os.chmod(target, MODE_755)
+        self.record_copy(target)
+
+    def record_copy(self, target):
+        """Record the copy of a file to target, whose directory must already
+        exist. May be called from several threads."""
+        self._lock.acquire()
+        try:
+            self.f.write("COPY %s\n" % target)
+            self.f.flush()
+        finally:
+            self._lock.release()
 
     def makedirs(self, name, mode=MODE_777):
         head, tail = os.path.split(name)
@@ -108,6 +134,137 @@ def copy_installer(source, target, kind):
     if kind == "executables":
         os.chmod(target, MODE_755)
 
+def is_up_to_date(source, target):
+    """Return True if target already has the content of source.
+
+    The files are only compared if they have the same size and different
+    mtimes (install_file gives the target the mtime of its source)."""
+    try:
+        st_target = os.stat(target)
+    except OSError:
+        return False
+    st_source = os.stat(source)
+    if st_target.st_size != st_source.st_size:
+        return False
+    if (st_target.st_dev, st_target.st_ino) == (st_source.st_dev, st_source.st_ino):
+        return True
+    if st_target.st_mtime == st_source.st_mtime:
+        return True
+    if same_content(source, target):
+        # Avoid comparing the files again next time
+        copy_times(st_source, target)
+        return True
+    return False
+
+def install_file(source, target, kind, hardlink=False):
+    """Install source into target, with the mode and mtime of source. If
+    hardlink is True, target is a hard link to source if possible.
+
+    An existing target is removed first, so that a previous hard link is not
+    written through."""
+    if os.path.lexists(target):
+        os.remove(target)
+    if hardlink:
+        try:
+            os.link(source, target)
+        except (OSError, AttributeError):
+            copy_file(source, target)
+    else:
+        copy_file(source, target)
+    if kind == "executables":
+        os.chmod(target, MODE_755)
+
+def _map(func, args, jobs):
+    if jobs > 1 and len(args) > 1:
+        from multiprocessing.pool import ThreadPool
+        pool = ThreadPool(min(jobs, len(args)))
+        try:
+            return pool.map(lambda a: func(*a), args)
+        finally:
+            pool.close()
+            pool.join()
+    else:
+        return [func(*a) for a in args]
+
+class InstallEngine(object):
+    """Install a set of files, skipping the ones which are already up to date.
+
+    Target directories are created once, before the files are copied in
+    parallel threads. When a TransactionLog is given, every directory and
+    file creation is recorded in it before being done. Files already up to
+    date are not recorded: the transaction only covers what it changed, and
+    rolling it back leaves them in place. Any other existing target aborts
+    the transaction.
+
+    Parameters
+    ----------
+    jobs: int
+        number of copy threads
+    hardlink: bool
+        if True, hard link the targets to their source when possible
+    transaction: TransactionLog, None
+        transaction log to record the install into
+    """
+    def __init__(self, jobs=1, hardlink=False, transaction=None):
+        self.jobs = jobs
+        self.hardlink = hardlink
+        self.transaction = transaction
+
+        self.installed = []
+        self.skipped = []
+
+    def _check(self, kind, source, target):
+        if not is_up_to_date(source, target):
+            return False
+        if kind == "executables" and stat.S_IMODE(os.stat(target).st_mode) != MODE_755:
+            os.chmod(target, MODE_755)
+        return True
+
+    def _makedirs(self, directories):
+        for d in sorted(directories):
+            if os.path.isdir(d):
+                continue
+            if self.transaction is not None:
+                self.transaction.makedirs(d)
+            else:
+                try:
+                    os.makedirs(d)
+                except OSError:
+                    e = extract_exception()
+                    if e.errno != errno.EEXIST:
+                        raise
+
+    def _install_file(self, source, target, kind):
+        if self.transaction is not None:
+            self.transaction.record_copy(target)
+        install_file(source, target, kind, self.hardlink)
+
+    def install(self, files):
+        """Install the given (kind, source, target) files, where source and
+        target are paths."""
+        files = list(files)
+        up_to_date = _map(self._check, files, self.jobs)
+
+        to_install = []
+        for f, skip in zip(files, up_to_date):
+            if skip:
+                self.skipped.append(f[2])
+            else:
+                to_install.append(f)
+
+        if self.transaction is not None:
+            # Check every target before journaling anything, so that a
+            # rollback only undoes what was actually done
+            for kind, source, target in to_install:
+                if os.path.exists(target):
+                    self.transaction.rollback()
+                    raise ValueError("File %s already exists, rolled back installation" % target)
+        self._makedirs(set(os.path.dirname(target) for kind, source, target in to_install))
+
+        _map(self._install_file, [(source, target, kind)
+                                  for kind, source, target in to_install], self.jobs)
+        self.installed.extend(target for kind, source, target in to_install)
+
 def unix_installer(source, target, kind):
     if kind in ["executables"]:
         mode = "755"
@@ -127,10 +284,17 @@ Usage:   bentomaker install [OPTIONS]."""
     short_descr = "install the project."
     common_options = Command.common_options + \
                         [Option("-t", "--transaction",
-                                help="Do a transaction-based install", action="store_true"),
+                                help="Do a transaction-based install (files already up to date are skipped, and kept on rollback)",
+                                action="store_true"),
                          Option("-n", "--dry-run", "--list-files",
                                 help="List installed files (do not install anything)",
-                                action="store_true", dest="list_files")]
+                                action="store_true", dest="list_files"),
+                         Option("-j", "--jobs",
+                                help="Number of copy threads (default: number of CPUs)",
+                                dest="jobs"),
+                         Option("--hardlink",
+                                help="Hard link the installed files to the built ones when possible",
+                                action="store_true")]
     def run(self, ctx):
         argv = ctx.command_argv
         p = ctx.options_context.parser
@@ -153,13 +317,18 @@ Usage:   bentomaker install [OPTIONS]."""
                 print(target.abspath())
             return
 
+        if o.jobs:
+            jobs = positive_int(o.jobs, "-j")
+        else:
+            jobs = cpu_count()
+
+        files = [(kind, source.abspath(), target.abspath())
+                 for kind, source, target in iter_files(node_sections)]
         if o.transaction:
             trans = TransactionLog("transaction.log")
             try:
-                for kind, source, target in iter_files(node_sections):
-                    trans.copy(source.abspath(), target.abspath(), kind)
+                InstallEngine(jobs, o.hardlink, trans).install(files)
             finally:
                 trans.close()
         else:
-            for kind, source, target in iter_files(node_sections):
-                copy_installer(source.abspath(), target.abspath(), kind)
+            InstallEngine(jobs, o.hardlink).install(files)
@@ -1,57 +1,95 @@
+import sys
+
 from bento.compat.api \
     import \
         defaultdict
 
+def _import_attribute(module_name, name):
+    __import__(module_name)
+    return getattr(sys.modules[module_name], name)
+
 class CommandRegistry(object):
     def __init__(self):
         # command line name -> command class
         self._klasses = {}
         # command line name -> None for private commands
         self._privates = {}
+        # command line name -> (module name, class name) for commands
+        # registered lazily: the module is only imported the first time the
+        # command is retrieved
+        self._lazy = {}
 
     def register(self, name, cmd_klass, public=True):
-        if name in self._klasses:
+        if self.is_registered(name):
             raise ValueError("context for command %r already registered !" % name)
         else:
             self._klasses[name] = cmd_klass
             if not public:
                 self._privates[name] = None
 
+    def register_lazy(self, name, module_name, klass_name, public=True):
+        if self.is_registered(name):
+            raise ValueError("context for command %r already registered !" % name)
+        else:
+            self._lazy[name] = (module_name, klass_name)
+            if not public:
+                self._privates[name] = None
+
     def retrieve(self, name):
         cmd_klass = self._klasses.get(name, None)
         if cmd_klass is None:
+            if name in self._lazy:
+                module_name, klass_name = self._lazy[name]
+                cmd_klass = _import_attribute(module_name, klass_name)()
+                self._klasses[name] = cmd_klass
+                return cmd_klass
             raise ValueError("No command class registered for name %r" % name)
         else:
             return cmd_klass
 
     def is_registered(self, name):
-        return name in self._klasses
+        return name in self._klasses or name in self._lazy
+
+    def is_lazy(self, name):
+        return name in self._lazy
 
     def command_names(self):
-        return self._klasses.keys()
+        return list(set(self._klasses.keys()).union(self._lazy.keys()))
 
     def public_command_names(self):
-        return [k for k in self._klasses.keys() if not k in self._privates]
+        return [k for k in self.command_names() if not k in self._privates]
 
 class ContextRegistry(object):
     def __init__(self, default=None):
         self._contexts = {}
+        # command line name -> (module name, class name) for contexts
+        # registered lazily
+        self._lazy = {}
         self.set_default(default)
 
     def set_default(self, default):
         self._default = default
 
     def is_registered(self, cmd_name):
-        return cmd_name in self._contexts
+        return cmd_name in self._contexts or cmd_name in self._lazy
 
     def register(self, cmd_name, context):
-        if cmd_name in self._contexts:
+        if self.is_registered(cmd_name):
             raise ValueError("context for command %r already registered !" % cmd_name)
         else:
             self._contexts[cmd_name] = context
 
+    def register_lazy(self, cmd_name, module_name, klass_name):
+        if self.is_registered(cmd_name):
+            raise ValueError("context for command %r already registered !" % cmd_name)
+        else:
+            self._lazy[cmd_name] = (module_name, klass_name)
+
     def retrieve(self, cmd_name):
         context = self._contexts.get(cmd_name, None)
+        if context is None and cmd_name in self._lazy:
+            context = _import_attribute(*self._lazy.pop(cmd_name))
+            self._contexts[cmd_name] = context
         if context is None:
             if self._default is None:
                 raise ValueError("No context registered for command %r" % cmd_name)
@@ -1,13 +1,16 @@
-import tarfile
-
 import os.path as op
 
-import bento.compat.api as compat
 import bento.errors
 
 from bento.commands.core \
     import \
         Command, Option
+from bento.utils.utils \
+    import \
+        cpu_count
+from bento.utils.archive \
+    import \
+        write_tarball, write_zarchive
 
 def archive_basename(pkg):
     if pkg.version:
@@ -15,33 +18,30 @@ def archive_basename(pkg):
     else:
         return pkg.name
 
-def create_tarball(node_pkg, archive_root, archive_node):
-    tf = tarfile.open(archive_node.abspath(), "w:gz")
-    try:
-        for filename, alias in node_pkg.iter_source_files():
-            tf.add(filename, op.join(archive_root, alias))
-    finally:
-        tf.close()
-
-def create_zarchive(node_pkg, archive_root, archive_node):
-    zid = compat.ZipFile(archive_node.abspath(), "w", compat.ZIP_DEFLATED)
-    try:
-        for filename, alias in node_pkg.iter_source_files():
-            zid.write(filename, op.join(archive_root, alias))
-    finally:
-        zid.close()
+def _archive_files(node_pkg, archive_root):
+    return [(filename, op.join(archive_root, alias)) for filename, alias in node_pkg.iter_source_files()]
+
+def create_tarball(node_pkg, archive_root, archive_node, jobs=1):
+    write_tarball(archive_node.abspath(), _archive_files(node_pkg, archive_root), "gz", jobs)
+
+def create_xztarball(node_pkg, archive_root, archive_node, jobs=1):
+    write_tarball(archive_node.abspath(), _archive_files(node_pkg, archive_root), "xz", jobs)
+
+def create_zarchive(node_pkg, archive_root, archive_node, jobs=1):
+    write_zarchive(archive_node.abspath(), _archive_files(node_pkg, archive_root), jobs)
 
 _FORMATS = {"gztar": {"ext": ".tar.gz", "func": create_tarball},
+            "xztar": {"ext": ".tar.xz", "func": create_xztarball},
             "zip": {"ext": ".zip", "func": create_zarchive}}
 
-def create_archive(archive_name, archive_root, node_pkg, top_node, run_node, format="tgz", output_directory="dist"):
+def create_archive(archive_name, archive_root, node_pkg, top_node, run_node, format="tgz", output_directory="dist", jobs=1):
     if not format in _FORMATS:
         raise ValueError("Unknown format: %r" % (format,))
 
     archive_node = top_node.make_node(op.join(output_directory, archive_name))
     archive_node.parent.mkdir()
 
-    _FORMATS[format]["func"](node_pkg, archive_root, archive_node) 
+    _FORMATS[format]["func"](node_pkg, archive_root, archive_node, jobs)
     return archive_root, archive_node
 
 class SdistCommand(Command):
@@ -53,7 +53,10 @@ Usage:   bentomaker sdist [OPTIONS]."""
                         + [Option("--output-dir",
                                   help="Output directory", default="dist"),
                            Option("--format",
-                                  help="Archive format (supported: 'gztar', 'zip')", default="gztar"),
+                                  help="Archive format (supported: 'gztar', 'xztar', 'zip')", default="gztar"),
+                           Option("-j", "--jobs",
+                                  help="Number of compression threads (default: number of CPUs)",
+                                  dest="jobs"),
                            Option("--output-file",
                                   help="Archive filename (default: $pkgname-$version.$archive_extension)")]
 
@@ -67,6 +70,13 @@ Usage:   bentomaker sdist [OPTIONS]."""
 
         pkg = ctx.pkg
         format = o.format
+        if not format in _FORMATS:
+            raise bento.errors.UsageException("Unknown archive format %r (supported: %s)" % \
+                                              (format, ", ".join(sorted(_FORMATS.keys()))))
+        if o.jobs:
+            jobs = int(o.jobs)
+        else:
+            jobs = cpu_count()
 
         archive_root = "%s-%s" % (pkg.name, pkg.version)
         if not o.output_file:
@@ -80,4 +90,4 @@ Usage:   bentomaker sdist [OPTIONS]."""
         # XXX: find a better way to pass archive name from other commands (used
         # by distcheck ATM)
         self.archive_root, self.archive_node = create_archive(archive_name, archive_root, ctx._node_pkg,
-                ctx.top_node, ctx.run_node, o.format, o.output_dir)
+                ctx.top_node, ctx.run_node, o.format, o.output_dir, jobs)
@@ -11,7 +11,7 @@ from bento.core.node \
         create_first_node
 from bento.commands.core \
     import \
-        HelpCommand, Command
+        HelpCommand, Command, positive_int
 from bento.commands.command_contexts \
     import \
         HelpContext
@@ -24,6 +24,9 @@ from bento.commands.contexts \
 from bento.commands.options \
     import \
         OptionsContext
+from bento.errors \
+    import \
+        UsageException
 import bento.commands.registries
 
 class TestHelpCommand(unittest.TestCase):
@@ -70,3 +73,9 @@ class TestHelpCommand(unittest.TestCase):
         context = HelpContext(global_context, ["configure"], options, pkg, self.run_node)
 
         run_command_in_context(context, help)
+
+class TestPositiveInt(unittest.TestCase):
+    def test_simple(self):
+        self.assertEqual(positive_int("4", "-j"), 4)
+        for value in ["0", "-1", "four", ""]:
+            self.assertRaises(UsageException, lambda: positive_int(value, "-j"))
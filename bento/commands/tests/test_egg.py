@@ -1,5 +1,9 @@
 import os
+import sys
+import struct
+import marshal
 import shutil
+import zipfile
 import tempfile
 
 from bento.compat.api.moves \
@@ -25,6 +29,13 @@ from bento.core.pkg_objects \
 from bento.commands.egg_utils \
     import \
         EggInfo
+from bento.commands.build_egg \
+    import \
+        build_egg
+import bento.commands.build_egg
+from bento.installed_package_description \
+    import \
+        BuildManifest, InstalledSection, ipkg_meta_from_pkg
 
 DESCR = """\
 Name: Sphinx
@@ -161,3 +172,113 @@ Platform: UNKNOWN
         egg_info = self._prepare_egg_info()
         for name, content in egg_info.iter_meta(self.build_node):
             pass
+
+class TestBuildEgg(unittest.TestCase):
+    def setUp(self):
+        self.old_dir = os.getcwd()
+        self.tmpdir = tempfile.mkdtemp()
+        os.chdir(self.tmpdir)
+        self.top_node, self.build_node, self.run_node = \
+                create_base_nodes(self.tmpdir, os.path.join(self.tmpdir, "build"))
+
+        for name in ["foo/__init__.py", "foo/bar.py"]:
+            n = self.build_node.make_node(name)
+            n.parent.mkdir()
+            n.write("a = 1\n")
+        n = self.build_node.make_node("foo/_bar.so")
+        n.write("")
+        os.chmod(n.abspath(), 0o755)
+
+        pythonfiles = InstalledSection.from_source_target_directories("pythonfiles",
+                        "foo", "$_srcrootdir", "$sitedir", ["foo/__init__.py", "foo/bar.py"])
+        extensions = InstalledSection.from_source_target_directories("extensions",
+                        "foo._bar", "$_srcrootdir", "$sitedir", ["foo/_bar.so"])
+        sections = {"pythonfiles": {"foo": pythonfiles},
+                    "extensions": {"foo._bar": extensions}}
+        meta = ipkg_meta_from_pkg(PackageDescription.from_string(DESCR))
+        self.build_manifest = BuildManifest(sections, meta, {})
+
+    def tearDown(self):
+        os.chdir(self.old_dir)
+        shutil.rmtree(self.tmpdir)
+
+    def _build_egg(self, bytecode=None):
+        compiled = []
+        # Record the byte-compiled files, the bytecode itself does not matter
+        # unless given
+        def _bcompile(filename):
+            compiled.append(os.path.basename(filename))
+            if bytecode is None:
+                return b"bytecode"
+            else:
+                return bytecode(filename)
+        # Only the archive content matters here, not the egg metadata
+        def _iter_meta(self, build_node):
+            yield "PKG-INFO", "Name: Sphinx\n"
+        old_bcompile = bento.commands.build_egg.bcompile
+        old_iter_meta = EggInfo.iter_meta
+        bento.commands.build_egg.bcompile = _bcompile
+        EggInfo.iter_meta = _iter_meta
+        try:
+            build_egg(self.build_manifest, self.build_node, self.build_node,
+                      output_dir="dist", output_file="foo.egg")
+        finally:
+            EggInfo.iter_meta = old_iter_meta
+            bento.commands.build_egg.bcompile = old_bcompile
+
+        z = zipfile.ZipFile(os.path.join("dist", "foo.egg"))
+        try:
+            self.assertTrue(z.testzip() is None)
+            modes = dict([(info.filename, (info.external_attr >> 16) & 0o777)
+                          for info in z.infolist()])
+        finally:
+            z.close()
+        return sorted(compiled), modes
+
+    def test_incremental(self):
+        compiled, modes = self._build_egg()
+        # Each python file is compiled once
+        self.assertEqual(compiled, ["__init__.py", "bar.py"])
+        self.assertEqual(sorted(modes.keys()),
+                         ["EGG-INFO/PKG-INFO", "foo/__init__.py", "foo/__init__.pyc",
+                          "foo/_bar.so", "foo/bar.py", "foo/bar.pyc"])
+        self.assertEqual(modes["foo/_bar.so"], 0o755)
+        self.assertEqual(modes["foo/bar.py"], 0o644)
+
+        # Unchanged files are reused without compiling them again
+        self.assertEqual(self._build_egg(), ([], modes))
+
+        n = self.build_node.find_node("foo/bar.py")
+        n.write("a = 2\n")
+        os.utime(n.abspath(), (0, 0))
+        self.assertEqual(self._build_egg()[0], ["bar.py"])
+
+    def test_zipimport(self):
+        if sys.version_info[:2] < (3, 7):
+            raise unittest.SkipTest("Test bytecode uses the python >= 3.7 header")
+        import importlib.util
+        # Bytecode of a different code than the source, to detect whether
+        # zipimport uses it
+        def _bytecode(filename):
+            st = os.stat(filename)
+            code = compile("a = 'bytecode'\n", filename, "exec")
+            return importlib.util.MAGIC_NUMBER \
+                   + struct.pack("<3L", 0, int(st.st_mtime) & 0xffffffff, st.st_size & 0xffffffff) \
+                   + marshal.dumps(code)
+        for n in ["foo/__init__.py", "foo/bar.py"]:
+            # odd number of seconds, not representable in a zip entry date
+            os.utime(self.build_node.find_node(n).abspath(), (1300000001, 1300000001))
+        self._build_egg(_bytecode)
+
+        egg = os.path.abspath(os.path.join("dist", "foo.egg"))
+        sys.path.insert(0, egg)
+        try:
+            import foo.bar
+            try:
+                self.assertEqual(foo.bar.a, "bytecode")
+            finally:
+                del sys.modules["foo.bar"]
+                del sys.modules["foo"]
+        finally:
+            sys.path.remove(egg)
+            sys.path_importer_cache.pop(egg, None)
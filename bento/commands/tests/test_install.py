@@ -1,4 +1,5 @@
 import os
+import stat
 import shutil
 import tempfile
 import os.path as op
@@ -28,7 +29,7 @@ from bento.commands.tests.utils \
         prepare_configure, prepare_build
 from bento.commands.install \
     import \
-        InstallCommand, TransactionLog, rollback_transaction
+        InstallCommand, TransactionLog, rollback_transaction, InstallEngine
 from bento.commands.options \
     import \
         OptionsContext
@@ -221,3 +222,165 @@ class TestTransactionLog(unittest.TestCase):
             self.fail("Expected failure at this point !")
         finally:
             log.close()
+
+class TestInstallEngine(unittest.TestCase):
+    def setUp(self):
+        self.base_dir = tempfile.mkdtemp()
+        self.source_dir = op.join(self.base_dir, "build")
+        os.makedirs(self.source_dir)
+        self.files = write_simple_tree(self.source_dir)
+        self.target_prefix = op.join(self.base_dir, "foo")
+
+    def tearDown(self):
+        shutil.rmtree(self.base_dir)
+
+    def _install_files(self):
+        files = []
+        for i, source in enumerate(self.files):
+            if i == 0:
+                kind = "executables"
+            else:
+                kind = "pythonfiles"
+            target = op.join(self.target_prefix, op.relpath(source, self.source_dir))
+            files.append((kind, source, target))
+        return files
+
+    def _install(self, **kw):
+        engine = InstallEngine(**kw)
+        engine.install(self._install_files())
+        return engine
+
+    def _read(self, filename):
+        fid = open(filename, "rt")
+        try:
+            return fid.read()
+        finally:
+            fid.close()
+
+    def _write(self, filename, content):
+        fid = open(filename, "wt")
+        try:
+            fid.write(content)
+        finally:
+            fid.close()
+
+    def test_simple(self):
+        engine = self._install(jobs=4)
+        self.assertEqual(len(engine.installed), len(self.files))
+        self.assertEqual(engine.skipped, [])
+        for kind, source, target in self._install_files():
+            self.assertEqual(self._read(target), self._read(source))
+            self.assertEqual(os.stat(target).st_mtime, os.stat(source).st_mtime)
+        target = self._install_files()[0][2]
+        self.assertEqual(stat.S_IMODE(os.stat(target).st_mode), int("755", 8))
+
+    def test_reinstall(self):
+        self._install()
+        engine = self._install()
+        self.assertEqual(engine.installed, [])
+        self.assertEqual(len(engine.skipped), len(self.files))
+
+        # Same content, different mtime: not copied again
+        os.utime(self.files[1], (0, 0))
+        # Same size, different content: copied again
+        self._write(self.files[2], self._read(self.files[2]).replace("file", "elif"))
+        os.utime(self.files[2], (0, 0))
+
+        engine = self._install(jobs=4)
+        self.assertEqual(engine.installed, [self._install_files()[2][2]])
+        self.assertEqual(self._read(engine.installed[0]), self._read(self.files[2]))
+
+    def test_hardlink(self):
+        if not hasattr(os, "link"):
+            raise unittest.SkipTest("hard links not available")
+        self._install(hardlink=True)
+        for kind, source, target in self._install_files():
+            self.assertTrue(op.samefile(source, target))
+        engine = self._install()
+        self.assertEqual(engine.installed, [])
+
+        # Replacing a hard-linked target does not modify its source
+        self._write(self.files[1], "modified")
+        os.utime(self.files[1], (0, 0))
+        target = self._install_files()[1][2]
+        os.remove(target)
+        shutil.copy(self.files[2], target)
+        self._install()
+        self.assertEqual(self._read(target), "modified")
+        self.assertEqual(self._read(self.files[2]), "file 2")
+
+    def test_transaction(self):
+        trans_file = op.join(self.base_dir, "trans.log")
+        trans = TransactionLog(trans_file)
+        try:
+            self._install(jobs=4, transaction=trans)
+        finally:
+            trans.close()
+        for kind, source, target in self._install_files():
+            self.assertTrue(op.exists(target))
+
+        lines = open(trans_file).readlines()
+        self.assertEqual(len([l for l in lines if l.startswith("COPY")]), len(self.files))
+        self.assertTrue(lines[0].startswith("MKDIR"))
+
+        rollback_transaction(trans_file)
+        self.assertFalse(op.exists(self.target_prefix))
+
+    def test_transaction_existing(self):
+        self._install()
+        target = self._install_files()[1][2]
+        self._write(target, "modified")
+
+        trans = TransactionLog(op.join(self.base_dir, "trans.log"))
+        try:
+            self.assertRaises(ValueError, lambda: self._install(transaction=trans))
+        finally:
+            trans.close()
+
+    def test_transaction_up_to_date(self):
+        # Up to date targets are skipped, neither journaled nor rolled back
+        self._install()
+        target = self._install_files()[1][2]
+        os.remove(target)
+
+        trans_file = op.join(self.base_dir, "trans.log")
+        trans = TransactionLog(trans_file)
+        try:
+            engine = self._install(jobs=4, transaction=trans)
+        finally:
+            trans.close()
+        self.assertEqual(engine.installed, [target])
+        self.assertEqual(len(engine.skipped), len(self.files) - 1)
+        self.assertEqual(self._read(trans_file), "COPY %s\n" % target)
+
+        rollback_transaction(trans_file)
+        for kind, source, t in self._install_files():
+            self.assertEqual(op.exists(t), t != target)
+
+    def test_transaction_stale_target(self):
+        # Only the last target exists: nothing may be installed or journaled
+        trans_file = op.join(self.base_dir, "trans.log")
+        target = self._install_files()[-1][2]
+        os.makedirs(op.dirname(target))
+        self._write(target, "stale content")
+
+        trans = TransactionLog(trans_file)
+        try:
+            self.assertRaises(ValueError, lambda: self._install(jobs=4, transaction=trans))
+        finally:
+            trans.close()
+        for kind, source, t in self._install_files()[:-1]:
+            self.assertFalse(op.exists(t))
+        self.assertEqual(self._read(target), "stale content")
+        self.assertEqual(self._read(trans_file), "")
+
+    def test_rollback_interrupted_copy(self):
+        # The copy was journaled, but never done
+        trans_file = op.join(self.base_dir, "trans.log")
+        self._write(trans_file, "MKDIR %s\nCOPY %s\n" % \
+                    (self.target_prefix, op.join(self.target_prefix, "foo.txt")))
+        os.makedirs(self.target_prefix)
+
+        rollback_transaction(trans_file)
+        self.assertFalse(op.exists(self.target_prefix))
+        self.assertFalse(op.exists(trans_file))
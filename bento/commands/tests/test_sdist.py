@@ -2,6 +2,7 @@ import os
 import os.path as op
 import tempfile
 import shutil
+import tarfile
 import zipfile
 
 from bento.compat.api.moves \
@@ -31,6 +32,9 @@ from bento.core.testing \
 from bento.convert.utils \
     import \
         canonalize_path
+from bento.utils.archive \
+    import \
+        lzma
 
 class TestBaseSdist(unittest.TestCase):
     def setUp(self):
@@ -169,3 +173,37 @@ VERSION = $VERSION
         run_command_in_context(context, sdist)
 
         self._assert_archive_equality(op.join("dist", "foo.zip"), archive_list)
+
+    def test_xztar_reproducible(self):
+        if lzma is None:
+            raise unittest.SkipTest("lzma not available")
+        bento_info = """\
+Name: foo
+Version: 1.0
+
+Library:
+    Packages: foo, foo.bar
+    Modules: fubar
+"""
+        create_fake_package_from_bento_info(self.top_node, bento_info)
+        package = PackageDescription.from_string(bento_info)
+
+        contents = []
+        for jobs in ["1", "2"]:
+            sdist = SdistCommand()
+            opts = OptionsContext.from_command(sdist)
+            cmd_argv = ["--format=xztar", "-j", jobs]
+
+            context = SdistContext(None, cmd_argv, opts, package, self.run_node)
+            run_command_in_context(context, sdist)
+
+            archive = self.run_node.find_node(op.join("dist", "foo-1.0.tar.xz"))
+            contents.append(archive.read("rb"))
+            tf = tarfile.open(archive.abspath())
+            try:
+                self.assertEqual(tf.getnames(),
+                                 ["foo-1.0/foo/__init__.py", "foo-1.0/foo/bar/__init__.py",
+                                  "foo-1.0/fubar.py"])
+            finally:
+                tf.close()
+        self.assertEqual(contents[0], contents[1])
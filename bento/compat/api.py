@@ -74,6 +74,14 @@ if sys.version_info < (3, 0, 0):
 else:
     input = input
 
+try:
+    from os import scandir
+except ImportError:
+    try:
+        from scandir import scandir
+    except ImportError:
+        scandir = None
+
 try:
     from functools import partial
 except ImportError:
@@ -14,7 +14,7 @@ import os.path as op
 
 from bento.compat.api \
     import \
-        rename
+        rename, scandir
 from bento.utils.utils \
     import \
         is_string, extract_exception
@@ -83,6 +83,160 @@ if sys.platform == 'cygwin':
 elif sys.platform == 'win32':
     split_path = split_path_win32
 
+def _list_dir_entries(path):
+    """Return the sorted list of (name, is_dir) for the given directory.
+
+    os.scandir gives the entry type from the directory itself, without one
+    extra stat per entry."""
+    if scandir is None:
+        return [(name, os.path.isdir(op.join(path, name))) for name in sorted(os.listdir(path))]
+
+    it = scandir(path)
+    try:
+        entries = [(entry.name, entry.is_dir()) for entry in it]
+    finally:
+        if hasattr(it, 'close'):
+            it.close()
+    entries.sort()
+    return entries
+
+# Characters which make an ant pattern segment a regex instead of a plain name
+_RE_SPECIALS = set('*?[](){}|^$\\')
+
+def _segment_regex(segment):
+    segment = segment.replace('.', '[.]').replace('*','.*').replace('?', '.').replace('+', '\\+')
+    return '^%s$' % segment
+
+def _to_pat(s):
+    ret = []
+    for x in to_list(s):
+        x = x.replace('\\', '/').replace('//', '/')
+        if x.endswith('/'):
+            x += '**'
+        ret.append(tuple(x.split('/')))
+    return ret
+
+class _AntState(object):
+    """
+    State of the ant matcher for a given path: the set of positions (i, n),
+    meaning the first n segments of the i-th pattern match the path.
+
+    The transitions for each name are cached, so that walking many
+    directories with the same names (tests, __init__.py, etc...) only
+    matches each name once.
+    """
+    __slots__ = ('matcher', 'positions', 'alive', 'accepted', 'recurse',
+                 '_next', '_always', '_literals', '_regex', '_groups')
+
+    def __init__(self, matcher, positions):
+        self.matcher = matcher
+        self.positions = positions
+
+        incl_end = incl_pending = rejected = False
+        for i, n in positions:
+            if n == len(matcher.patterns[i]):
+                if i < matcher.n_incl:
+                    incl_end = True
+                else:
+                    rejected = True
+            elif i < matcher.n_incl:
+                incl_pending = True
+        # Excluded paths are neither returned nor walked into
+        self.alive = not rejected and (incl_end or incl_pending)
+        self.accepted = not rejected and incl_end
+        self.recurse = not rejected and incl_pending
+
+        self._next = {}
+        self._always = None
+
+    def _compile(self):
+        # Plain names are looked up in a dict, and every other segment is
+        # merged in a single regex made of optional lookaheads, so that one
+        # match gives all the matching segments at once.
+        always = []
+        literals = {}
+        regexes = []
+        groups = []
+
+        def add_segment(segment, position):
+            if _RE_SPECIALS.isdisjoint(segment):
+                literals.setdefault(segment, []).append(position)
+            else:
+                group = 'g%d' % len(groups)
+                regexes.append('(?:(?=(?P<%s>%s)))?' % (group, _segment_regex(segment)))
+                groups.append((group, position))
+
+        for i, n in self.positions:
+            pat = self.matcher.patterns[i]
+            if n == len(pat):
+                continue
+            elif pat[n] == '**':
+                always.append((i, n))
+                if n + 1 < len(pat):
+                    add_segment(pat[n + 1], (i, n + 2))
+                else:
+                    always.append((i, n + 1))
+            else:
+                add_segment(pat[n], (i, n + 1))
+
+        self._literals = literals
+        if regexes:
+            self._regex = re.compile(''.join(regexes))
+        else:
+            self._regex = None
+        self._groups = groups
+        self._always = always
+
+    def next(self, name):
+        "state for the given entry name in the directory of this state"
+        try:
+            return self._next[name]
+        except KeyError:
+            pass
+
+        if self._always is None:
+            self._compile()
+        positions = set(self._always)
+        positions.update(self._literals.get(name, ()))
+        if self._regex is not None:
+            m = self._regex.match(name)
+            for group, position in self._groups:
+                if m.group(group) is not None:
+                    positions.add(position)
+
+        ret = self._next[name] = self.matcher.state(frozenset(positions))
+        return ret
+
+class _AntMatcher(object):
+    """
+    All the include and exclude patterns of an ant_glob call compiled into a
+    single state machine on path segments.
+    """
+    def __init__(self, incl, excl):
+        incl = _to_pat(incl)
+        excl = _to_pat(excl)
+        self.patterns = incl + excl
+        self.n_incl = len(incl)
+        self._states = {}
+        self.start = self.state(frozenset((i, 0) for i in range(len(self.patterns))))
+
+    def state(self, positions):
+        try:
+            return self._states[positions]
+        except KeyError:
+            ret = self._states[positions] = _AntState(self, positions)
+            return ret
+
+_ANT_MATCHERS = {}
+
+def _ant_matcher(incl, excl):
+    key = (tuple(to_list(incl)), tuple(to_list(excl)))
+    try:
+        return _ANT_MATCHERS[key]
+    except KeyError:
+        ret = _ANT_MATCHERS[key] = _AntMatcher(incl, excl)
+        return ret
+
 class Node(object):
     __slots__ = ('name', 'sig', 'children', 'parent', 'cache_abspath', 'cache_isdir')
     def __init__(self, name, parent):
@@ -171,9 +325,24 @@ class Node(object):
             val += 1
         return val
 
+    def _snapshot(self):
+        "the directory snapshot of the node tree, if any"
+        return getattr(getattr(self, '_ctx', None), 'snapshot', None)
+
+    def _dir_entries(self):
+        "sorted list of (name, is_dir) for the directory contents"
+        snapshot = self._snapshot()
+        if snapshot is None:
+            return _list_dir_entries(self.abspath())
+        else:
+            return snapshot.listdir(self.abspath())
+
     def listdir(self):
         "list the directory contents"
-        return os.listdir(self.abspath())
+        if self._snapshot() is None:
+            return os.listdir(self.abspath())
+        else:
+            return [name for name, isdir in self._dir_entries()]
 
     def mkdir(self):
         "write a directory for the node"
@@ -205,6 +374,7 @@ class Node(object):
         if is_string(lst):
             lst = [x for x in split_path(lst) if x and x != '.']
 
+        snapshot = self._snapshot()
         cur = self
         for x in lst:
             if x == '..':
@@ -218,13 +388,22 @@ class Node(object):
             except:
                 cur.children = {}
 
+            # entries listed in the snapshot are known to exist
+            if snapshot is not None:
+                isdir = snapshot.lookup(cur.abspath(), x)
+            else:
+                isdir = None
+
             # optimistic: create the node first then look if it was correct to do so
             cur = self.__class__(x, cur)
-            try:
-                os.stat(cur.abspath())
-            except:
-                del cur.parent.children[x]
-                return None
+            if isdir is None:
+                try:
+                    os.stat(cur.abspath())
+                except:
+                    del cur.parent.children[x]
+                    return None
+            elif isdir:
+                cur.cache_isdir = True
 
         ret = cur
 
@@ -340,16 +519,14 @@ class Node(object):
             p = p.parent
         return id(p) == id(node)
 
-    def _ant_iter(self, accept=None, maxdepth=25, pats=[], dir=False, src=True, remove=True):
+    def _ant_iter(self, state, maxdepth=25, dir=False, src=True, remove=True):
         """
         Semi-private and recursive method used by ant_glob.
 
-        :param accept: function used for accepting/rejecting a node, returns the patterns that can be still accepted in recursion
-        :type accept: function
+        :param state: state of the ant matcher for this node
+        :type state: _AntState
         :param maxdepth: maximum depth in the filesystem (25)
         :type maxdepth: int
-        :param pats: list of patterns to accept and list of patterns to exclude
-        :type pats: tuple
         :param dir: return folders too (False by default)
         :type dir: bool
         :param src: return files (True by default)
@@ -357,26 +534,27 @@ class Node(object):
         :param remove: remove files/folders that do not exist (True by default)
         :type remove: bool
         """
-        dircont = self.listdir()
-        dircont.sort()
+        entries = self._dir_entries()
 
         try:
-            lst = set(self.children.keys())
+            children = self.children
+        except AttributeError:
+            children = self.children = {}
+        else:
             if remove:
-                for x in lst - set(dircont):
-                    del self.children[x]
-        except:
-            self.children = {}
-
-        for name in dircont:
-            npats = accept(name, pats)
-            if npats and npats[0]:
-                accepted = [] in npats[0]
+                names = set(name for name, isdir in entries)
+                for x in [x for x in children if x not in names]:
+                    del children[x]
 
-                node = self.make_node([name])
+        for name, isdir in entries:
+            npats = state.next(name)
+            if npats.alive:
+                try:
+                    node = children[name]
+                except KeyError:
+                    node = self.__class__(name, self)
 
-                isdir = os.path.isdir(node.abspath())
-                if accepted:
+                if npats.accepted:
                     if isdir:
                         if dir:
                             yield node
@@ -386,10 +564,9 @@ class Node(object):
 
                 if getattr(node, 'cache_isdir', None) or isdir:
                     node.cache_isdir = True
-                    if maxdepth:
-                        for k in node._ant_iter(accept=accept, maxdepth=maxdepth - 1, pats=npats, dir=dir, src=src):
+                    if maxdepth and npats.recurse:
+                        for k in node._ant_iter(npats, maxdepth=maxdepth - 1, dir=dir, src=src, remove=remove):
                             yield k
-        raise StopIteration
 
     def ant_glob(self, *k, **kw):
         """
@@ -430,49 +607,8 @@ class Node(object):
         excl = kw.get('excl', exclude_regs)
         incl = k and k[0] or kw.get('incl', '**')
 
-        def to_pat(s):
-            lst = to_list(s)
-            ret = []
-            for x in lst:
-                x = x.replace('\\', '/').replace('//', '/')
-                if x.endswith('/'):
-                    x += '**'
-                lst2 = x.split('/')
-                accu = []
-                for k in lst2:
-                    if k == '**':
-                        accu.append(k)
-                    else:
-                        k = k.replace('.', '[.]').replace('*','.*').replace('?', '.').replace('+', '\\+')
-                        k = '^%s$' % k
-                        accu.append(re.compile(k))
-                ret.append(accu)
-            return ret
-
-        def filtre(name, nn):
-            ret = []
-            for lst in nn:
-                if not lst:
-                    pass
-                elif lst[0] == '**':
-                    ret.append(lst)
-                    if len(lst) > 1:
-                        if lst[1].match(name):
-                            ret.append(lst[2:])
-                    else:
-                        ret.append([])
-                elif lst[0].match(name):
-                    ret.append(lst[1:])
-            return ret
-
-        def accept(name, pats):
-            nacc = filtre(name, pats[0])
-            nrej = filtre(name, pats[1])
-            if [] in nrej:
-                nacc = []
-            return [nacc, nrej]
-
-        ret = [x for x in self._ant_iter(accept=accept, pats=[to_pat(incl), to_pat(excl)], maxdepth=25, dir=dir, src=src, remove=kw.get('remove', True))]
+        matcher = _ant_matcher(incl, excl)
+        ret = [x for x in self._ant_iter(matcher.start, maxdepth=kw.get('maxdepth', 25), dir=dir, src=src, remove=kw.get('remove', True))]
         if kw.get('flat', False):
             return ' '.join([x.path_from(self) for x in ret])
 
@@ -486,12 +622,7 @@ class Node(object):
         if isinstance(lst, str):
             lst = [x for x in split_path(lst) if x and x != '.']
 
-        node = self.find_node(lst)
-        try:
-            os.path.isdir(node.abspath())
-        except OSError:
-            return None
-        return node
+        return self.find_node(lst)
 
 class NodeWithBuild(Node):
     """
@@ -593,7 +724,8 @@ class NodeWithBuild(Node):
         return self.parent.declare([name])
 
 class _NodeContext(object):
-    __slot__ = ("srcnode", "bldnode")
+    __slot__ = ("srcnode", "bldnode", "snapshot")
+    snapshot = None
 
 def create_first_node(source_path):
     """
@@ -605,9 +737,12 @@ def create_first_node(source_path):
         raise IOError("Invalid source_path: %r" % source_path)
     return top
 
-def create_root_with_source_tree(source_path, build_path):
+def create_root_with_source_tree(source_path, build_path, snapshot=None):
     """
     Both source_path and build_path should be absolute paths
+
+    If given, the snapshot (a DirectorySnapshot instance) is used to list the
+    source directories and find the source nodes.
     """
     root = NodeWithBuild("", None)
     top = root.find_node(source_path)
@@ -618,18 +753,19 @@ def create_root_with_source_tree(source_path, build_path):
     node_context = _NodeContext()
     node_context.srcnode = top
     node_context.bldnode = build
+    node_context.snapshot = snapshot
     NodeWithBuild._ctx = node_context
 
     return root
 
-def create_base_nodes(source_path=None, build_path=None, run_path=None):
+def create_base_nodes(source_path=None, build_path=None, run_path=None, snapshot=None):
     if source_path is None:
         source_path = os.getcwd()
     if build_path is None:
         build_path = op.join(source_path, "build")
     if run_path is None:
         run_path = os.getcwd()
-    root = create_root_with_source_tree(source_path, build_path)
+    root = create_root_with_source_tree(source_path, build_path, snapshot)
     top_node  = root.find_node(source_path)
     build_node  = root.find_node(build_path)
     run_node = root.find_node(run_path)
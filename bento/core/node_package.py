@@ -24,11 +24,17 @@ class NodeDataFiles(object):
         self.target_dir = target_dir
 
 class NodeExtension(object):
-    def __init__(self, name, nodes, top_node, ref_node, sub_directory_node=None, include_dirs=None):
+    def __init__(self, name, nodes, top_node, ref_node, sub_directory_node=None, include_dirs=None,
+                 unity_build=False, unity_excludes=None):
         self.name = name
         self.top_node = top_node
         self.ref_node = ref_node
         self.nodes = nodes
+        self.unity_build = unity_build
+        if unity_excludes is None:
+            self.unity_excludes = []
+        else:
+            self.unity_excludes = unity_excludes
 
         if sub_directory_node is None:
             self.top_or_lib_node = top_node
@@ -70,7 +76,9 @@ class NodeExtension(object):
                     else:
                         return ".".join(full_name_components[len(parent_components):])
                 relative_name = translate_full_name(self.full_name)
-                return Extension(relative_name, sources=[n.path_from(from_node) for n in self.nodes])
+                return Extension(relative_name, sources=[n.path_from(from_node) for n in self.nodes],
+                                 unity_build=self.unity_build,
+                                 unity_excludes=[n.path_from(from_node) for n in self.unity_excludes])
 
 class NodePythonPackage(object):
     def __init__(self, name, nodes, top_node, ref_node, sub_directory_node=None):
@@ -132,7 +140,17 @@ class NodeRepresentation(object):
                         raise IOError("include dir %s is invalid" % include_dir)
                     else:
                         include_dirs.append(n)
-        return NodeExtension(extension.name, nodes, self.top_node, ref_node, self.sub_directory_node)
+        # Compiled libraries do not support unity builds
+        unity_excludes = []
+        for s in getattr(extension, "unity_excludes", []):
+            n = source_node.find_node(s)
+            if n is None:
+                raise IOError("UnityExcludes entry %r for extension %r not found" \
+                              % (s, extension.name))
+            unity_excludes.append(n)
+        return NodeExtension(extension.name, nodes, self.top_node, ref_node, self.sub_directory_node,
+                             unity_build=getattr(extension, "unity_build", False),
+                             unity_excludes=unity_excludes)
 
     def _run_in_subpackage(self, pkg, func):
         for name, sub_pkg in pkg.subpackages.items():
@@ -0,0 +1,156 @@
+"""
+Persistent snapshot of the source tree listings, to avoid listing the same
+directories again for every bentomaker command.
+
+For each directory of the source tree, the snapshot records its mtime and its
+sorted entries (name, is_dir). A directory mtime changes whenever an entry is
+added, removed or renamed inside it, so a recorded listing is reused as long
+as the directory mtime is unchanged.
+"""
+import os
+import time
+import bisect
+
+import os.path as op
+
+from six.moves import cPickle
+
+from bento.core.node \
+    import \
+        _list_dir_entries
+from bento.utils.io2 \
+    import \
+        safe_write
+from bento.utils.utils \
+    import \
+        RACY_DELAY
+
+class DirectorySnapshot(object):
+    """Directory listings of a source tree, keyed by directory mtime.
+
+    Parameters
+    ----------
+    filename: str, None
+        file where the snapshot is loaded from and saved to. If None, the
+        snapshot is only kept in memory.
+    source_path: str
+        only the directories below source_path are recorded
+    excluded_paths: list, None
+        directories below source_path which are not recorded (the build
+        directory, typically).
+    """
+    __version__ = "1"
+    __magic__ = "NODE_SNAPSHOT_BENTOMAGIC"
+
+    def __init__(self, filename, source_path, excluded_paths=None):
+        self.filename = filename
+        self._source_path = op.normpath(source_path)
+        if excluded_paths is None:
+            excluded_paths = []
+        self._excluded_paths = [op.normpath(p) for p in excluded_paths]
+
+        # path -> (mtime, sorted list of (name, is_dir))
+        self._dirs = {}
+        # Directories whose recorded listing has been checked against their
+        # mtime during this run
+        self._checked = set()
+        self._dirty = False
+
+        if filename is not None and op.exists(filename):
+            self._load(filename)
+
+    def _load(self, filename):
+        fid = open(filename, "rb")
+        try:
+            try:
+                db = cPickle.load(fid)
+            except Exception:
+                db = None
+        finally:
+            fid.close()
+
+        if isinstance(db, dict) and db.get("magic") == self.__magic__ \
+                and db.get("version") == self.__version__ \
+                and db.get("source_path") == self._source_path:
+            self._dirs = db["dirs"]
+
+    def save(self):
+        """Write the snapshot to its file, if the tree was walked and anything
+        changed, and the file directory exists. An invalid snapshot file is
+        only replaced once something was listed."""
+        if self.filename is None or not self._dirty:
+            return
+        if not op.isdir(op.dirname(self.filename)):
+            return
+        db = {"magic": self.__magic__, "version": self.__version__,
+              "source_path": self._source_path, "dirs": self._dirs}
+        safe_write(self.filename, lambda fd: cPickle.dump(db, fd, protocol=2))
+        self._dirty = False
+
+    def _is_recorded(self, path):
+        if not (path == self._source_path or path.startswith(self._source_path + os.sep)):
+            return False
+        for excluded in self._excluded_paths:
+            if path == excluded or path.startswith(excluded + os.sep):
+                return False
+        return True
+
+    def listdir(self, path):
+        """Return the sorted list of (name, is_dir) entries of the given
+        directory, reusing the recorded listing if the directory mtime did
+        not change."""
+        if not self._is_recorded(path):
+            return _list_dir_entries(path)
+
+        try:
+            mtime = os.stat(path).st_mtime
+        except OSError:
+            if self._dirs.pop(path, None) is not None:
+                self._dirty = True
+            raise
+
+        recorded = self._dirs.get(path)
+        if recorded is not None and recorded[0] == mtime:
+            self._checked.add(path)
+            return recorded[1]
+
+        entries = _list_dir_entries(path)
+        # Directories modified too recently may change again without a new
+        # mtime: their listing is not recorded
+        if mtime < time.time() - RACY_DELAY:
+            self._dirs[path] = (mtime, entries)
+            self._checked.add(path)
+            self._dirty = True
+        elif recorded is not None:
+            del self._dirs[path]
+            self._checked.discard(path)
+            self._dirty = True
+        return entries
+
+    def lookup(self, path, name):
+        """Return the recorded is_dir value of the entry name inside the
+        directory path, or None if unknown.
+
+        The directory mtime is only checked once per run. None is returned for
+        entries not in the recorded listing: callers should check for
+        themselves whether the entry was created since then."""
+        recorded = self._dirs.get(path)
+        if recorded is None:
+            return None
+
+        if not path in self._checked:
+            try:
+                mtime = os.stat(path).st_mtime
+            except OSError:
+                mtime = None
+            if recorded[0] != mtime:
+                del self._dirs[path]
+                self._dirty = True
+                return None
+            self._checked.add(path)
+
+        entries = recorded[1]
+        i = bisect.bisect_left(entries, (name,))
+        if i < len(entries) and entries[i][0] == name:
+            return entries[i][1]
+        return None
@@ -4,6 +4,11 @@ from copy \
     import \
         deepcopy
 
+try:
+    from hashlib import md5
+except ImportError:
+    from md5 import md5
+
 from bento.core.pkg_objects \
     import \
         Extension, DataFiles, Executable, CompiledLibrary
@@ -49,7 +54,50 @@ def _parse_libraries(libraries):
                     CompiledLibrary.from_parse_dict(v)
     return ret
 
-def recurse_subentos(subentos, source_dir):
+def _checksum(data):
+    if not isinstance(data, bytes):
+        data = data.encode("utf-8")
+    return md5(data).hexdigest()
+
+def _parse_subento(f, subento_cache):
+    fid = open(f)
+    try:
+        data = fid.read()
+    finally:
+        fid.close()
+
+    if subento_cache is None:
+        return raw_to_subpkg_kw(raw_parse(data, f))
+    else:
+        checksum = _checksum(data)
+        cached = subento_cache.get(f)
+        if cached is None or cached[0] != checksum:
+            cached = (checksum, raw_to_subpkg_kw(raw_parse(data, f)))
+            subento_cache[f] = cached
+        # The cached result must not be modified by the caller
+        return deepcopy(cached[1])
+
+def recurse_subentos(subentos, source_dir, subento_cache=None):
+    """Parse the given subentos (and recursively their own subentos).
+
+    Parameters
+    ----------
+    subentos: list
+        subento directories, relatively to source_dir
+    source_dir: str
+        top directory
+    subento_cache: dict, None
+        if given, cache {filename: (checksum, result)} of the parsed subento
+        files, updated in place: only the subentos whose bento.info content
+        changed since they were cached are parsed again.
+
+    Returns
+    -------
+    subpackages: dict
+        {filename: SubPackageDescription}
+    filenames: list
+        subentos and hook files paths, relatively to source_dir
+    """
     filenames = []
     subpackages = {}
 
@@ -60,21 +108,16 @@ def recurse_subentos(subentos, source_dir):
             raise ValueError("%s not found !" % f)
         filenames.append(relpath(f, source_dir))
 
-        fid = open(f)
-        try:
-            key = relpath(f, source_dir)
-            rdir = relpath(os.path.join(cwd, subento), source_dir)
-
-            d = raw_parse(fid.read(), f)
-            kw, subentos = raw_to_subpkg_kw(d)
-            subpackages[key] = SubPackageDescription(rdir, **kw)
-            hooks_as_abspaths = [os.path.normpath(os.path.join(cwd, subento, h)) \
-                                 for h in subpackages[key].hook_files]
-            filenames.extend([relpath(f, source_dir) for f in hooks_as_abspaths])
-            for s in subentos:
-                _recurse(s, os.path.join(cwd, subento))
-        finally:
-            fid.close()
+        key = relpath(f, source_dir)
+        rdir = relpath(os.path.join(cwd, subento), source_dir)
+
+        kw, subentos = _parse_subento(f, subento_cache)
+        subpackages[key] = SubPackageDescription(rdir, **kw)
+        hooks_as_abspaths = [os.path.normpath(os.path.join(cwd, subento, h)) \
+                             for h in subpackages[key].hook_files]
+        filenames.extend([relpath(f, source_dir) for f in hooks_as_abspaths])
+        for s in subentos:
+            _recurse(s, os.path.join(cwd, subento))
 
     for s in subentos:
         _recurse(s, source_dir)
@@ -111,7 +154,7 @@ def raw_to_subpkg_kw(raw_dict):
 
     return kw, misc_d["subento"]
 
-def raw_to_pkg_kw(raw_dict, user_flags, bento_info=None):
+def raw_to_pkg_kw(raw_dict, user_flags, bento_info=None, subento_cache=None):
     if bento_info is None:
         source_dir = os.getcwd()
     else:
@@ -150,7 +193,8 @@ def raw_to_pkg_kw(raw_dict, user_flags, bento_info=None):
         if len(subentos) > 0 and libraries and libraries["sub_directory"] is not None:
             raise InvalidPackage("You cannot use both Recurse and Library:SubDirectory features !")
         else:
-            subpackages, files = recurse_subentos(subentos, source_dir=source_dir)
+            subpackages, files = recurse_subentos(subentos, source_dir=source_dir,
+                                                  subento_cache=subento_cache)
             kw["subpackages"] = subpackages
     else:
         files = []
@@ -377,6 +421,10 @@ def static_representation(pkg, options={}):
                 indented_list("Sources", ext.sources, 3)
                 if ext.include_dirs:
                     indented_list("IncludeDirs", ext.include_dirs, 3)
+                if ext.unity_build:
+                    r.append(' ' * 2 * indent_level + "UnityBuild: true")
+                if ext.unity_excludes:
+                    indented_list("UnityExcludes", ext.unity_excludes, 3)
         r.append("")
 
     for name, value in pkg.executables.items():
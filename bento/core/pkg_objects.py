@@ -119,7 +119,20 @@ class Compiled(object):
     #    return self.__str__()
 
 class Extension(Compiled):
-    pass
+    def __init__(self, name, sources, include_dirs=None, unity_build=False, unity_excludes=None):
+        super(Extension, self).__init__(name, sources, include_dirs)
+        # If True, the C sources are compiled as a few concatenated
+        # translation units, except for the sources in unity_excludes
+        self.unity_build = unity_build
+        if unity_excludes is None:
+            self.unity_excludes = []
+        else:
+            self.unity_excludes = [bento.utils.path.normalize_path(p) for p in unity_excludes]
+
+    def __eq__(self, other):
+        return super(Extension, self).__eq__(other) \
+                and self.unity_build == other.unity_build \
+                and self.unity_excludes == other.unity_excludes
 
 class CompiledLibrary(Compiled):
     pass
@@ -88,7 +88,14 @@ def flatten_subpackage_extensions(spkg, top_node):
         include_dirs = [
                 local_node.find_node(d).path_from(top_node) \
                 for d in extension.include_dirs]
-        ret[full_name] = Extension(full_name, sources, include_dirs)
+        unity_excludes = []
+        for s in extension.unity_excludes:
+            node = local_node.find_node(s)
+            if node is None:
+                raise IOError("File %s not found" % s)
+            unity_excludes.append(node.path_from(top_node))
+        ret[full_name] = Extension(full_name, sources, include_dirs,
+                                   extension.unity_build, unity_excludes)
     return ret
 
 def flatten_subpackage_compiled_libraries(spkg, top_node):
@@ -14,6 +14,8 @@ from bento.core.node \
     import \
         Node, create_root_with_source_tree, find_root, split_path_win32, split_path_cygwin
 
+import bento.core.node
+
 class TestNode(unittest.TestCase):
     def setUp(self):
         self.root = Node("", None)
@@ -126,6 +128,87 @@ class TestNodeInsideTemp(unittest.TestCase):
         foobar = self.d_node.find_node("foo.bar")
         self.assertEqual(set(node.abspath() for node in nodes), set([foobar.abspath()]))
 
+class TestAntGlob(unittest.TestCase):
+    def setUp(self):
+        root = Node("", None)
+        self.d_node = root.find_node(tempfile.mkdtemp())
+        for filename in ["foo.py", "foo.txt", "bar/bar.py", "bar/bar.txt",
+                         "bar/fubar/fubar.py", "bar/.svn/entries", "foo.py~",
+                         "baz/baz.py", "baz/sub/baz.py"]:
+            n = self.d_node.make_node(filename)
+            n.parent.mkdir()
+            n.write("")
+
+    def tearDown(self):
+        shutil.rmtree(self.d_node.abspath())
+
+    def _glob(self, *a, **kw):
+        return sorted(n.path_from(self.d_node).replace(os.sep, "/") \
+                      for n in self.d_node.ant_glob(*a, **kw))
+
+    def test_recursive(self):
+        self.assertEqual(self._glob("**/*.py"),
+                         ["bar/bar.py", "bar/fubar/fubar.py", "baz/baz.py",
+                          "baz/sub/baz.py", "foo.py"])
+        self.assertEqual(self._glob("bar/**/*.py"), ["bar/bar.py", "bar/fubar/fubar.py"])
+        self.assertEqual(self._glob("*/*.py baz/sub/*"),
+                         ["bar/bar.py", "baz/baz.py", "baz/sub/baz.py"])
+        self.assertEqual(self._glob("ba?/bar.*"), ["bar/bar.py", "bar/bar.txt"])
+
+    def test_excl(self):
+        # Default exclusions
+        self.assertEqual(self._glob("bar/**"),
+                         ["bar/bar.py", "bar/bar.txt", "bar/fubar/fubar.py"])
+        self.assertEqual(self._glob("bar/**", excl=[]),
+                         ["bar/.svn/entries", "bar/bar.py", "bar/bar.txt",
+                          "bar/fubar/fubar.py"])
+        self.assertEqual(self._glob("**/*.py", excl=["baz/", "**/fubar.py"]),
+                         ["bar/bar.py", "foo.py"])
+
+    def test_dir(self):
+        self.assertEqual(self._glob("*", dir=True, src=False), ["bar", "baz"])
+        self.assertEqual(self._glob("ba*/**", dir=True, src=False),
+                         ["bar/fubar", "baz/sub"])
+
+    def test_flat(self):
+        self.assertEqual(self.d_node.ant_glob("*.py", flat=True), "foo.py")
+
+    def test_remove(self):
+        self.d_node.make_node("nope.py")
+        self._glob("*.py")
+        self.assertTrue(self.d_node.search("nope.py") is None)
+
+    def test_no_scandir(self):
+        old = bento.core.node.scandir
+        try:
+            bento.core.node.scandir = None
+            self.assertEqual(self._glob("**/*.py", excl=["**/sub"]),
+                             ["bar/bar.py", "bar/fubar/fubar.py", "baz/baz.py", "foo.py"])
+        finally:
+            bento.core.node.scandir = old
+
+    def test_pruning(self):
+        if bento.core.node.scandir is None:
+            raise unittest.SkipTest("scandir not available")
+        # Directory entries types are not stat-ed again, and excluded or
+        # non-matching directories are not walked into
+        listed = []
+        old_scandir = bento.core.node.scandir
+        old_isdir = os.path.isdir
+        def _scandir(path):
+            listed.append(op.relpath(path, self.d_node.abspath()))
+            return old_scandir(path)
+        def _isdir(path):
+            raise AssertionError("unexpected isdir call for %r" % path)
+        try:
+            bento.core.node.scandir = _scandir
+            os.path.isdir = _isdir
+            self.assertEqual(self._glob("ba*/*.py", excl=["baz"]), ["bar/bar.py"])
+        finally:
+            bento.core.node.scandir = old_scandir
+            os.path.isdir = old_isdir
+        self.assertEqual(sorted(listed), [".", "bar"])
+
 class TestNodeWithBuild(unittest.TestCase):
     def setUp(self):
         top = os.getcwd()
@@ -0,0 +1,159 @@
+import os
+import time
+import shutil
+import tempfile
+
+import os.path as op
+
+from bento.compat.api.moves \
+    import \
+        unittest
+from bento.core.node \
+    import \
+        create_base_nodes
+
+import bento.core.node
+import bento.core.node_snapshot
+
+from bento.core.node_snapshot \
+    import \
+        DirectorySnapshot
+
+class TestDirectorySnapshot(unittest.TestCase):
+    def setUp(self):
+        self.d = tempfile.mkdtemp()
+        self.build = op.join(self.d, "build")
+        self.db_dir = tempfile.mkdtemp()
+        self.filename = op.join(self.db_dir, "nodes.db")
+        for f in ["foo.py", "bar/bar.py", "bar/baz/baz.py", "build/foo.o"]:
+            self._write(f)
+        self._make_old()
+
+        self.listed = []
+        self._old_list_dir_entries = bento.core.node_snapshot._list_dir_entries
+        def _list_dir_entries(path):
+            self.listed.append(op.relpath(path, self.d))
+            return self._old_list_dir_entries(path)
+        bento.core.node_snapshot._list_dir_entries = _list_dir_entries
+
+    def tearDown(self):
+        bento.core.node_snapshot._list_dir_entries = self._old_list_dir_entries
+        bento.core.node.NodeWithBuild._ctx.snapshot = None
+        shutil.rmtree(self.d)
+        shutil.rmtree(self.db_dir)
+
+    def _write(self, f):
+        f = op.join(self.d, f)
+        if not op.exists(op.dirname(f)):
+            os.makedirs(op.dirname(f))
+        open(f, "w").close()
+
+    def _make_old(self, dirs=None, age=60):
+        # Make sure the directories mtime are not considered racy
+        past = time.time() - age
+        if dirs is None:
+            dirs = [root for root, dirs, files in os.walk(self.d)]
+        else:
+            dirs = [op.join(self.d, d) for d in dirs]
+        for d in dirs:
+            os.utime(d, (past, past))
+
+    def _create_nodes(self):
+        snapshot = DirectorySnapshot(self.filename, self.d, [self.build])
+        top_node = create_base_nodes(self.d, self.build, snapshot=snapshot)[0]
+        return snapshot, top_node
+
+    def _glob(self, top_node):
+        return sorted(n.path_from(top_node).replace(os.sep, "/") for n in top_node.ant_glob("**/*"))
+
+    def test_reuse(self):
+        snapshot, top_node = self._create_nodes()
+        self.assertEqual(self._glob(top_node),
+                         ["bar/bar.py", "bar/baz/baz.py", "build/foo.o", "foo.py"])
+        self.assertEqual(sorted(self.listed), [".", "bar", "bar/baz", "build"])
+        snapshot.save()
+
+        self.listed = []
+        snapshot, top_node = self._create_nodes()
+        self.assertEqual(self._glob(top_node),
+                         ["bar/bar.py", "bar/baz/baz.py", "build/foo.o", "foo.py"])
+        # The build directory is not recorded
+        self.assertEqual(self.listed, ["build"])
+
+    def test_modified(self):
+        snapshot, top_node = self._create_nodes()
+        self._glob(top_node)
+        snapshot.save()
+
+        self._write("bar/fubar.py")
+        self._make_old(["bar"], age=30)
+        self.listed = []
+        snapshot, top_node = self._create_nodes()
+        self.assertEqual(self._glob(top_node),
+                         ["bar/bar.py", "bar/baz/baz.py", "bar/fubar.py", "build/foo.o", "foo.py"])
+        self.assertEqual(sorted(self.listed), ["bar", "build"])
+
+    def test_racy(self):
+        self._write("bar/fubar.py")
+        snapshot, top_node = self._create_nodes()
+        self._glob(top_node)
+        snapshot.save()
+
+        # bar was modified too recently to be recorded
+        self.listed = []
+        snapshot, top_node = self._create_nodes()
+        self._glob(top_node)
+        self.assertEqual(sorted(self.listed), ["bar", "build"])
+
+    def test_find_node(self):
+        snapshot, top_node = self._create_nodes()
+        self._glob(top_node)
+        snapshot.save()
+
+        snapshot, top_node = self._create_nodes()
+        old_stat = os.stat
+        stated = []
+        def _stat(path):
+            stated.append(op.relpath(path, self.d))
+            return old_stat(path)
+        try:
+            os.stat = _stat
+            node = top_node.find_node("bar/baz/baz.py")
+            self.assertTrue(node is not None)
+            self.assertTrue(top_node.find_dir("bar/baz") is node.parent)
+            # Created after the snapshot: found with a stat
+            open(op.join(self.d, "bar", "fubar.py"), "w").close()
+            self.assertTrue(top_node.find_node("bar/fubar.py") is not None)
+            self.assertTrue(top_node.find_node("bar/nope.py") is None)
+        finally:
+            os.stat = old_stat
+        # Only the directories are stat-ed, once, and the entries missing from
+        # the snapshot
+        self.assertEqual(stated, [".", "bar", "bar/baz", "bar/fubar.py", "bar/nope.py"])
+
+    def test_invalid_file(self):
+        fid = open(self.filename, "wb")
+        try:
+            fid.write("garbage".encode())
+        finally:
+            fid.close()
+        snapshot, top_node = self._create_nodes()
+        self.assertEqual(self._glob(top_node),
+                         ["bar/bar.py", "bar/baz/baz.py", "build/foo.o", "foo.py"])
+        snapshot.save()
+        self.assertTrue(DirectorySnapshot(self.filename, self.d)._dirs)
+
+    def test_not_walked(self):
+        fid = open(self.filename, "wb")
+        try:
+            fid.write("garbage".encode())
+        finally:
+            fid.close()
+        # Nothing listed: the file is left alone
+        snapshot, top_node = self._create_nodes()
+        snapshot.save()
+        fid = open(self.filename, "rb")
+        try:
+            self.assertEqual(fid.read(), "garbage".encode())
+        finally:
+            fid.close()
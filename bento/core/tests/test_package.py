@@ -66,6 +66,20 @@ Library:
 """
         self._static_representation(bento_info)
 
+    def test_unity_extension(self):
+        bento_info = """\
+Name: foo
+
+Library:
+    Extension: _foo
+        Sources: foo.c, bar.c
+        UnityBuild: true
+        UnityExcludes: bar.c
+"""
+        self._static_representation(bento_info)
+        pkg = PackageDescription.from_string(bento_info)
+        self.assertTrue("UnityExcludes" in static_representation(pkg))
+
     def _static_representation(self, bento_info):
         r_pkg = PackageDescription.from_string(bento_info)
         # We recompute pkg to avoid dealing with stylistic difference between
@@ -0,0 +1,10 @@
+# _lextab.py. This file automatically created by PLY (version 3.3). Don't edit!
+_tabversion   = '3.3'
+_lextokens    = {'COLON': 1, 'WS': 1, 'WORD': 1, 'NEWLINE': 1, 'STRING': 1, 'MULTILINES_STRING': 1, 'BLOCK_MULTILINES_STRING': 1, 'COMMA': 1, 'INDENT': 1, 'DEDENT': 1, 'LPAR': 1, 'RPAR': 1, 'BACKSLASH': 1, 'AUTHOR_EMAIL_ID': 1, 'COMPILED_LIBRARY_ID': 1, 'CONFIG_PY_ID': 1, 'DATAFILES_ID': 1, 'DEFAULT_ID': 1, 'DESCRIPTION_FROM_FILE_ID': 1, 'DOWNLOAD_URL_ID': 1, 'EXECUTABLE_ID': 1, 'FLAG_ID': 1, 'PATH_ID': 1, 'FUNCTION_ID': 1, 'LIBRARY_ID': 1, 'MAINTAINER_EMAIL_ID': 1, 'MODULE_ID': 1, 'NAME_ID': 1, 'SRCDIR_ID': 1, 'SUB_DIRECTORY_ID': 1, 'TARGET_ID': 1, 'UNITY_BUILD_ID': 1, 'URL_ID': 1, 'VERSION_ID': 1, 'AUTHOR_ID': 1, 'LICENSE_ID': 1, 'MAINTAINER_ID': 1, 'SUMMARY_ID': 1, 'BUILD_REQUIRES_ID': 1, 'CLASSIFIERS_ID': 1, 'INSTALL_REQUIRES_ID': 1, 'PLATFORMS_ID': 1, 'EXTENSION_ID': 1, 'EXTRA_SOURCE_FILES_ID': 1, 'FILES_ID': 1, 'HOOK_FILE_ID': 1, 'INCLUDE_DIRS_ID': 1, 'KEYWORDS_ID': 1, 'META_TEMPLATE_FILE_ID': 1, 'META_TEMPLATE_FILES_ID': 1, 'MODULES_ID': 1, 'PACKAGES_ID': 1, 'RECURSE_ID': 1, 'SOURCES_ID': 1, 'UNITY_EXCLUDES_ID': 1, 'USE_BACKENDS_ID': 1, 'DESCRIPTION_ID': 1, 'IF': 1, 'ELSE': 1, 'TRUE': 1, 'FALSE': 1, 'NOT_OP': 1, 'FLAG_OP': 1, 'OS_OP': 1}
+_lexreflags   = 40
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive', 'insidestring': 'exclusive', 'insideword': 'exclusive', 'insidemstring': 'exclusive', 'insidemstringnotcontinued': 'exclusive', 'insidewcommalistfirstline': 'inclusive', 'insidewcommalist': 'inclusive', 'insidescommalistfirstline': 'exclusive', 'insidescommalist': 'exclusive'}
+_lexstatere   = {'INITIAL': [('(?P<t_NEWLINE>(\\n|\\r\\n))|(?P<t_BACKSLASH>\\\\)|(?P<t_TAB>\\t)|(?P<t_COLON>:)|(?P<t_FIELD>\\w+(?=\\s*:))|(?P<t_COMMENT>[ ]*\\#[^\\r\\n]*)|(?P<t_WORD>[^\\#^\\s\\\\\\(\\)]+)|(?P<t_begin_inside_word>start_insideword)|(?P<t_end_inside_word>start_insideword)|(?P<t_begin_insidestring>start_insidestring)|(?P<t_end_insidestring>end_insidestring)|(?P<t_begin_insidemstring>start_insidemstring)|(?P<t_end_insidemstring>end_insidemstring)|(?P<t_begin_inside_mstringnotcontinued>start_inside_mstringnotcontinued)|(?P<t_end_inside_mstringnotcontinued>end_inside_mstringnotcontinued)|(?P<t_begin_inside_wcommalist>start_inside_wcommalist)|(?P<t_end_inside_wcommalist>end_inside_wcommalist)|(?P<t_begin_inside_wcommalistfirstline>start_inside_wcommalistfirstline)|(?P<t_end_inside_wcommalistfirstline>end_inside_wcommalistfirstline)|(?P<t_begin_inside_scommalist>start_inside_commalistw)|(?P<t_end_inside_scommalist>end_inside_commalistw)|(?P<t_begin_inside_scommalistfirstline>start_inside_scommalistfirstline)|(?P<t_end_inside_scommalistfirstline>end_inside_scommalistfirstline)|(?P<t_WS> [ ]+)|(?P<t_LPAR>\\()|(?P<t_RPAR>\\))', [None, ('t_NEWLINE', 'NEWLINE'), None, ('t_BACKSLASH', 'BACKSLASH'), ('t_TAB', 'TAB'), ('t_COLON', 'COLON'), ('t_FIELD', 'FIELD'), ('t_COMMENT', 'COMMENT'), ('t_WORD', 'WORD'), ('t_begin_inside_word', 'begin_inside_word'), ('t_end_inside_word', 'end_inside_word'), ('t_begin_insidestring', 'begin_insidestring'), ('t_end_insidestring', 'end_insidestring'), ('t_begin_insidemstring', 'begin_insidemstring'), ('t_end_insidemstring', 'end_insidemstring'), ('t_begin_inside_mstringnotcontinued', 'begin_inside_mstringnotcontinued'), ('t_end_inside_mstringnotcontinued', 'end_inside_mstringnotcontinued'), ('t_begin_inside_wcommalist', 'begin_inside_wcommalist'), ('t_end_inside_wcommalist', 'end_inside_wcommalist'), ('t_begin_inside_wcommalistfirstline', 'begin_inside_wcommalistfirstline'), ('t_end_inside_wcommalistfirstline', 'end_inside_wcommalistfirstline'), ('t_begin_inside_scommalist', 'begin_inside_scommalist'), ('t_end_inside_scommalist', 'end_inside_scommalist'), ('t_begin_inside_scommalistfirstline', 'begin_inside_scommalistfirstline'), ('t_end_inside_scommalistfirstline', 'end_inside_scommalistfirstline'), (None, 'WS'), (None, 'LPAR'), (None, 'RPAR')])], 'insidestring': [('(?P<t_insidestring_newline>(\\n|\\r\\n))|(?P<t_insidestring_COLON>:)|(?P<t_insidestring_WS> [ ]+)|(?P<t_insidestring_STRING>[^\\\\\\r\\n]+)', [None, ('t_insidestring_newline', 'newline'), None, ('t_insidestring_COLON', 'COLON'), ('t_insidestring_WS', 'WS'), ('t_insidestring_STRING', 'STRING')])], 'insideword': [('(?P<t_insideword_COMMENT>[ ]*\\#[^\\r\\n]*)|(?P<t_insideword_NEWLINE>(\\n|\\r\\n))|(?P<t_insideword_COLON>:)|(?P<t_insideword_WS> [ ]+)|(?P<t_insideword_WORD>[^\\#^\\s\\\\\\(\\)]+)', [None, ('t_insideword_COMMENT', 'COMMENT'), ('t_insideword_NEWLINE', 'NEWLINE'), None, ('t_insideword_COLON', 'COLON'), ('t_insideword_WS', 'WS'), ('t_insideword_WORD', 'WORD')])], 'insidemstring': [('(?P<t_insidemstring_COLON>:(?=.*\\S+.*))|(?P<t_insidemstring_COLON_NO_CONTINUED>:(?!.*\\S.*))|(?P<t_insidemstring_WS>[ ]+)|(?P<t_insidemstring_NEWLINE>(\\n|\\r\\n))|(?P<t_insidemstring_MULTILINES_STRING>.+((\\n[ ]+.+$)|(\\n^[ ]*$))*)', [None, ('t_insidemstring_COLON', 'COLON'), ('t_insidemstring_COLON_NO_CONTINUED', 'COLON_NO_CONTINUED'), ('t_insidemstring_WS', 'WS'), ('t_insidemstring_NEWLINE', 'NEWLINE'), None, ('t_insidemstring_MULTILINES_STRING', 'MULTILINES_STRING')])], 'insidemstringnotcontinued': [('(?P<t_insidemstringnotcontinued_NEWLINE>(\\n|\\r\\n))|(?P<t_insidemstringnotcontinued_WS> [ ]+)|(?P<t_insidemstringnotcontinued_BLOCK_MULTILINES_STRING>.+((\\n[ ]+.+$)|(\\n^[ ]*$))*)', [None, ('t_insidemstringnotcontinued_NEWLINE', 'NEWLINE'), None, ('t_insidemstringnotcontinued_WS', 'WS'), ('t_insidemstringnotcontinued_BLOCK_MULTILINES_STRING', 'BLOCK_MULTILINES_STRING')])], 'insidewcommalistfirstline': [('(?P<t_insidewcommalistfirstline_COLON>:)|(?P<t_insidewcommalistfirstline_WS> [ ]+)|(?P<t_insidewcommalistfirstline_WORD>[^,\\#^\\s\\\\\\(\\)]+(?=,))|(?P<t_insidewcommalistfirstline_WORD_STOP>[^\\#,\\s\\\\\\(\\)]+(?!,))|(?P<t_insidewcommalistfirstline_NEWLINE>(\\n|\\r\\n))|(?P<t_insidewcommalistfirstline_COMMA>,)', [None, ('t_insidewcommalistfirstline_COLON', 'COLON'), ('t_insidewcommalistfirstline_WS', 'WS'), ('t_insidewcommalistfirstline_WORD', 'WORD'), ('t_insidewcommalistfirstline_WORD_STOP', 'WORD_STOP'), ('t_insidewcommalistfirstline_NEWLINE', 'NEWLINE'), None, ('t_insidewcommalistfirstline_COMMA', 'COMMA')]), ('(?P<t_NEWLINE>(\\n|\\r\\n))|(?P<t_BACKSLASH>\\\\)|(?P<t_TAB>\\t)|(?P<t_COLON>:)|(?P<t_FIELD>\\w+(?=\\s*:))|(?P<t_COMMENT>[ ]*\\#[^\\r\\n]*)|(?P<t_WORD>[^\\#^\\s\\\\\\(\\)]+)|(?P<t_begin_inside_word>start_insideword)|(?P<t_end_inside_word>start_insideword)|(?P<t_begin_insidestring>start_insidestring)|(?P<t_end_insidestring>end_insidestring)|(?P<t_begin_insidemstring>start_insidemstring)|(?P<t_end_insidemstring>end_insidemstring)|(?P<t_begin_inside_mstringnotcontinued>start_inside_mstringnotcontinued)|(?P<t_end_inside_mstringnotcontinued>end_inside_mstringnotcontinued)|(?P<t_begin_inside_wcommalist>start_inside_wcommalist)|(?P<t_end_inside_wcommalist>end_inside_wcommalist)|(?P<t_begin_inside_wcommalistfirstline>start_inside_wcommalistfirstline)|(?P<t_end_inside_wcommalistfirstline>end_inside_wcommalistfirstline)|(?P<t_begin_inside_scommalist>start_inside_commalistw)|(?P<t_end_inside_scommalist>end_inside_commalistw)|(?P<t_begin_inside_scommalistfirstline>start_inside_scommalistfirstline)|(?P<t_end_inside_scommalistfirstline>end_inside_scommalistfirstline)|(?P<t_WS> [ ]+)|(?P<t_LPAR>\\()|(?P<t_RPAR>\\))', [None, ('t_NEWLINE', 'NEWLINE'), None, ('t_BACKSLASH', 'BACKSLASH'), ('t_TAB', 'TAB'), ('t_COLON', 'COLON'), ('t_FIELD', 'FIELD'), ('t_COMMENT', 'COMMENT'), ('t_WORD', 'WORD'), ('t_begin_inside_word', 'begin_inside_word'), ('t_end_inside_word', 'end_inside_word'), ('t_begin_insidestring', 'begin_insidestring'), ('t_end_insidestring', 'end_insidestring'), ('t_begin_insidemstring', 'begin_insidemstring'), ('t_end_insidemstring', 'end_insidemstring'), ('t_begin_inside_mstringnotcontinued', 'begin_inside_mstringnotcontinued'), ('t_end_inside_mstringnotcontinued', 'end_inside_mstringnotcontinued'), ('t_begin_inside_wcommalist', 'begin_inside_wcommalist'), ('t_end_inside_wcommalist', 'end_inside_wcommalist'), ('t_begin_inside_wcommalistfirstline', 'begin_inside_wcommalistfirstline'), ('t_end_inside_wcommalistfirstline', 'end_inside_wcommalistfirstline'), ('t_begin_inside_scommalist', 'begin_inside_scommalist'), ('t_end_inside_scommalist', 'end_inside_scommalist'), ('t_begin_inside_scommalistfirstline', 'begin_inside_scommalistfirstline'), ('t_end_inside_scommalistfirstline', 'end_inside_scommalistfirstline'), (None, 'WS'), (None, 'LPAR'), (None, 'RPAR')])], 'insidewcommalist': [('(?P<t_insidewcommalist_WORD>[^,\\s]+(?=,))|(?P<t_insidewcommalist_WORD_STOP>[^,\\s]+(?!,))|(?P<t_insidewcommalist_NEWLINE>(\\n|\\r\\n))|(?P<t_insidewcommalist_WS> [ ]+)|(?P<t_insidewcommalist_COMMA>,)', [None, ('t_insidewcommalist_WORD', 'WORD'), ('t_insidewcommalist_WORD_STOP', 'WORD_STOP'), ('t_insidewcommalist_NEWLINE', 'NEWLINE'), None, ('t_insidewcommalist_WS', 'WS'), ('t_insidewcommalist_COMMA', 'COMMA')]), ('(?P<t_NEWLINE>(\\n|\\r\\n))|(?P<t_BACKSLASH>\\\\)|(?P<t_TAB>\\t)|(?P<t_COLON>:)|(?P<t_FIELD>\\w+(?=\\s*:))|(?P<t_COMMENT>[ ]*\\#[^\\r\\n]*)|(?P<t_WORD>[^\\#^\\s\\\\\\(\\)]+)|(?P<t_begin_inside_word>start_insideword)|(?P<t_end_inside_word>start_insideword)|(?P<t_begin_insidestring>start_insidestring)|(?P<t_end_insidestring>end_insidestring)|(?P<t_begin_insidemstring>start_insidemstring)|(?P<t_end_insidemstring>end_insidemstring)|(?P<t_begin_inside_mstringnotcontinued>start_inside_mstringnotcontinued)|(?P<t_end_inside_mstringnotcontinued>end_inside_mstringnotcontinued)|(?P<t_begin_inside_wcommalist>start_inside_wcommalist)|(?P<t_end_inside_wcommalist>end_inside_wcommalist)|(?P<t_begin_inside_wcommalistfirstline>start_inside_wcommalistfirstline)|(?P<t_end_inside_wcommalistfirstline>end_inside_wcommalistfirstline)|(?P<t_begin_inside_scommalist>start_inside_commalistw)|(?P<t_end_inside_scommalist>end_inside_commalistw)|(?P<t_begin_inside_scommalistfirstline>start_inside_scommalistfirstline)|(?P<t_end_inside_scommalistfirstline>end_inside_scommalistfirstline)|(?P<t_WS> [ ]+)|(?P<t_LPAR>\\()|(?P<t_RPAR>\\))', [None, ('t_NEWLINE', 'NEWLINE'), None, ('t_BACKSLASH', 'BACKSLASH'), ('t_TAB', 'TAB'), ('t_COLON', 'COLON'), ('t_FIELD', 'FIELD'), ('t_COMMENT', 'COMMENT'), ('t_WORD', 'WORD'), ('t_begin_inside_word', 'begin_inside_word'), ('t_end_inside_word', 'end_inside_word'), ('t_begin_insidestring', 'begin_insidestring'), ('t_end_insidestring', 'end_insidestring'), ('t_begin_insidemstring', 'begin_insidemstring'), ('t_end_insidemstring', 'end_insidemstring'), ('t_begin_inside_mstringnotcontinued', 'begin_inside_mstringnotcontinued'), ('t_end_inside_mstringnotcontinued', 'end_inside_mstringnotcontinued'), ('t_begin_inside_wcommalist', 'begin_inside_wcommalist'), ('t_end_inside_wcommalist', 'end_inside_wcommalist'), ('t_begin_inside_wcommalistfirstline', 'begin_inside_wcommalistfirstline'), ('t_end_inside_wcommalistfirstline', 'end_inside_wcommalistfirstline'), ('t_begin_inside_scommalist', 'begin_inside_scommalist'), ('t_end_inside_scommalist', 'end_inside_scommalist'), ('t_begin_inside_scommalistfirstline', 'begin_inside_scommalistfirstline'), ('t_end_inside_scommalistfirstline', 'end_inside_scommalistfirstline'), (None, 'WS'), (None, 'LPAR'), (None, 'RPAR')])], 'insidescommalistfirstline': [('(?P<t_insidescommalistfirstline_COLON>:)|(?P<t_insidescommalistfirstline_WS> [ ]+)|(?P<t_insidescommalistfirstline_STRING>[^,\\n(\\r\\n)]+(?=,))|(?P<t_insidescommalistfirstline_STRING_STOP>[^,\\n(\\r\\n)]+(?!,))|(?P<t_insidescommalistfirstline_NEWLINE>(\\n|\\r\\n))|(?P<t_insidescommalistfirstline_COMMA>,)', [None, ('t_insidescommalistfirstline_COLON', 'COLON'), ('t_insidescommalistfirstline_WS', 'WS'), ('t_insidescommalistfirstline_STRING', 'STRING'), ('t_insidescommalistfirstline_STRING_STOP', 'STRING_STOP'), ('t_insidescommalistfirstline_NEWLINE', 'NEWLINE'), None, ('t_insidescommalistfirstline_COMMA', 'COMMA')])], 'insidescommalist': [('(?P<t_insidescommalist_WS> [ ]+)|(?P<t_insidescommalist_STRING>[^,\\n(\\r\\n)]+(?=,))|(?P<t_insidescommalist_STRING_STOP>[^,\\n(\\r\\n)]+(?!,))|(?P<t_insidescommalist_NEWLINE>(\\n|\\r\\n))|(?P<t_insidescommalist_COMMA>,)', [None, ('t_insidescommalist_WS', 'WS'), ('t_insidescommalist_STRING', 'STRING'), ('t_insidescommalist_STRING_STOP', 'STRING_STOP'), ('t_insidescommalist_NEWLINE', 'NEWLINE'), None, ('t_insidescommalist_COMMA', 'COMMA')])]}
+_lexstateignore = {'INITIAL': '', 'insidewcommalistfirstline': '', 'insidewcommalist': ''}
+_lexstateerrorf = {'INITIAL': 't_error', 'insidemstring': 't_insidemstring_error', 'insidemstringnotcontinued': 't_insidemstringnotcontinued_error', 'insidescommalist': 't_insidescommalist_error', 'insidescommalistfirstline': 't_insidescommalistfirstline_error', 'insidestring': 't_insidestring_error', 'insidewcommalist': 't_insidewcommalist_error', 'insidewcommalistfirstline': 't_insidewcommalistfirstline_error', 'insideword': 't_insideword_error'}
+_bento_stamp = 'fd9f6ad46582863a5ec3a4963bdc6514'
@@ -0,0 +1,374 @@
+"""Hand-written tokenizer for bento.info files.
+
+FastBentoLexer produces the same token stream as BentoLexer, without going
+through ply.lex: the data are scanned in a single pass with one regular
+expression per lexer state, and the escaping, indentation and filtering
+stages are done on plain tuples in two loops instead of a chain of token
+generators. Only the tokens seen by the parser are turned into LexToken
+instances.
+"""
+import re
+
+from ply.lex \
+    import \
+        LexToken
+
+from bento.errors \
+    import \
+        ParseError, InternalBentoError
+from bento.parser.lexer \
+    import \
+        keywords_dict, keyword_misc, line_keywords, multilines_keywords, \
+        comma_line_keywords, comma_word_keywords, remove_lines_indent
+from bento.parser.utils \
+    import \
+        count_lines
+
+import six
+
+_NEWLINE = r"\n|\r\n"
+_WS = r"[ ]+"
+_COMMENT = r"[ ]*\#[^\r\n]*"
+_WORD = r"[^\#^\s\\\(\)]+"
+_MULTILINES_STRING = r".+(?:(?:\n[ ]+.+$)|(?:\n^[ ]*$))*"
+_SCOMMA_STRING = r"[^,\n(\r\n)]+"
+
+# Rules of each lexer state, tried in order (same order as the ply rules in
+# bento.parser.lexer). Each rule is (regex, token type, action, next state):
+# action is None for rules simply emitting a token, next state None if the
+# state does not change.
+_INITIAL_RULES = [
+    (_NEWLINE, "NEWLINE", "newline", None),
+    (r"\\", "BACKSLASH", None, None),
+    (r"\t", None, "tab", None),
+    (r":", "COLON", None, None),
+    (r"\w+(?=\s*:)", "FIELD", "field", None),
+    (_COMMENT, None, "comment", None),
+    (_WORD, "WORD", "keyword", None),
+    (_WS, "WS", None, None),
+    (r"\(", "LPAR", None, None),
+    (r"\)", "RPAR", None, None),
+]
+
+_STATES_RULES = {
+    "INITIAL": (_INITIAL_RULES, False,
+                "Illegal character '%s'"),
+    "insideword": ([
+        (_COMMENT, None, "comment", None),
+        (_NEWLINE, "NEWLINE", "newline", "INITIAL"),
+        (r":", "COLON", None, None),
+        (_WS, "WS", None, None),
+        (_WORD, "WORD", None, None),
+        ], False, "Illegal character (inside word state) '%s'"),
+    "insidestring": ([
+        (_NEWLINE, "NEWLINE", "newline", "INITIAL"),
+        (r":", "COLON", None, None),
+        (_WS, "WS", None, None),
+        (r"[^\\\r\n]+", "STRING", None, "INITIAL"),
+        ], False, "Illegal character (insidestring state) '%s'"),
+    "insidemstring": ([
+        (r":(?=.*\S+.*)", "COLON", None, None),
+        (r":(?!.*\S.*)", "COLON", None, "insidemstringnotcontinued"),
+        (_WS, "WS", None, None),
+        (_NEWLINE, "NEWLINE", "newline", None),
+        (_MULTILINES_STRING, "MULTILINES_STRING", "multilines", "INITIAL"),
+        ], False, "Illegal character (insidemstring state) '%s'"),
+    "insidemstringnotcontinued": ([
+        # ply rule does not count lines here
+        (_NEWLINE, "NEWLINE", None, None),
+        (_WS, "WS", None, None),
+        (_MULTILINES_STRING, "BLOCK_MULTILINES_STRING", None, "INITIAL"),
+        ], False, "Illegal character (inside_mstringnotcontinued state) '%s'"),
+    "insidewcommalistfirstline": ([
+        (r":", "COLON", None, None),
+        (_WS, "WS", None, None),
+        (r"[^,\#^\s\\\(\)]+(?=,)", "WORD", None, "insidewcommalist"),
+        (r"[^\#,\s\\\(\)]+(?!,)", "WORD", None, "INITIAL"),
+        (_NEWLINE, "NEWLINE", "newline", None),
+        (r",", "COMMA", None, None),
+        ], True, "Illegal character (inside wcommalistfirstline state) '%s'"),
+    "insidewcommalist": ([
+        (r"[^,\s]+(?=,)", "WORD", None, None),
+        (r"[^,\s]+(?!,)", "WORD", None, "INITIAL"),
+        (_NEWLINE, "NEWLINE", "newline", None),
+        (_WS, "WS", None, None),
+        (r",", "COMMA", None, None),
+        ], True, "Illegal character (inside wcommalist state) '%s'"),
+    "insidescommalistfirstline": ([
+        (r":", "COLON", None, None),
+        (_WS, "WS", None, None),
+        (_SCOMMA_STRING + r"(?=,)", "STRING", None, "insidescommalist"),
+        (_SCOMMA_STRING + r"(?!,)", "STRING", None, "INITIAL"),
+        (_NEWLINE, "NEWLINE", "newline", None),
+        (r",", "COMMA", None, None),
+        ], False, "Illegal character (inside scommalistfirstline state) '%s'"),
+    "insidescommalist": ([
+        (_WS, "WS", None, None),
+        (_SCOMMA_STRING + r"(?=,)", "STRING", None, None),
+        (_SCOMMA_STRING + r"(?!,)", "STRING", None, "INITIAL"),
+        (_NEWLINE, "NEWLINE", "newline", None),
+        (r",", "COMMA", None, None),
+        ], False, "Illegal character (inside scommalist state) '%s'"),
+}
+
+def _compile_states():
+    states = {}
+    for name, (rules, inclusive, error_msg) in _STATES_RULES.items():
+        if inclusive:
+            rules = rules + _INITIAL_RULES
+        regex = re.compile("|".join(["(%s)" % r[0] for r in rules]),
+                           re.UNICODE | re.MULTILINE)
+        # Group i of the regex matches the rule i - 1
+        actions = [None] + [r[1:] for r in rules]
+        states[name] = (regex.match, actions, error_msg)
+    return states
+
+_STATES = _compile_states()
+
+# Fast path for the items of word comma lists (Sources, Modules, etc...),
+# matching in one go what the insidewcommalist rules match as COMMA, NEWLINE,
+# WS and WORD tokens
+_WCOMMALIST_ITEM = re.compile(r",(\n|\r\n)?([ ]+)?([^,\s]+)(?=,)", re.UNICODE).match
+
+class FastBentoLexer(object):
+    """Drop-in replacement for BentoLexer."""
+    def __init__(self):
+        self.lexdata = None
+        self.lineno = 1
+        self.stream = None
+
+    def input(self, data):
+        self.lexdata = data
+        self.lineno = 1
+        self.stream = self._token_stream(data)
+
+    def __iter__(self):
+        return iter(self.token, None)
+
+    def token(self):
+        try:
+            return six.advance_iterator(self.stream)
+        except StopIteration:
+            pass
+
+    def _token_stream(self, data):
+        # Errors are only raised once tokens are requested, as for BentoLexer
+        tokens, error = self._scan(data)
+        if "\\" in data:
+            tokens = self._merge_escaped(tokens, error is None)
+        tokens = self._post_process(tokens)
+        if error is not None:
+            # Errors in the tokens preceding the scanning error come first
+            raise error
+        for t in tokens:
+            yield t
+
+    def _new_token(self, tp, value, lineno, lexpos):
+        t = LexToken()
+        t.type = tp
+        t.value = value
+        t.lineno = lineno
+        t.lexpos = lexpos
+        t.lexer = self
+        return t
+
+    def _scan(self, data):
+        """Return the list of raw tokens (type, value, lineno, lexpos) of the
+        given data, as generated by the ply rules of BentoLexer, and the
+        scanning error if any (None otherwise)."""
+        tokens = []
+        append = tokens.append
+        wcommalist_item = _WCOMMALIST_ITEM
+
+        match, actions, error_msg = _STATES["INITIAL"]
+        pos = 0
+        lineno = 1
+        n = len(data)
+        while pos < n:
+            m = match(data, pos)
+            if m is None:
+                self.lineno = lineno
+                t = self._new_token("error", data[pos:], lineno, pos)
+                return tokens, ParseError(error_msg % data[pos], t)
+            tp, action, state = actions[m.lastindex]
+            value = m.group()
+
+            if action is None:
+                append((tp, value, lineno, pos))
+            elif action == "newline":
+                append((tp, value, lineno, pos))
+                lineno += len(value)
+            elif action == "keyword":
+                append((keyword_misc.get(value, tp), value, lineno, pos))
+            elif action == "field":
+                tp = keywords_dict.get(value)
+                if tp is None:
+                    self.lineno = lineno
+                    t = self._new_token("FIELD", value, lineno, pos)
+                    return tokens, ParseError("Unrecognized keyword: %r" % (value,), t)
+                append((tp, value, lineno, pos))
+                if tp in line_keywords:
+                    state = "insidestring"
+                elif tp in multilines_keywords:
+                    # Only top Description accepts multiline strings
+                    if pos >= 1 and data[pos-1] != "\n":
+                        state = "insidestring"
+                    else:
+                        state = "insidemstring"
+                elif tp in comma_line_keywords:
+                    state = "insidescommalistfirstline"
+                elif tp in comma_word_keywords:
+                    state = "insidewcommalistfirstline"
+                else:
+                    state = "insideword"
+            elif action == "comment":
+                pass
+            elif action == "multilines":
+                append((tp, value, lineno, pos))
+                lineno += count_lines(value) - 1
+            elif action == "tab":
+                self.lineno = lineno
+                return tokens, SyntaxError("Tab not supported")
+            else:
+                raise InternalBentoError("Unknown lexer action %r" % action)
+            pos = m.end()
+
+            if state is not None:
+                match, actions, error_msg = _STATES[state]
+                if state == "insidewcommalist":
+                    m = wcommalist_item(data, pos)
+                    while m is not None:
+                        newline, ws, word = m.groups()
+                        append(("COMMA", ",", lineno, pos))
+                        pos += 1
+                        if newline is not None:
+                            append(("NEWLINE", newline, lineno, pos))
+                            lineno += len(newline)
+                            pos += len(newline)
+                        if ws is not None:
+                            append(("WS", ws, lineno, pos))
+                            pos += len(ws)
+                        append(("WORD", word, lineno, pos))
+                        pos += len(word)
+                        m = wcommalist_item(data, pos)
+
+        self.lineno = lineno
+        return tokens, None
+
+    def _merge_escaped(self, tokens, complete=True):
+        """Merge escaped tokens (i.e. following a backslash) with the
+        surrounding words (see detect_escaped and merge_escaped).
+
+        If complete is False, tokens is the beginning of the token stream
+        only."""
+        merged = []
+        append = merged.append
+        queue = []
+
+        i = 0
+        n = len(tokens)
+        while i < n:
+            t = tokens[i]
+            i += 1
+            if t[0] == "BACKSLASH":
+                if i == n:
+                    if not complete:
+                        break
+                    raise SyntaxError("EOF while escaping token %r (line %d)" %
+                                      (t[1], t[2]-1))
+                t = tokens[i]
+                i += 1
+                queue.append(t)
+            elif t[0] == "WORD":
+                next_escaped = i < n and tokens[i][0] == "BACKSLASH"
+                if queue:
+                    queue.append(t)
+                    if not next_escaped:
+                        append(("WORD", "".join([q[1] for q in queue]), t[2], t[3]))
+                        queue = []
+                elif next_escaped:
+                    queue.append(t)
+                else:
+                    append(t)
+            else:
+                if queue:
+                    q = queue[-1]
+                    append(("WORD", "".join([q[1] for q in queue]), q[2], q[3]))
+                    queue = []
+                append(t)
+        if queue:
+            q = queue[-1]
+            append(("WORD", "".join([q[1] for q in queue]), q[2], q[3]))
+        return merged
+
+    def _post_process(self, tokens):
+        """Generate INDENT/DEDENT tokens, remove WS and NEWLINE tokens and
+        dedent multiline strings (see indent_generator, filter_ws_and_newline
+        and post_process_string)."""
+        ret = []
+        append = ret.append
+        new_token = self._new_token
+
+        stack = [0]
+        former = "NEWLINE"
+        last = None
+        i = 0
+        n = len(tokens)
+        while i < n:
+            t = last = tokens[i]
+            i += 1
+            if former == "NEWLINE":
+                if t[0] == "WS":
+                    indent = len(t[1])
+                else:
+                    indent = 0
+
+                if indent == stack[0]:
+                    if indent > 0:
+                        # Skip the indentation
+                        if i == n:
+                            return ret
+                        t = last = tokens[i]
+                        i += 1
+                elif indent > stack[0]:
+                    stack.insert(0, indent)
+                    former = "INDENT"
+                    append(new_token("INDENT", indent, t[2], t[3]))
+                    continue
+                else:
+                    if not indent in stack:
+                        raise ValueError("Wrong indent at line %d" % t[2])
+                    while stack[0] > indent:
+                        append(new_token("DEDENT", stack.pop(0), t[2], t[3]))
+                    if stack[0] > 0:
+                        if i == n:
+                            return ret
+                        t = tokens[i]
+                        i += 1
+
+            tp, value, lineno, lexpos = t
+            former = tp
+            if tp == "NEWLINE" or tp == "WS":
+                continue
+            elif tp == "BLOCK_MULTILINES_STRING":
+                if not ret or ret[-1].type != "INDENT":
+                    raise InternalBentoError(
+                            "Error while post processing block line: %s -> %s" \
+                            % (ret and ret[-1] or None, new_token(*t)))
+                value = remove_lines_indent(value, ret[-1].value)
+                tp = "MULTILINES_STRING"
+            elif tp == "MULTILINES_STRING":
+                value = remove_lines_indent(value)
+            tok = LexToken()
+            tok.type = tp
+            tok.value = value
+            tok.lineno = lineno
+            tok.lexpos = lexpos
+            tok.lexer = self
+            append(tok)
+
+        # Generate additional DEDENT so that the number of INDENT/DEDENT always
+        # match
+        while len(stack) > 1:
+            append(new_token("DEDENT", stack.pop(0), last[2], last[3]))
+        return ret
@@ -2,7 +2,7 @@ import re
 
 from ply.lex \
     import \
-        lex, LexToken
+        lex, LexToken, Lexer
 
 from bento.errors \
     import \
@@ -10,6 +10,9 @@ from bento.errors \
 from bento.parser.utils \
     import \
         Peeker, BackwardGenerator, count_lines
+from bento.parser.tables \
+    import \
+        load_table, LEXTAB, LEX_REFLAGS
 
 import six
 
@@ -32,6 +35,7 @@ word_fields = [
     ("SRCDIR_ID", r"SourceDir"),
     ("SUB_DIRECTORY_ID", r"SubDirectory"),
     ("TARGET_ID", r"TargetDir"),
+    ("UNITY_BUILD_ID", r"UnityBuild"),
     ("URL_ID", r"Url"),
     ("VERSION_ID", r"Version"),
 ]
@@ -63,6 +67,7 @@ comma_word_fields = [
     ("PACKAGES_ID", r"Packages"),
     ("RECURSE_ID", r"Recurse"),
     ("SOURCES_ID", r"Sources"),
+    ("UNITY_EXCLUDES_ID", r"UnityExcludes"),
     ("USE_BACKENDS_ID", r"UseBackends"),
 ]
 
@@ -670,9 +675,25 @@ class _Dummy(object):
 
 EOF = _Dummy()
 
+def _build_lexer():
+    lextab = load_table(LEXTAB)
+    if lextab is not None:
+        lexer = Lexer()
+        lexer.readtab(lextab, globals())
+        return lexer
+    else:
+        # Missing or out of date tables: compute them in memory
+        return lex(reflags=LEX_REFLAGS, debug=0, optimize=0, nowarn=0)
+
+# Pristine ply lexer, cloned by each BentoLexer instance
+_LEXER = None
+
 class BentoLexer(object):
-    def __init__(self, optimize=False):
-        self.lexer = lex(reflags=re.UNICODE|re.MULTILINE, debug=0, optimize=optimize, nowarn=0, lextab='lextab')
+    def __init__(self):
+        global _LEXER
+        if _LEXER is None:
+            _LEXER = _build_lexer()
+        self.lexer = _LEXER.clone()
 
     def input(self, data):
         self.lexer.input(data)
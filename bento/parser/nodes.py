@@ -1,12 +1,10 @@
 import sys
 
-from six.moves import cPickle
-
-def __copy(d):
-    # Faster than deepcopy - ideally remove the need for deepcopy altogether
-    return cPickle.loads(cPickle.dumps(d, protocol=2))
-
 class Node(object):
+    # Bento descriptions with long lists of sources or files create a lot of
+    # nodes: no per-instance __dict__
+    __slots__ = ("type", "children", "value")
+
     def __init__(self, tp, children=None, value=None):
         self.type = tp
         if children:
@@ -15,6 +13,13 @@ class Node(object):
             self.children = []
         self.value = value
 
+    # Needed to pickle instances with protocols < 2
+    def __getstate__(self):
+        return (self.type, self.children, self.value)
+
+    def __setstate__(self, state):
+        self.type, self.children, self.value = state
+
     def __str__(self):
         return "Node(%r)" % self.type
 
@@ -55,6 +60,9 @@ def ast_walk(root, dispatcher, debug=False):
     
     If one node type does not have any function defined for it, it simply
     returns the node unchanged.
+
+    The tree is walked depth-first with an explicit stack, so arbitrarily deep
+    trees do not hit the recursion limit. The given tree is not modified.
     
     Parameters
     ----------
@@ -63,21 +71,39 @@ def ast_walk(root, dispatcher, debug=False):
     dispatcher : Dispatcher
         defines the action for each node type.
     """
-    def _walker(par):
-        children = []
-        for c in par.children:
-            children.append(_walker(c))
+    actions = dispatcher.dispatch_table()
+
+    # Each stack item is a node and whether its children have been walked
+    # already. Results of the walked children are pushed on the results
+    # stack, in order.
+    stack = [(root, False)]
+    results = []
+    while stack:
+        par, visited = stack.pop()
+        if not visited:
+            stack.append((par, True))
+            for c in reversed(par.children):
+                stack.append((c, False))
+            continue
 
-        par.children = [c for c in children if c is not None]
+        n = len(par.children)
+        if n > 0:
+            children = [c for c in results[-n:] if c is not None]
+            del results[-n:]
+        else:
+            children = []
+        # Handlers modify nodes (and list values) in place: work on a copy
+        # to keep the given tree intact, which is much cheaper than deep
+        # copying the whole tree beforehand
+        value = par.value
+        if type(value) is list:
+            value = value[:]
+        par = Node(par.type, children, value)
         try:
-            func = dispatcher.action_dict[par.type]
-            return func(par)
+            ret = actions[par.type](dispatcher, par)
         except KeyError:
             if debug:
                 print("no action for type %s" % par.type)
-            return par
-
-    # FIXME: we need to copy the dict because the dispatcher modify the dict in
-    # place ATM, and we call this often. This is very expensive, and should be
-    # removed as it has a huge cost in starting time (~30 % in hot case)
-    return _walker(__copy(root))
+            ret = par
+        results.append(ret)
+    return results[0]
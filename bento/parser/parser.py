@@ -1,24 +1,22 @@
-import sys
-import errno
-
-import os.path as op
-
 import ply.yacc
 
 import bento.parser.rules
 
 from bento._config \
     import \
-        _PICKLED_PARSETAB, _OPTIMIZE_LEX, _DEBUG_YACC
-from bento.utils.utils \
-    import \
-        extract_exception
+        _DEBUG_YACC, _LEXER
 from bento.errors \
     import \
-        InternalBentoError, BentoError, ParseError
+        BentoError, InternalBentoError, ParseError
 from bento.parser.lexer \
     import \
         BentoLexer, tokens as _tokens
+from bento.parser.fast_lexer \
+    import \
+        FastBentoLexer
+from bento.parser.tables \
+    import \
+        load_table, PARSETAB
 
 # XXX: is there a less ugly way to do this ?
 __GLOBALS = globals()
@@ -31,63 +29,50 @@ for k in dir(bento.parser.rules):
 # in the grammar.
 tokens = [t for t in _tokens if not t in ["WS", "NEWLINE", "BACKSLASH", "BLOCK_MULTILINES_STRING"]]
 
-def _has_parser_changed(picklefile):
-    # FIXME: private function to determine whether ply will need to write to
-    # the pickled grammar file. Highly implementation dependent.
-    from ply.yacc import PlyLogger, get_caller_module_dict, ParserReflect, YaccError, LRTable
-    errorlog = PlyLogger(sys.stderr)
+_LEXERS = {"fast": FastBentoLexer, "ply": BentoLexer}
 
-    pdict = get_caller_module_dict(2)
+def create_lexer(name=None):
+    """Create a new bento.info lexer.
 
-    # Collect parser information from the dictionary
-    pinfo = ParserReflect(pdict, log=errorlog)
-    pinfo.get_all()
-
-    if pinfo.error:
-        raise YaccError("Unable to build parser")
-
-    # Check signature against table files (if any)
-    signature = pinfo.signature()
-
-    # Read the tables
+    Parameters
+    ----------
+    name: str, None
+        "fast" for the hand-written tokenizer, "ply" for the ply-based lexer.
+        Both generate the same tokens. If None, the BENTO_LEXER environment
+        variable is used, and "ply" if not set.
+    """
+    if name is None:
+        name = _LEXER
     try:
-        lr = LRTable()
-        read_signature = lr.read_pickle(picklefile)
-        return read_signature != signature
-    except Exception:
-        return True
+        klass = _LEXERS[name]
+    except KeyError:
+        raise BentoError("Unknown lexer %r (available: %s)" % \
+                         (name, ", ".join(sorted(_LEXERS.keys()))))
+    return klass()
+
+def _build_parser():
+    parsetab = load_table(PARSETAB)
+    if parsetab is not None:
+        # Bypass ply.yacc.yacc, which always reflects the whole grammar to
+        # check the tables signature
+        lr = ply.yacc.LRTable()
+        lr.read_table(parsetab)
+        lr.bind_callables(globals())
+        return ply.yacc.LRParser(lr, p_error)
+    else:
+        # Missing or out of date tables: compute them in memory
+        return ply.yacc.yacc(start="stmt_list", debug=_DEBUG_YACC,
+                             tabmodule="bento.parser." + PARSETAB,
+                             write_tables=0)
 
 class Parser(object):
     def __init__(self, lexer=None):
         if lexer is None:
-            self.lexer = BentoLexer(optimize=_OPTIMIZE_LEX)
+            self.lexer = create_lexer()
         else:
             self.lexer = lexer
 
-        picklefile = _PICKLED_PARSETAB
-        if not op.exists(picklefile):
-            try:
-                fid = open(picklefile, "wb")
-                fid.close()
-            except IOError:
-                e = extract_exception()
-                raise BentoError("Could not write pickle file %r (original error was %r)" % (picklefile, e))
-        else:
-            try:
-                fid = open(_PICKLED_PARSETAB, "wb")
-                fid.close()
-            except IOError:
-                # In case of read-only support (no write access, zip import,
-                # etc...)
-                e = extract_exception()
-                if e.errno == errno.EACCES:
-                    if _has_parser_changed(_PICKLED_PARSETAB):
-                        raise BentoError("Cannot write new updated grammar to file %r" % _PICKLED_PARSETAB)
-                else:
-                    raise
-        self.parser = ply.yacc.yacc(start="stmt_list",
-                                picklefile=picklefile,
-                                debug=_DEBUG_YACC)
+        self.parser = _build_parser()
 
     def parse(self, data):
         res = self.parser.parse(data, lexer=self.lexer)
@@ -98,7 +83,7 @@ class Parser(object):
 
     def reset(self):
         # XXX: implements reset for lexer
-        self.lexer = BentoLexer(optimize=_OPTIMIZE_LEX)
+        self.lexer = self.lexer.__class__()
         # XXX: ply parser.reset method expects those attributes to
         # exist
         self.parser.statestack = []
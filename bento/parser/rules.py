@@ -401,6 +401,14 @@ def p_extension_include_dirs(p):
     """extension_field_stmt : INCLUDE_DIRS_ID COLON wcomma_list"""
     p[0] = Node("include_dirs", value=p[3].value)
 
+def p_extension_unity_build(p):
+    """extension_field_stmt : UNITY_BUILD_ID COLON WORD"""
+    p[0] = Node("unity_build", value=p[3])
+
+def p_extension_unity_excludes(p):
+    """extension_field_stmt : UNITY_EXCLUDES_ID COLON wcomma_list"""
+    p[0] = Node("unity_excludes", value=p[3].value)
+
 def p_compiled_library_stmt_content(p):
     """compiled_library_stmt : compiled_library_decl INDENT compiled_library_field_stmts DEDENT"""
     p[0] = Node("compiled_library", children=[p[1]])
@@ -0,0 +1,118 @@
+"""Precomputed lexer and parser tables.
+
+The PLY lexer and parser tables are generated once into the _lextab and
+_parsetab modules of this package, which are only imported at runtime: no
+grammar reflection nor any file write is needed to create a parser. To
+regenerate them after a change to the grammar, run::
+
+    python -m bento.parser.tables
+
+The table modules are stamped with a digest of the grammar definition sources
+and PLY version, and ignored (the tables being then computed in memory) if
+the stamp does not match.
+"""
+import os
+import re
+import sys
+import pkgutil
+
+try:
+    from hashlib import md5
+except ImportError:
+    from md5 import md5
+
+import ply.lex
+import ply.yacc
+
+LEXTAB = "_lextab"
+PARSETAB = "_parsetab"
+
+LEX_REFLAGS = re.UNICODE | re.MULTILINE
+
+# Modules defining the grammar
+_GRAMMAR_MODULES = ["lexer", "rules", "parser"]
+
+_STAMP = None
+
+def _compute_stamp():
+    m = md5()
+    m.update(("%s %s" % (ply.lex.__version__, ply.yacc.__tabversion__)).encode())
+    for name in _GRAMMAR_MODULES:
+        try:
+            data = pkgutil.get_data("bento.parser", name + ".py")
+        except (IOError, OSError):
+            data = None
+        if data is None:
+            return None
+        m.update(data)
+    return m.hexdigest()
+
+def grammar_stamp():
+    """Return the stamp of the current grammar, or None if the grammar sources
+    are not available (e.g. bytecode-only installation, in which case the
+    grammar cannot have changed since the tables were generated)."""
+    global _STAMP
+    if _STAMP is None:
+        _STAMP = _compute_stamp()
+    return _STAMP
+
+def load_table(name):
+    """Return the given table module if it exists and is up to date, None
+    otherwise."""
+    module_name = "bento.parser." + name
+    try:
+        __import__(module_name)
+    except ImportError:
+        return None
+    table = sys.modules[module_name]
+    stamp = grammar_stamp()
+    if stamp is not None and getattr(table, "_bento_stamp", None) != stamp:
+        return None
+    return table
+
+def write_tables(outputdir=None):
+    """Regenerate the lexer and parser table modules in outputdir (the
+    bento.parser package directory by default)."""
+    import bento.parser.lexer
+    import bento.parser.parser
+
+    if outputdir is None:
+        outputdir = os.path.dirname(os.path.abspath(__file__))
+    for name in [LEXTAB, PARSETAB]:
+        for ext in [".py", ".pyc", ".pyo"]:
+            filename = os.path.join(outputdir, name + ext)
+            if os.path.exists(filename):
+                os.remove(filename)
+
+    lexobj = ply.lex.lex(module=bento.parser.lexer, reflags=LEX_REFLAGS, optimize=0)
+    # The flags are written through repr, which is not a valid expression in
+    # the table module for python 3 RegexFlag
+    lexobj.lexreflags = int(lexobj.lexreflags)
+    lexobj.writetab(LEXTAB, outputdir)
+    ply.yacc.yacc(module=bento.parser.parser, start="stmt_list", debug=0,
+                  tabmodule=PARSETAB, outputdir=outputdir, write_tables=1)
+
+    stamp = _compute_stamp()
+    grammar_dir = os.path.dirname(os.path.abspath(bento.parser.parser.__file__))
+    for name in [LEXTAB, PARSETAB]:
+        filename = os.path.join(outputdir, name + ".py")
+        fid = open(filename, "r")
+        try:
+            data = fid.read()
+        finally:
+            fid.close()
+        # ply.yacc writes the path of the table module in its header, and
+        # the path of the grammar modules in the productions: only keep the
+        # file names, so that the tables do not depend on the machine
+        # generating them
+        data = data.replace("# %s\n" % filename, "# %s.py\n" % name, 1)
+        data = data.replace(repr(grammar_dir + os.sep)[:-1], "'")
+        fid = open(filename, "w")
+        try:
+            fid.write(data)
+            fid.write("_bento_stamp = %r\n" % stamp)
+        finally:
+            fid.close()
+
+if __name__ == "__main__":
+    write_tables()
@@ -0,0 +1,126 @@
+import os
+
+from bento.compat.api.moves \
+    import \
+        unittest
+from bento.errors \
+    import \
+        BentoError, ParseError
+from bento.utils.utils \
+    import \
+        extract_exception
+from bento.parser.lexer \
+    import \
+        BentoLexer
+from bento.parser.fast_lexer \
+    import \
+        FastBentoLexer
+from bento.parser.parser \
+    import \
+        Parser, create_lexer
+from bento.testing.benchmark \
+    import \
+        best_time, benchmarks_enabled
+
+import bento.parser.parser
+
+FUNCTIONALS = os.path.join(os.path.dirname(__file__), "functionals")
+
+def _make_info(n):
+    """Synthetic bento.info with n extension sources."""
+    lines = ["Name: foo",
+             "Version: 1.0",
+             "Summary: a package: with colons",
+             "Description:",
+             "    Some text",
+             "",
+             "    more text",
+             "",
+             "Library:",
+             "    Packages: foo, foo.bar",
+             "    Extension: foo._bar",
+             "        Sources:"]
+    sources = ["src/foo_%d.c" % i for i in range(n)]
+    lines.append("            " + ",\n            ".join(sources))
+    return "\n".join(lines) + "\n"
+
+def _tokens(lexer, data):
+    lexer.input(data)
+    return [(t.type, t.value, t.lineno, t.lexpos) for t in lexer]
+
+def _error(lexer, data):
+    lexer.input(data)
+    try:
+        list(lexer)
+    except (ParseError, SyntaxError, ValueError):
+        e = extract_exception()
+        return e.__class__, str(e)
+    raise AssertionError("No error raised for %r" % data)
+
+class TestSameTokens(unittest.TestCase):
+    def _test(self, data):
+        self.assertEqual(_tokens(FastBentoLexer(), data), _tokens(BentoLexer(), data))
+
+    def test_functionals(self):
+        for f in ["distribute.info", "jinja2.info", "sphinx.info"]:
+            self._test(open(os.path.join(FUNCTIONALS, f)).read())
+
+    def test_synthetic(self):
+        self._test(_make_info(100))
+
+    def test_escapes(self):
+        self._test("Name: foo\nLibrary:\n    Modules: foo\\ bar, b\\,az\n")
+
+    def test_errors(self):
+        for data in ["Name: foo\nNName: bar\n",
+                     "foo\\",
+                     "Name: foo\\ bar\n",
+                     "Library:\n  Modules: foo\n Packages: bar\n",
+                     "Library:\n\tModules: foo\n",
+                     "Library:\n    Modules: foo\n  Packages: \r\n"]:
+            self.assertEqual(_error(FastBentoLexer(), data), _error(BentoLexer(), data))
+
+    def test_parse(self):
+        data = open(os.path.join(FUNCTIONALS, "sphinx.info")).read()
+        self.assertEqual(str(Parser(FastBentoLexer()).parse(data)),
+                         str(Parser(BentoLexer()).parse(data)))
+
+class TestCreateLexer(unittest.TestCase):
+    def test_names(self):
+        self.assertTrue(isinstance(create_lexer("fast"), FastBentoLexer))
+        self.assertTrue(isinstance(create_lexer("ply"), BentoLexer))
+        self.assertRaises(BentoError, lambda: create_lexer("yacc"))
+
+    def test_default(self):
+        old = bento.parser.parser._LEXER
+        try:
+            bento.parser.parser._LEXER = "ply"
+            self.assertTrue(isinstance(create_lexer(), BentoLexer))
+            bento.parser.parser._LEXER = "fast"
+            self.assertTrue(isinstance(create_lexer(), FastBentoLexer))
+        finally:
+            bento.parser.parser._LEXER = old
+
+    def test_reset(self):
+        p = Parser(BentoLexer())
+        p.reset()
+        self.assertTrue(isinstance(p.lexer, BentoLexer))
+
+class TestFastLexerBenchmark(unittest.TestCase):
+    """Tokenizing a bento.info with 20k sources should be faster than with
+    the ply lexer (timings only checked if benchmarks are enabled, see
+    bento.testing.benchmark)."""
+    def _tokenize(self, klass, data):
+        lexer = klass()
+        lexer.input(data)
+        return len(list(lexer))
+
+    def test_benchmark(self):
+        data = _make_info(20000)
+        t_ply, n_ply = best_time(lambda: self._tokenize(BentoLexer, data))
+        t_fast, n_fast = best_time(lambda: self._tokenize(FastBentoLexer, data))
+        self.assertEqual(n_ply, 40031)
+        self.assertEqual(n_fast, n_ply)
+        if benchmarks_enabled():
+            self.assertTrue(t_fast < t_ply,
+                            "fast lexer: %.3fs, ply lexer: %.3fs" % (t_fast, t_ply))
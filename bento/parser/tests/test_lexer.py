@@ -7,6 +7,9 @@ from bento.utils.utils \
 from bento.parser.lexer \
     import \
         BentoLexer
+from bento.parser.fast_lexer \
+    import \
+        FastBentoLexer
 
 from bento.compat.api.moves import unittest
 
@@ -19,8 +22,10 @@ def split(s):
     return ret
 
 class TestLexer(TestCase):
+    lexer_class = BentoLexer
+
     def setUp(self):
-        self.lexer = BentoLexer()
+        self.lexer = self.lexer_class()
 
     def _test(self, data, ref):
         self.lexer.input(data)
@@ -55,7 +60,7 @@ class TestLexer(TestCase):
 # Test tokenizer stage before indentation generation
 class TestLexerStageOne(TestLexer):
     def setUp(self):
-        self.lexer = BentoLexer()
+        self.lexer = self.lexer_class()
 
     def test_single_line(self):
         data = """\
@@ -82,7 +87,7 @@ Library:
 
 class TestLexerStageTwo(TestLexer):
     def setUp(self):
-        self.lexer = BentoLexer()
+        self.lexer = self.lexer_class()
 
     def test_simple(self):
         data = "yoyo"
@@ -118,7 +123,7 @@ class TestLexerStageTwo(TestLexer):
 
 class TestLexerStageThree(TestLexer):
     def setUp(self):
-        self.lexer = BentoLexer()
+        self.lexer = self.lexer_class()
 
     def test_simple(self):
         data = "yoyo"
@@ -164,7 +169,7 @@ class TestLexerStageThree(TestLexer):
 
 class TestLexerStageFour(TestLexer):
     def setUp(self):
-        self.lexer = BentoLexer()
+        self.lexer = self.lexer_class()
 
     def test_single_line(self):
         data = """\
@@ -360,7 +365,7 @@ DEDENT
 
 class TestLexerStageFive(TestLexer):
     def setUp(self):
-        self.lexer = BentoLexer()
+        self.lexer = self.lexer_class()
 
     def test_single_line(self):
         data = """\
@@ -795,7 +800,7 @@ DEDENT
 
 class TestNewLines(TestLexer):
     def setUp(self):
-        self.lexer = BentoLexer()
+        self.lexer = self.lexer_class()
 
     # Test we throw away NEWLINES except in literals
     def test_lastnewline(self):
@@ -855,7 +860,7 @@ tool""")
 
 class TestComment(TestLexer):
     def setUp(self):
-        self.lexer = BentoLexer()
+        self.lexer = self.lexer_class()
 
     def test_simple(self):
         data = """\
@@ -914,3 +919,34 @@ NName: foo
         except ParseError:
             e = extract_exception()
             self.assertEqual(e.token.lexer.lineno, 5, "Invalid line number: %d" % e.token.lexer.lineno)
+
+# Run the same tests against the hand-written tokenizer
+class TestFastLexerStageOne(TestLexerStageOne):
+    lexer_class = FastBentoLexer
+
+class TestFastLexerStageTwo(TestLexerStageTwo):
+    lexer_class = FastBentoLexer
+
+class TestFastLexerStageThree(TestLexerStageThree):
+    lexer_class = FastBentoLexer
+
+class TestFastLexerStageFour(TestLexerStageFour):
+    lexer_class = FastBentoLexer
+
+class TestFastMultilineString(TestMultilineString):
+    lexer_class = FastBentoLexer
+
+class TestFastLexerStageFive(TestLexerStageFive):
+    lexer_class = FastBentoLexer
+
+class TestFastNewLines(TestNewLines):
+    lexer_class = FastBentoLexer
+
+class TestFastComment(TestComment):
+    lexer_class = FastBentoLexer
+
+class TestFastMeta(TestMeta):
+    lexer_class = FastBentoLexer
+
+class TestFastErrorHandling(TestErrorHandling):
+    lexer_class = FastBentoLexer
@@ -0,0 +1,158 @@
+import gc
+import sys
+
+from six.moves import cPickle
+
+from bento.compat.api.moves \
+    import \
+        unittest
+from bento.parser.nodes \
+    import \
+        Node, ast_walk
+from bento.parser.parser \
+    import \
+        parse
+from bento.parser.visitor \
+    import \
+        Dispatcher
+from bento.testing.benchmark \
+    import \
+        best_time, benchmarks_enabled
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+def _make_info(n):
+    """Synthetic bento.info with n flags, data files and conditional
+    extensions."""
+    lines = ["Name: foo"]
+    for i in range(n):
+        lines.extend(["DataFiles: data_%d" % i,
+                      "    TargetDir: $sitedir",
+                      "    Files: a_%d, b_%d" % (i, i),
+                      "Flag: flag_%d" % i,
+                      "    Description: some flag",
+                      "    Default: true"])
+    lines.append("Library:")
+    for i in range(n):
+        lines.extend(["    if flag(flag_%d):" % i,
+                      "        Modules: foo_%d" % i,
+                      "        Extension: _foo_%d" % i,
+                      "            Sources: foo_%d.c, bar_%d.c" % (i, i)])
+    return "\n".join(lines) + "\n"
+
+def _recursive_ast_walk(root, dispatcher):
+    """Reference implementation: recursive walk on a deep copy of the tree,
+    with one bound method per node type and Dispatcher instance."""
+    action_dict = dispatcher.action_dict
+
+    def _walker(par):
+        children = []
+        for c in par.children:
+            children.append(_walker(c))
+
+        par.children = [c for c in children if c is not None]
+        try:
+            func = action_dict[par.type]
+            return func(par)
+        except KeyError:
+            return par
+    return _walker(cPickle.loads(cPickle.dumps(root, protocol=2)))
+
+class _DictNode(object):
+    def __init__(self, tp, children=None, value=None):
+        self.type = tp
+        self.children = children or []
+        self.value = value
+
+class TestNode(unittest.TestCase):
+    def test_slots(self):
+        node = Node("foo", value="bar")
+        self.assertFalse(hasattr(node, "__dict__"))
+        self.assertRaises(AttributeError, lambda: setattr(node, "foo", 1))
+
+    def test_pickle(self):
+        node = Node("foo", children=[Node("bar", value=["a", "b"])])
+        for protocol in range(cPickle.HIGHEST_PROTOCOL + 1):
+            copied = cPickle.loads(cPickle.dumps(node, protocol=protocol))
+            self.assertEqual(copied.type, "foo")
+            self.assertEqual(copied.value, None)
+            self.assertEqual(copied.children[0].type, "bar")
+            self.assertEqual(copied.children[0].value, ["a", "b"])
+
+class TestAstWalk(unittest.TestCase):
+    def test_same_as_recursive(self):
+        data = _make_info(20)
+        self.assertEqual(ast_walk(parse(data), Dispatcher()),
+                         _recursive_ast_walk(parse(data), Dispatcher()))
+
+    def test_tree_unchanged(self):
+        data = """\
+Name: foo
+Recurse: foo
+Recurse: bar
+"""
+        tree = parse(data)
+        before = cPickle.dumps(tree, protocol=2)
+        self.assertEqual(ast_walk(tree, Dispatcher())["subento"], ["foo", "bar"])
+        self.assertEqual(ast_walk(tree, Dispatcher())["subento"], ["foo", "bar"])
+        self.assertEqual(cPickle.dumps(tree, protocol=2), before)
+
+    def test_deep_tree(self):
+        root = node = Node("foo")
+        for i in range(sys.getrecursionlimit() * 2):
+            child = Node("foo")
+            node.children.append(child)
+            node = child
+        res = ast_walk(root, Dispatcher())
+        self.assertEqual(res.type, "foo")
+        self.assertEqual(len(res.children), 1)
+
+    def test_dispatch_table_cached(self):
+        class _Dispatcher(Dispatcher):
+            def summary(self, node):
+                return Node("summary", value=node.value.upper())
+
+        self.assertTrue(Dispatcher.dispatch_table() is Dispatcher.dispatch_table())
+        self.assertFalse(_Dispatcher.dispatch_table() is Dispatcher.dispatch_table())
+
+        tree = parse("Summary: foo\n")
+        self.assertEqual(ast_walk(tree, Dispatcher())["summary"], "foo")
+        self.assertEqual(ast_walk(tree, _Dispatcher())["summary"], "FOO")
+
+class TestAstWalkBenchmark(unittest.TestCase):
+    """Walking a large bento.info should be faster than with a recursive
+    walker on a deep copy (timings only checked if benchmarks are enabled, see
+    bento.testing.benchmark), and slots-based nodes should be smaller than
+    dict-based ones."""
+    def test_walk_time(self):
+        tree = parse(_make_info(1000))
+        t_recursive, r_res = best_time(lambda: _recursive_ast_walk(tree, Dispatcher()))
+        t_walk, res = best_time(lambda: ast_walk(tree, Dispatcher()))
+        self.assertEqual(len(res["flag_options"]), 1000)
+        self.assertEqual(res, r_res)
+        if benchmarks_enabled():
+            self.assertTrue(t_walk < t_recursive,
+                            "ast_walk: %.3fs, recursive walk: %.3fs" % (t_walk, t_recursive))
+
+    def _allocated(self, klass, n):
+        gc.collect()
+        tracemalloc.start()
+        try:
+            nodes = [klass("foo", value="bar") for i in range(n)]
+            size = tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+        self.assertEqual(len(nodes), n)
+        return size
+
+    def test_node_memory(self):
+        if tracemalloc is None:
+            raise unittest.SkipTest("tracemalloc not available")
+        n = 10000
+        m_node = self._allocated(Node, n)
+        m_dict_node = self._allocated(_DictNode, n)
+        self.assertTrue(m_node < m_dict_node,
+                        "slots nodes: %d bytes, dict nodes: %d bytes" % (m_node, m_dict_node))
@@ -24,9 +24,15 @@ from bento.compat.api \
         NamedTemporaryFile
 from bento.errors \
     import \
-        BentoError, ParseError
+        ParseError
 
 from bento.parser import parser as parser_module
+from bento.parser import tables as tables_module
+from bento.parser.tables \
+    import \
+        load_table, LEXTAB, PARSETAB
+
+import ply.yacc
 
 #old = sys.path[:]
 #try:
@@ -124,7 +130,7 @@ Path: foo
             os.close(fid)
             os.remove(filename)
 
-class TestParserCaching(unittest.TestCase):
+class TestParserTables(unittest.TestCase):
     def setUp(self):
         wdir = tempfile.mkdtemp()
         self.subwdir= "bar"
@@ -134,25 +140,6 @@ class TestParserCaching(unittest.TestCase):
     def tearDown(self):
         os.chdir(self.old)
 
-    def test_no_cached_failure(self):
-        """Ensure we raise an error when the cached parser file does not exists
-        and we cannot create one."""
-        os.makedirs(self.subwdir)
-        os.chmod(self.subwdir, stat.S_IREAD | stat.S_IEXEC)
-        parsetab = op.join(self.subwdir, "parsetab")
-
-        old_parsetab = parser_module._PICKLED_PARSETAB
-        try:
-            parser_module._PICKLED_PARSETAB = parsetab
-            try:
-                parser_module.Parser()
-                self.assertTrue(len(self._list_files()) == 0, "Ply created a cached file in CWD")
-                self.fail("Expected an error when creating a parser in read-only dir !")
-            except BentoError:
-                pass
-        finally:
-            parser_module._PICKLED_PARSETAB = old_parsetab
-
     def _list_files(self):
         """Return the list of files in cwd (including subdirectories)."""
         created_files = []
@@ -160,24 +147,48 @@ class TestParserCaching(unittest.TestCase):
             created_files.extend([op.join(root, f) for f in files])
         return created_files
 
-    def test_read_only_cached(self):
-        """Test that we can create a parser backed by a read-only parsetab
-        file."""
+    def test_tables_up_to_date(self):
+        """Ensure the shipped tables match the current grammar (run python -m
+        bento.parser.tables to regenerate them otherwise)."""
+        self.assertTrue(load_table(LEXTAB) is not None)
+        parsetab = load_table(PARSETAB)
+        self.assertTrue(parsetab is not None)
+
+        pinfo = ply.yacc.ParserReflect(vars(parser_module))
+        pinfo.get_all()
+        self.assertEqual(parsetab._lr_signature, pinfo.signature())
+
+    def test_tables_reproducible(self):
+        """Ensure the shipped tables do not contain the path of the source
+        tree they were generated from."""
+        parser_dir = op.dirname(op.abspath(parser_module.__file__))
+        for name in [LEXTAB, PARSETAB]:
+            fid = open(op.join(parser_dir, name + ".py"))
+            try:
+                self.assertTrue(parser_dir not in fid.read())
+            finally:
+                fid.close()
+
+    def test_no_write(self):
+        """Ensure creating a parser does not write anything, even in a
+        read-only directory."""
         os.makedirs(self.subwdir)
-        parsetab = op.join(self.subwdir, "parsetab")
+        os.chmod(self.subwdir, stat.S_IREAD | stat.S_IEXEC)
+        os.chdir(self.subwdir)
 
-        old_parsetab = parser_module._PICKLED_PARSETAB
-        try:
-            parser_module._PICKLED_PARSETAB = parsetab
-            parser_module.Parser()
-            self.assertEqual(self._list_files(), [op.abspath(parsetab)])
+        parser_module.Parser().parse("Name: foo\n")
+        self.assertEqual(self._list_files(), [], "Ply created a file in CWD")
 
-            os.chmod(self.subwdir, stat.S_IREAD | stat.S_IEXEC)
-            os.chmod(parsetab, stat.S_IREAD)
+    def test_stale_tables(self):
+        """Ensure out of date tables are ignored."""
+        old_stamp = tables_module._STAMP
+        try:
+            tables_module._STAMP = "stale"
+            self.assertTrue(load_table(PARSETAB) is None)
+            self.assertTrue(load_table(LEXTAB) is None)
 
-            parser_module.Parser()
-            # This ensures ply did not write another cached file behind our back
-            self.assertEqual(self._list_files(), [op.abspath(parsetab)],
-                             "Ply created another cached parsetab file !")
+            p = parser_module.Parser()
+            self.assertTrue(p.parse("Name: foo\n") is not None)
+            self.assertEqual(self._list_files(), [])
         finally:
-            parser_module._PICKLED_PARSETAB = old_parsetab
+            tables_module._STAMP = old_stamp
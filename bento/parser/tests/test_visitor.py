@@ -240,6 +240,27 @@ Library:
         extension = parse_and_analyse(data)["libraries"]["default"]["extensions"]["_foo"]
         self.assertEqual(extension, r_extension)
 
+    def test_extension_unity_build(self):
+        data = """\
+Library:
+    Extension: _foo
+        Sources: foo.c, bar.c, fubar.c
+        UnityBuild: true
+        UnityExcludes: bar.c
+"""
+        r_extension = {"name": "_foo", "sources": ["foo.c", "bar.c", "fubar.c"],
+                       "unity_build": True, "unity_excludes": ["bar.c"]}
+        extension = parse_and_analyse(data)["libraries"]["default"]["extensions"]["_foo"]
+        self.assertEqual(extension, r_extension)
+
+        data = """\
+Library:
+    Extension: _foo
+        Sources: foo.c
+        UnityBuild: yes
+"""
+        self.assertRaises(ValueError, lambda: parse_and_analyse(data))
+
     def test_double_sources_extension(self):
         data = """\
 Library:
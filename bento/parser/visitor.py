@@ -26,6 +26,62 @@ def split_newlines(s):
 # XXX: fix the str vs bool issue with flag variables
 _LIT_BOOL = {"true": True, "false": False, True: True, False: False}
 
+# Node type -> Dispatcher method name
+_ACTIONS = {
+    "empty": "empty",
+    "stmt_list": "stmt_list",
+    "description": "description",
+    "description_from_file": "description_from_file",
+    "summary": "summary",
+    "author": "author",
+    "maintainer": "maintainer",
+    "hook_files": "hook_files",
+    "config_py": "config_py",
+    "meta_template_file": "meta_template_file",
+    "subento": "subento",
+    "use_backends": "use_backends",
+    # Library
+    "library": "library",
+    "library_name": "library_name",
+    "library_stmts": "library_stmts",
+    # Path
+    "path": "path",
+    "path_default": "path_default",
+    "path_stmts": "path_stmts",
+    "path_description": "path_description",
+    # Flag
+    "flag": "flag",
+    "flag_default": "flag_default",
+    "flag_stmts": "flag_stmts",
+    "flag_description": "flag_description",
+    # Extension
+    "extension": "extension",
+    "extension_declaration": "extension_declaration",
+    "extension_field_stmts": "extension_field_stmts",
+    # Pure C library
+    "compiled_library": "compiled_library",
+    "compiled_library_declaration": "compiled_library_declaration",
+    "compiled_library_field_stmts": "compiled_library_field_stmts",
+    # Conditional
+    "conditional": "conditional",
+    "osvar": "osvar",
+    "flagvar": "flagvar",
+    "not_flagvar": "not_flagvar",
+    "bool": "bool_var",
+    # Extra source files
+    "extra_source_files": "extra_source_files",
+    # Data files handling
+    "data_files": "data_files",
+    "data_files_stmts": "data_files_stmts",
+    # Executable
+    "executable": "executable",
+    "exec_stmts": "exec_stmts",
+    "exec_name": "exec_name",
+    "function": "function",
+    "module": "module",
+    "sub_directory": "sub_directory",
+}
+
 class Dispatcher(object):
     def __init__(self, user_values=None):
         self._d = {
@@ -37,64 +93,29 @@ class Dispatcher(object):
                 "extra_source_files": [],
                 "hook_files": [],
         }
-        self.action_dict = {
-            "empty": self.empty,
-            "stmt_list": self.stmt_list,
-            "description": self.description,
-            "description_from_file": self.description_from_file,
-            "summary": self.summary,
-            "author": self.author,
-            "maintainer": self.maintainer,
-            "hook_files": self.hook_files,
-            "config_py": self.config_py,
-            "meta_template_file": self.meta_template_file,
-            "subento": self.subento,
-            "use_backends": self.use_backends,
-            # Library
-            "library": self.library,
-            "library_name": self.library_name,
-            "library_stmts": self.library_stmts,
-            # Path
-            "path": self.path,
-            "path_default": self.path_default,
-            "path_stmts": self.path_stmts,
-            "path_description": self.path_description,
-            # Flag
-            "flag": self.flag,
-            "flag_default": self.flag_default,
-            "flag_stmts": self.flag_stmts,
-            "flag_description": self.flag_description,
-            # Extension
-            "extension": self.extension,
-            "extension_declaration": self.extension_declaration,
-            "extension_field_stmts": self.extension_field_stmts,
-            # Pure C library
-            "compiled_library": self.compiled_library,
-            "compiled_library_declaration": self.compiled_library_declaration,
-            "compiled_library_field_stmts": self.compiled_library_field_stmts,
-            # Conditional
-            "conditional": self.conditional,
-            "osvar": self.osvar,
-            "flagvar": self.flagvar,
-            "not_flagvar": self.not_flagvar,
-            "bool": self.bool_var,
-            # Extra source files
-            "extra_source_files": self.extra_source_files,
-            # Data files handling
-            "data_files": self.data_files,
-            "data_files_stmts": self.data_files_stmts,
-            # Executable
-            "executable": self.executable,
-            "exec_stmts": self.exec_stmts,
-            "exec_name": self.exec_name,
-            "function": self.function,
-            "module": self.module,
-            "sub_directory": self.sub_directory,
-        }
         if user_values is not None:
             self._vars = copy.deepcopy(user_values)
         else:
             self._vars = {}
+        self._action_dict = None
+
+    @classmethod
+    def dispatch_table(klass):
+        """Return the dictionary node type -> unbound action for this class.
+
+        The table is computed once per (sub)class, instead of binding every
+        method for each Dispatcher instance."""
+        table = klass.__dict__.get("_dispatch_table")
+        if table is None:
+            table = dict((tp, getattr(klass, name)) for tp, name in _ACTIONS.items())
+            klass._dispatch_table = table
+        return table
+
+    @property
+    def action_dict(self):
+        if self._action_dict is None:
+            self._action_dict = dict((tp, getattr(self, name)) for tp, name in _ACTIONS.items())
+        return self._action_dict
 
     def empty(self, node):
         return {}
@@ -218,6 +239,15 @@ class Dispatcher(object):
             elif c.type == "include_dirs":
                 _ensure_unique("include_dirs")
                 ret["include_dirs"] = c.value
+            elif c.type == "unity_build":
+                _ensure_unique("unity_build")
+                if not c.value in ["true", "false"]:
+                    raise ValueError("UnityBuild for extension %r should be true or false, got %r" \
+                                     % (ret["name"], c.value))
+                ret["unity_build"] = c.value == "true"
+            elif c.type == "unity_excludes":
+                _ensure_unique("unity_excludes")
+                ret["unity_excludes"] = c.value
             else:
                 raise ValueError("Gne ?")
         for c in [node.children[0]] + node.children[1]:
@@ -347,7 +377,7 @@ class Dispatcher(object):
     #-------------------
     def conditional(self, node):
         test = node.value
-        if self.action_dict[test.type](test):
+        if self.dispatch_table()[test.type](self, test):
             return node.children[:1]
         else:
             return node.children[1:]
@@ -37,7 +37,7 @@ def configure(conf):
 
         mfuncs = ('expl', 'expf', 'log1p', 'expm1', 'asinh', 'atanhf',
                 'atanhl', 'rint', 'trunc')
-        check_funcs_at_once(conf, mfuncs)
+        check_funcs_at_once(conf, mfuncs, bisect=True)
         generate_config_h(conf.conf_results, "build/conf/config.h")
     finally:
         conf.log.close()
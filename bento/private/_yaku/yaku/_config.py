@@ -17,5 +17,12 @@ HOOK_DUMP = ".hooks.pck"
 
 CONFIG_CACHE = ".config.pck"
 BUILD_CACHE = ".build.pck"
+NODE_SIGS_CACHE = ".node_sigs.pck"
+HEADER_SCAN_CACHE = ".header_scan.pck"
+TASK_DURATIONS_CACHE = ".task_durations.pck"
+
+# environment variable holding the directory of the configuration probes
+# cache shared between build directories (see yaku.probecache)
+PROBE_CACHE_ENV = "YAKU_PROBE_CACHE"
 
 _OUTPUT = sys.stdout
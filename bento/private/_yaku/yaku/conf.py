@@ -73,6 +73,16 @@ def write_log(conf, log, tasks, code, succeed, explanation):
     log.write(s.getvalue())
     log.write("\n")
 
+def write_cached_log(log, code, succeed):
+    for line in code.splitlines():
+        log.write("  |%s\n" % line)
+
+    if succeed:
+        log.write("---> Succeeded ! (cached)\n")
+    else:
+        log.write("---> Failure ! (cached)\n")
+    log.write("\n")
+
 def create_conf_blddir(conf, name, body):
     dirname = ".conf-%s-%s" % (name, hash(name+body))
     bld_root = os.path.join(conf.bld_root.abspath(), dirname)
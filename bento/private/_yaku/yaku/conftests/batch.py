@@ -0,0 +1,244 @@
+"""
+Batched configuration tests.
+
+A CheckBatch collects configuration tests, and builds the probes of
+independent tests concurrently, each in its own build directory. Messages,
+config.log entries and configuration results are written in the order the
+tests were declared, so that they do not depend on the number of jobs.
+"""
+import sys
+import copy
+import threading
+if sys.version_info[0] < 3:
+    import Queue as queue
+    from cStringIO \
+        import \
+            StringIO
+else:
+    import queue
+    from io \
+        import \
+            StringIO
+try:
+    import multiprocessing
+except ImportError:
+    multiprocessing = None
+
+from yaku.conf \
+    import \
+        create_conf_blddir
+from yaku.conftests.conftests \
+    import \
+        Probe, _check_compiler, _check_cpp_symbol, _check_type, \
+        _check_type_size, _check_header, _check_func, _check_lib, \
+        _check_funcs_at_once, _define
+from yaku.tools \
+    import \
+        create_conf_tasks, run_conf_tasks
+from yaku.utils \
+    import \
+        get_exception
+from yaku._config \
+    import \
+        _OUTPUT
+
+def _default_jobs():
+    if multiprocessing is not None:
+        try:
+            return multiprocessing.cpu_count()
+        except NotImplementedError:
+            pass
+    return 1
+
+class _CheckRecord(object):
+    """Stand-in for the configure context given to a test of a batch: it
+    records the messages, log and results of the test until they can be
+    written in order."""
+    def __init__(self, conf):
+        self.env = conf.env
+        self.builders = conf.builders
+        self.conf_results = []
+        self.log = StringIO()
+        self._messages = []
+
+    def start_message(self, msg):
+        self._messages.append(msg + "... ")
+        self.log.write("=" * 79 + "\n")
+        self.log.write("%s\n" % msg)
+
+    def end_message(self, msg):
+        self._messages.append("%s\n" % msg)
+
+    def flush(self, conf):
+        _OUTPUT.write("".join(self._messages))
+        conf.log.write(self.log.getvalue())
+        conf.conf_results.extend(self.conf_results)
+
+class _ProbeContext(object):
+    """View of the configure context for one probe, with its own build
+    directory, environment and log, so that probes may run concurrently."""
+    def __init__(self, conf, bld_root, env, log):
+        self._conf = conf
+        self.bld_root = bld_root
+        self.env = env
+        self.log = log
+
+    def __getattr__(self, name):
+        return getattr(self._conf, name)
+
+class CheckBatch(object):
+    """Set of configuration tests whose probes are built concurrently.
+
+    Tests are declared with the methods of the same name as the functions of
+    yaku.conftests, and run by run(), which returns their results in
+    declaration order. Tests of a same batch should not depend on each other.
+
+    Example
+    -------
+    >>> batch = CheckBatch(conf)
+    >>> batch.check_header("stdio.h")
+    >>> batch.check_func("floor", libs=["m"])
+    >>> has_stdio, has_floor = batch.run(jobs=4)
+    """
+    def __init__(self, conf):
+        self.conf = conf
+        self._checks = []
+
+    def _add(self, check_factory, *args):
+        record = _CheckRecord(self.conf)
+        self._checks.append((record, check_factory(record, *args)))
+
+    def check_compiler(self, msg=None):
+        self._add(_check_compiler, msg)
+
+    def check_cpp_symbol(self, symbol, headers=None):
+        self._add(_check_cpp_symbol, symbol, headers)
+
+    def check_type(self, type_name, headers=None):
+        self._add(_check_type, type_name, headers)
+
+    def check_type_size(self, type_name, headers=None, expect=None):
+        self._add(_check_type_size, type_name, headers, expect)
+
+    def check_header(self, header):
+        self._add(_check_header, header)
+
+    def check_func(self, func, libs=None):
+        self._add(_check_func, func, libs)
+
+    def check_lib(self, libs, func):
+        self._add(_check_lib, libs, func)
+
+    def check_funcs_at_once(self, funcs, libs=None, bisect=False):
+        self._add(_check_funcs_at_once, funcs, libs, bisect)
+
+    def define(self, name, value=None, comment=None):
+        self._add(_define, name, value, comment)
+
+    def _declare(self, record, probe, bld_root):
+        """Create the tasks of the given probe, to be built in bld_root."""
+        conf = self.conf
+        env = conf.env
+        if probe.libs:
+            env = copy.deepcopy(env)
+            env["LIBS"] = list(probe.libs) + env["LIBS"]
+        ctx = _ProbeContext(conf, bld_root, env, record.log)
+
+        builder = conf.builders[probe.builder]
+        # Build nodes are declared relatively to the global build node
+        node_ctx = conf.bld_root.ctx
+        old_bldnode = node_ctx.bldnode
+        node_ctx.bldnode = bld_root
+        try:
+            tasks, code = create_conf_tasks(ctx, getattr(builder, "_" + probe.kind),
+                                            probe.name, probe.body, probe.headers)
+        finally:
+            node_ctx.bldnode = old_bldnode
+        return ctx, tasks, code
+
+    def run(self, jobs=None):
+        """Run the declared tests, and return their results in declaration
+        order. At most jobs probes are built at the same time (default: the
+        number of CPUs)."""
+        if jobs is None:
+            jobs = _default_jobs()
+        checks = self._checks
+        self._checks = []
+
+        results = [None] * len(checks)
+        finished = [False] * len(checks)
+
+        todo = queue.Queue()
+        done = queue.Queue()
+        def _worker():
+            while True:
+                item = todo.get()
+                if item is None:
+                    return
+                i, ctx, tasks, code = item
+                try:
+                    done.put((i, run_conf_tasks(ctx, tasks, code, True), None))
+                except Exception:
+                    done.put((i, None, get_exception()))
+
+        # Probes with the same name and code share their build directory, and
+        # cannot be built at the same time
+        building = {}
+        deferred = {}
+        def _submit(i, probe):
+            bld_root = create_conf_blddir(self.conf, probe.name, probe.body)[1]
+            key = bld_root.abspath()
+            if key in building.values():
+                deferred.setdefault(key, []).append((i, probe))
+                return 0
+            building[i] = key
+            ctx, tasks, code = self._declare(checks[i][0], probe, bld_root)
+            todo.put((i, ctx, tasks, code))
+            return 1
+
+        def _handle(i, item):
+            # Submit the next probe of the test, or record its result. Return
+            # the number of submitted probes.
+            if isinstance(item, Probe):
+                return _submit(i, item)
+            checks[i][1].close()
+            results[i] = item
+            finished[i] = True
+            return 0
+
+        threads = []
+        for k in range(max(1, jobs)):
+            t = threading.Thread(target=_worker)
+            t.daemon = True
+            t.start()
+            threads.append(t)
+
+        try:
+            running = 0
+            for i in range(len(checks)):
+                running += _handle(i, next(checks[i][1]))
+
+            n_flushed = 0
+            while True:
+                while n_flushed < len(checks) and finished[n_flushed]:
+                    checks[n_flushed][0].flush(self.conf)
+                    n_flushed += 1
+                if running == 0:
+                    break
+
+                i, ret, error = done.get()
+                running -= 1
+                if error is not None:
+                    raise error
+
+                key = building.pop(i)
+                waiting = deferred.get(key)
+                if waiting:
+                    running += _submit(*waiting.pop(0))
+                running += _handle(i, checks[i][1].send(ret))
+        finally:
+            for t in threads:
+                todo.put(None)
+            for t in threads:
+                t.join()
+        return results
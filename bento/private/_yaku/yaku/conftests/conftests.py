@@ -1,6 +1,127 @@
+"""
+Configuration tests.
+
+Every test is written as a generator which yields the Probe instances it needs
+(code to compile or link), receives their outcome, and finally yields its
+result. run_check executes the probes of a test one after the other, and
+yaku.conftests.batch.CheckBatch executes the probes of independent tests
+concurrently.
+"""
 import copy
 
+class Probe(object):
+    """Test code to build with a builder of the configure context.
+
+    Parameters
+    ----------
+    kind: str
+        'compile' or 'program', the builder methods try_<kind> and _<kind>
+        are used to build the code
+    name: str
+        name of the probe, used for its build directory
+    body: str
+        code to build
+    headers: sequence, None
+        headers to include before the code
+    libs: sequence, None
+        libraries to link with, before the ones of the environment
+    builder: str
+        name of the builder
+    """
+    def __init__(self, kind, name, body, headers=None, libs=None, builder="ctasks"):
+        self.kind = kind
+        self.name = name
+        self.body = body
+        self.headers = headers
+        if libs is None:
+            libs = []
+        self.libs = libs
+        self.builder = builder
+
+    def run(self, conf):
+        builder = conf.builders[self.builder]
+        try_probe = getattr(builder, "try_" + self.kind)
+        if not self.libs:
+            return try_probe(self.name, self.body, self.headers, cached=True)
+
+        old_lib = copy.deepcopy(conf.env["LIBS"])
+        try:
+            for lib in self.libs[::-1]:
+                conf.env["LIBS"].insert(0, lib)
+            return try_probe(self.name, self.body, self.headers, cached=True)
+        finally:
+            conf.env["LIBS"] = old_lib
+
+def run_check(conf, check):
+    """Run the given test generator, building its probes one after the other.
+    Return the test result."""
+    item = next(check)
+    while isinstance(item, Probe):
+        item = check.send(item.run(conf))
+    check.close()
+    return item
+
 def check_compiler(conf, msg=None):
+    return run_check(conf, _check_compiler(conf, msg))
+
+def check_cpp_symbol(conf, symbol, headers=None):
+    return run_check(conf, _check_cpp_symbol(conf, symbol, headers))
+
+def check_type(conf, type_name, headers=None):
+    return run_check(conf, _check_type(conf, type_name, headers))
+
+def check_type_size(conf, type_name, headers=None, expect=None):
+    """\
+    This check can be used to get the size of a given type, or to
+    check whether the type is of expected size.
+
+    Arguments
+    ---------
+    conf : object
+        configure context instance
+    type_name : str
+        the type to check
+    includes : sequence
+        list of headers to include in the test code before testing the
+        type
+    expect : sequence
+        if given, will test wether the type has the given number of
+            bytes.  If not given, will automatically find the size.
+    """
+    return run_check(conf, _check_type_size(conf, type_name, headers, expect))
+
+def check_header(conf, header):
+    return run_check(conf, _check_header(conf, header))
+
+def check_func(conf, func, libs=None):
+    return run_check(conf, _check_func(conf, func, libs))
+
+def check_lib(conf, libs, func):
+    return run_check(conf, _check_lib(conf, libs, func))
+
+def check_funcs_at_once(conf, funcs, libs=None, bisect=False):
+    """\
+    Check for several functions by linking them all in a single program.
+
+    Arguments
+    ---------
+    conf : object
+        configure context instance
+    funcs : sequence
+        names of the functions to check
+    libs : sequence
+        libraries to link with
+    bisect : bool
+        if False, the functions are reported as all present or all missing,
+        and True is returned if they are all present. If True, a failing set
+        of functions is split in halves until the missing ones are found,
+        which takes O(k log n) links for k missing functions out of n. Each
+        function is then reported separately, and a dict function name ->
+        bool is returned.
+    """
+    return run_check(conf, _check_funcs_at_once(conf, funcs, libs, bisect))
+
+def _check_compiler(conf, msg=None):
     code = """\
 int main(void)
 {
@@ -12,14 +133,14 @@ int main(void)
         conf.start_message("Checking whether C compiler works")
     else:
         conf.start_message(msg)
-    ret = conf.builders["ctasks"].try_program("check_cc", code, None)
+    ret = yield Probe("program", "check_cc", code)
     if ret:
         conf.end_message("yes")
     else:
         conf.end_message("no")
-    return ret
+    yield ret
 
-def check_cpp_symbol(conf, symbol, headers=None):
+def _check_cpp_symbol(conf, symbol, headers=None):
     code = []
     if headers:
         for h in headers:
@@ -38,16 +159,16 @@ int main()
     src = "\n".join(code)
 
     conf.start_message("Checking for declaration %s" % symbol)
-    ret = conf.builders["ctasks"].try_compile("check_cpp_symbol", src, headers)
+    ret = yield Probe("compile", "check_cpp_symbol", src, headers)
     conf.conf_results.append({"type": "decl", "value": symbol,
                               "result": ret})
     if ret:
         conf.end_message("yes")
     else:
         conf.end_message("no")
-    return ret
+    yield ret
 
-def check_type(conf, type_name, headers=None):
+def _check_type(conf, type_name, headers=None):
     code = r"""
 int main() {
   if ((%(name)s *) 0)
@@ -58,35 +179,16 @@ int main() {
 """ % {'name': type_name}
 
     conf.start_message("Checking for type %s" % type_name)
-    ret = conf.builders["ctasks"].try_compile("check_type", code,
-                        headers)
+    ret = yield Probe("compile", "check_type", code, headers)
     conf.conf_results.append({"type": "type", "value": type_name,
                               "result": ret})
     if ret:
         conf.end_message("yes")
     else:
         conf.end_message("no")
-    return ret
-
-def check_type_size(conf, type_name, headers=None, expect=None):
-    """\
-    This check can be used to get the size of a given type, or to
-    check whether the type is of expected size.
-
-    Arguments
-    ---------
-    conf : object
-        configure context instance
-    type_name : str
-        the type to check
-    includes : sequence
-        list of headers to include in the test code before testing the
-        type
-    expect : sequence
-        if given, will test wether the type has the given number of
-            bytes.  If not given, will automatically find the size.
-    """
+    yield ret
 
+def _check_type_size(conf, type_name, headers=None, expect=None):
     conf.start_message("Checking for sizeof %s ..." % type_name)
     body = r"""
 typedef %(type)s yaku_check_sizeof_type;
@@ -100,10 +202,11 @@ int main ()
 }
 """ % {"type": type_name}
 
-    ret = conf.builders["ctasks"].try_compile("check_type_size", body, headers)
+    ret = yield Probe("compile", "check_type_size", body, headers)
     if not ret:
         conf.end_message("no (cannot compile type)")
-        return False
+        yield False
+        return
 
     if expect is None:
         # this fails to *compile* if size > sizeof(type)
@@ -126,8 +229,7 @@ int main ()
         mid = 0
         while True:
             code = body % {'type': type_name, 'size': mid}
-            ret = conf.builders["ctasks"].try_compile("check_type_size",
-                    code, headers)
+            ret = yield Probe("compile", "check_type_size", code, headers)
             if ret:
                 break
             #log.info("failure to test for bound %d" % mid)
@@ -137,10 +239,10 @@ int main ()
         high = mid
         # Binary search:
         while low != high:
-            mid = (high - low) / 2 + low
+            mid = (high - low) // 2 + low
             code = body % {'type': type_name, 'size': mid}
-            if conf.builders["ctasks"].try_compile("check_type_size",
-                    code, headers):
+            ret = yield Probe("compile", "check_type_size", code, headers)
+            if ret:
                 high = mid
             else:
                 low = mid + 1
@@ -152,7 +254,7 @@ int main ()
 
     conf.conf_results.append({"type": "type_size", "value": type_name,
                               "result": ret})
-    return ret
+    yield ret
 
 def define(conf, name, value=None, comment=None):
     """\
@@ -192,22 +294,26 @@ def define(conf, name, value=None, comment=None):
     conf.conf_results.append({"type": "define", "value": content,
         "result": True})
 
-def check_header(conf, header):
+def _define(conf, name, value=None, comment=None):
+    define(conf, name, value, comment)
+    yield None
+
+def _check_header(conf, header):
     code = r"""
 #include <%s>
 """ % header
 
     conf.start_message("Checking for header %s" % header)
-    ret = conf.builders["ctasks"].try_compile("check_header", code, None)
+    ret = yield Probe("compile", "check_header", code)
     if ret:
         conf.end_message("yes")
     else:
         conf.end_message("no !")
     conf.conf_results.append({"type": "header", "value": header,
                               "result": ret})
-    return ret
+    yield ret
 
-def check_func(conf, func, libs=None):
+def _check_func(conf, func, libs=None):
     if libs is None:
         libs = []
     # Handle MSVC intrinsics: force MS compiler to make a function
@@ -233,22 +339,16 @@ int main (void)
         msg = "Checking for function %s" % func
     conf.start_message(msg)
 
-    old_lib = copy.deepcopy(conf.env["LIBS"])
-    try:
-        for lib in libs[::-1]:
-            conf.env["LIBS"].insert(0, lib)
-        ret = conf.builders["ctasks"].try_program("check_func", code, None)
-        if ret:
-            conf.end_message("yes")
-        else:
-            conf.end_message("no !")
-    finally:
-        conf.env["LIBS"] = old_lib
+    ret = yield Probe("program", "check_func", code, libs=libs)
+    if ret:
+        conf.end_message("yes")
+    else:
+        conf.end_message("no !")
     conf.conf_results.append({"type": "func", "value": func,
                               "result": ret})
-    return ret
+    yield ret
 
-def check_lib(conf, libs, func):
+def _check_lib(conf, libs, func):
     # XXX: refactor with check_func
 
     # Handle MSVC intrinsics: force MS compiler to make a function
@@ -271,27 +371,17 @@ int main (void)
     conf.start_message("Checking for function %s in %s" % \
                        (func, " ".join([conf.env["LIB_FMT"] % lib for lib in libs])))
 
-    old_lib = copy.deepcopy(conf.env["LIBS"])
-    try:
-        for i in range(len(libs)):
-            conf.env["LIBS"].insert(i, libs[i])
-        ret = conf.builders["ctasks"].try_program("check_lib", code, None)
-        if ret:
-            conf.end_message("yes")
-        else:
-            conf.end_message("no !")
-    finally:
-        conf.env["LIBS"] = old_lib
+    ret = yield Probe("program", "check_lib", code, libs=libs)
+    if ret:
+        conf.end_message("yes")
+    else:
+        conf.end_message("no !")
     for lib in libs:
         conf.conf_results.append({"type": "lib", "value": lib,
                                   "result": ret, "func": func})
-    return ret
+    yield ret
 
-def check_funcs_at_once(conf, funcs, libs=None):
-    if libs is None:
-        libs = []
-
-    header = []
+def _funcs_at_once_code(funcs):
     header = ['#ifdef __cplusplus']
     header.append('extern "C" {')
     header.append('#endif')
@@ -314,7 +404,7 @@ def check_funcs_at_once(conf, funcs, libs=None):
         tmp.append("\t%s();" % f)
     tmp = "\n".join(tmp)
 
-    body = r"""
+    return r"""
 %(include)s
 %(header)s
 
@@ -325,20 +415,63 @@ int main (void)
 }
 """ % {"tmp": tmp, "include": "", "header": header}
 
+def _check_funcs_at_once(conf, funcs, libs=None, bisect=False):
+    if libs is None:
+        libs = []
+
     conf.start_message("Checking for functions %s" % ", ".join(funcs))
-    old_lib = copy.deepcopy(conf.env["LIBS"])
-    try:
-        for lib in libs[::-1]:
-            conf.env["LIBS"].insert(0, lib)
-        ret = conf.builders["ctasks"].try_program("check_func", body, None)
+    if not bisect:
+        ret = yield Probe("program", "check_func", _funcs_at_once_code(funcs), libs=libs)
         if ret:
             conf.end_message("yes")
         else:
             conf.end_message("no !")
-    finally:
-        conf.env["LIBS"] = old_lib
 
+        for func in funcs:
+            conf.conf_results.append({"type": "func", "value": func,
+                                      "result": ret})
+        yield ret
+        return
+
+    if not funcs:
+        conf.end_message("yes")
+        yield {}
+        return
+
+    # Each item is a set of functions to check, and whether it is already
+    # known to contain a missing function
+    missing = set()
+    todo = [(list(funcs), False)]
+    while todo:
+        group, known_failure = todo.pop()
+        if not known_failure:
+            ret = yield Probe("program", "check_func", _funcs_at_once_code(group), libs=libs)
+            if ret:
+                continue
+        if len(group) < 2:
+            # Only a toolchain failure can make an empty group fail to link:
+            # there is nothing to split anymore
+            missing.update(group)
+            continue
+        # If the first half links, the missing functions are in the second
+        # one, which does not need to be linked as a whole
+        half = len(group) // 2
+        first, second = group[:half], group[half:]
+        ret = yield Probe("program", "check_func", _funcs_at_once_code(first), libs=libs)
+        todo.append((second, ret))
+        if not ret:
+            todo.append((first, True))
+
+    if not missing:
+        conf.end_message("yes")
+    elif len(missing) == len(funcs):
+        conf.end_message("no !")
+    else:
+        conf.end_message("no (missing: %s)" % ", ".join([f for f in funcs if f in missing]))
+
+    results = {}
     for func in funcs:
+        results[func] = func not in missing
         conf.conf_results.append({"type": "func", "value": func,
-                                  "result": ret})
-    return ret
+                                  "result": results[func]})
+    yield results
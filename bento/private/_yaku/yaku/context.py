@@ -14,6 +14,7 @@ else:
 from yaku._config \
     import \
         DEFAULT_ENV, BUILD_CONFIG, BUILD_CACHE, CONFIG_CACHE, HOOK_DUMP, \
+        NODE_SIGS_CACHE, HEADER_SCAN_CACHE, TASK_DURATIONS_CACHE, PROBE_CACHE_ENV, \
         _OUTPUT
 from yaku.environment \
     import \
@@ -27,6 +28,9 @@ from yaku.utils \
 from yaku.errors \
     import \
         UnknownTask, ConfigurationFailure, TaskRunFailure, WindowsError
+from yaku.probecache \
+    import \
+        ProbeCache
 import yaku.node
 import yaku.task_manager
 
@@ -75,6 +79,9 @@ class ConfigureContext(object):
         self._configured = {}
         self._stdout_cache = {}
         self._cmd_cache = {}
+        # shared configuration probe results (yaku.probecache.ProbeCache),
+        # disabled by default
+        self.probe_cache = None
 
         self.src_root = None
         self.bld_root = None
@@ -210,11 +217,36 @@ def load_tools(self, fid):
             tool_mod.init()
     self.tools = tools
 
+def _load_cache(bldnode, name):
+    cache_node = bldnode.find_node(name)
+    if cache_node is not None:
+        fid = open(cache_node.abspath(), "rb")
+        try:
+            return load(fid)
+        finally:
+            fid.close()
+    else:
+        return {}
+
 class BuildContext(object):
     def __init__(self):
         self.env = Environment()
         self.tools = []
         self.cache = {}
+        # node path -> ((mtime, size, inode), content digest)
+        self.node_sigs = {}
+        # header path -> ((mtime, size, inode), included names)
+        self.header_scan = {}
+        # task uid -> duration (in seconds) of its last execution, used to
+        # prioritize long dependency chains in parallel builds
+        self.task_durations = {}
+        # shared compiled objects cache (yaku.objcache.ObjectCache), disabled
+        # by default
+        self.object_cache = None
+        # tracer recording task timings, disabled by default. Any object with
+        # an add_task(task, start, end, args) method (e.g.
+        # bento.utils.trace.Tracer)
+        self.tracer = None
         self.builders = {}
         self.tasks = []
 
@@ -249,15 +281,10 @@ class BuildContext(object):
             finally:
                 f.close()
 
-        build_cache = bldnode.find_node(BUILD_CACHE)
-        if build_cache is not None:
-            fid = open(build_cache.abspath(), "rb")
-            try:
-                self.cache = load(fid)
-            finally:
-                fid.close()
-        else:
-            self.cache = {}
+        self.cache = _load_cache(bldnode, BUILD_CACHE)
+        self.node_sigs = _load_cache(bldnode, NODE_SIGS_CACHE)
+        self.header_scan = _load_cache(bldnode, HEADER_SCAN_CACHE)
+        self.task_durations = _load_cache(bldnode, TASK_DURATIONS_CACHE)
 
         hook_dump = bldnode.find_node(HOOK_DUMP)
         fid = open(hook_dump.abspath(), "rb")
@@ -269,13 +296,18 @@ class BuildContext(object):
             fid.close()
 
     def store(self):
-        build_cache = self.bld_root.make_node(BUILD_CACHE)
-        tmp_fid = open(build_cache.abspath() + ".tmp", "wb")
-        try:
-            dump(self.cache, tmp_fid)
-        finally:
-            tmp_fid.close()
-        rename(build_cache.abspath() + ".tmp", build_cache.abspath())
+        # Use rename to avoid corrupting the caches if interrupted
+        for name, data in [(BUILD_CACHE, self.cache),
+                           (NODE_SIGS_CACHE, self.node_sigs),
+                           (HEADER_SCAN_CACHE, self.header_scan),
+                           (TASK_DURATIONS_CACHE, self.task_durations)]:
+            cache_node = self.bld_root.make_node(name)
+            tmp_fid = open(cache_node.abspath() + ".tmp", "wb")
+            try:
+                dump(data, tmp_fid)
+            finally:
+                tmp_fid.close()
+            rename(cache_node.abspath() + ".tmp", cache_node.abspath())
 
     def set_stdout_cache(self, task, stdout):
         pass
@@ -325,6 +357,8 @@ def get_cfg(src_path=None, build_path="build"):
 
     ctx.env = env
     ctx.log = myopen(os.path.join(env["BLDDIR"], "config.log"), "w")
+    if os.environ.get(PROBE_CACHE_ENV):
+        ctx.probe_cache = ProbeCache(os.environ[PROBE_CACHE_ENV])
     return ctx
 
 def get_bld(src_path=None, build_path="build"):
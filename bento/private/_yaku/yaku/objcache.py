@@ -0,0 +1,162 @@
+"""Content-addressed cache of compiled objects, shared between builds.
+
+Each entry is keyed on the task signature (content of the inputs and
+dependencies, relevant environment variables and task function), on the
+command line and on the identity (resolved path, size and mtime) of the
+compiler, and holds the task outputs and captured stdout. The cache
+directory may be shared between several build directories (e.g. many CI
+workspaces of the same project).
+
+Only the dependencies found by the scanner are tracked: system headers and
+headers from include directories outside of the source tree are not, so the
+cache has to be cleared when they change.
+"""
+import os
+import shutil
+import threading
+try:
+    from hashlib import md5
+except ImportError:
+    from md5 import md5
+
+from yaku.utils \
+    import \
+        ensure_dir, program_identity
+
+DEFAULT_MAX_SIZE = 1024 * 1024 * 1024
+
+_STDOUT = "stdout"
+
+class ObjectCache(object):
+    def __init__(self, directory, max_size=DEFAULT_MAX_SIZE, use_hardlinks=True):
+        self.directory = os.path.abspath(directory)
+        self.max_size = max_size
+        self.use_hardlinks = use_hardlinks and hasattr(os, "link")
+
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def _entry(self, key):
+        return os.path.join(self.directory, key[:2], key)
+
+    def key(self, task, cmd, node_sigs=None):
+        """Compute the cache key of the given task run through cmd.
+
+        Output paths are absolute in the command line, so they are replaced
+        by placeholders to share entries between build directories."""
+        targets = dict([(o.abspath(), "${TGT[%d]}" % i) \
+                        for i, o in enumerate(task.outputs)])
+        m = md5()
+        m.update(task.__class__.__name__.encode())
+        m.update(task.signature(node_sigs))
+        if cmd:
+            # A compiler upgraded in place keeps the same command line
+            identity = program_identity(str(cmd[0]))
+            if identity is not None:
+                m.update(identity.encode("utf-8"))
+        for c in cmd:
+            m.update(targets.get(str(c), str(c)).encode("utf-8"))
+            m.update("\0".encode())
+        return m.hexdigest()
+
+    def fetch(self, key, outputs):
+        """Restore the outputs stored under key.
+
+        Returns the captured stdout of the task if found, None otherwise."""
+        entry = self._entry(key)
+        stdout_file = os.path.join(entry, _STDOUT)
+        try:
+            fid = open(stdout_file, "rb")
+            try:
+                stdout = fid.read().decode("utf-8")
+            finally:
+                fid.close()
+            for i, o in enumerate(outputs):
+                self._restore(os.path.join(entry, str(i)), o.abspath())
+            # Mark the entry as recently used
+            os.utime(stdout_file, None)
+        except (IOError, OSError):
+            self._count(False)
+            return None
+        self._count(True)
+        return stdout
+
+    def _restore(self, source, target):
+        ensure_dir(target)
+        if os.path.exists(target):
+            os.remove(target)
+        if self.use_hardlinks:
+            try:
+                os.link(source, target)
+                return
+            except OSError:
+                # e.g. cache and build directory on different filesystems
+                pass
+        shutil.copyfile(source, target)
+
+    def _count(self, hit):
+        self._lock.acquire()
+        try:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+        finally:
+            self._lock.release()
+
+    def store(self, key, outputs, stdout):
+        entry = self._entry(key)
+        if os.path.exists(entry):
+            return
+        tmp = "%s.%d.%d.tmp" % (entry, os.getpid(), id(threading.current_thread()))
+        os.makedirs(tmp)
+        try:
+            for i, o in enumerate(outputs):
+                shutil.copyfile(o.abspath(), os.path.join(tmp, str(i)))
+            fid = open(os.path.join(tmp, _STDOUT), "wb")
+            try:
+                fid.write(stdout.encode("utf-8"))
+            finally:
+                fid.close()
+            try:
+                os.rename(tmp, entry)
+            except OSError:
+                # Another build stored the same entry concurrently
+                pass
+        finally:
+            if os.path.exists(tmp):
+                shutil.rmtree(tmp)
+
+    def trim(self):
+        """Remove the least recently used entries until the cache size is
+        below max_size."""
+        entries = []
+        total = 0
+        if not os.path.exists(self.directory):
+            return
+        for prefix in os.listdir(self.directory):
+            d = os.path.join(self.directory, prefix)
+            if not os.path.isdir(d):
+                continue
+            for key in os.listdir(d):
+                if key.endswith(".tmp"):
+                    continue
+                entry = os.path.join(d, key)
+                try:
+                    last_used = os.stat(os.path.join(entry, _STDOUT)).st_mtime
+                    size = 0
+                    for f in os.listdir(entry):
+                        size += os.stat(os.path.join(entry, f)).st_size
+                except OSError:
+                    # Entry being written or removed by another build
+                    continue
+                entries.append((last_used, size, entry))
+                total += size
+
+        entries.sort()
+        for last_used, size, entry in entries:
+            if total <= self.max_size:
+                break
+            shutil.rmtree(entry, True)
+            total -= size
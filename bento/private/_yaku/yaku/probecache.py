@@ -0,0 +1,226 @@
+"""Cache of configuration probe results, shared between build directories.
+
+Each entry records whether a configuration probe (the code compiled or linked
+by a configuration test) succeeded. It is keyed on the probe code, the
+environment variables used by the probe tasks, and the identity (resolved
+path, size and mtime) of the programs they run, so that entries are
+invalidated when the toolchain or the flags change. Build directory paths are
+replaced by a placeholder, so that entries are shared between build
+directories (e.g. many CI workspaces using the same toolchain).
+
+The cache also memoizes toolchain detection results (compiler type,
+distutils compiler and configuration), keyed on the interpreter, the programs
+involved and the compiler-related environment variables (see
+ProbeCache.memoize).
+
+Changes outside of the toolchain, like a newly installed header or library,
+are not detected: the cache has to be cleared explicitly in that case (see
+ProbeCache.clear, or 'python -m yaku.probecache clear DIRECTORY').
+"""
+import os
+import sys
+import shutil
+import threading
+try:
+    import json
+except ImportError:
+    import simplejson as json
+try:
+    from hashlib import md5
+except ImportError:
+    from md5 import md5
+
+from yaku.utils \
+    import \
+        ensure_dir, program_identity
+
+# Environment variables influencing compilers and linkers beyond their flags
+COMPILER_ENVIRON = ["CPATH", "C_INCLUDE_PATH", "CPLUS_INCLUDE_PATH",
+                    "LIBRARY_PATH", "INCLUDE", "LIB", "SDKROOT",
+                    "MACOSX_DEPLOYMENT_TARGET"]
+
+# Environment variables read by distutils and the yaku tools when detecting
+# the toolchain
+DETECTION_ENVIRON = COMPILER_ENVIRON + ["PATH", "CC", "CXX", "CPP", "CFLAGS",
+                                        "CPPFLAGS", "LDFLAGS", "LDSHARED", "AR",
+                                        "ARFLAGS"]
+
+_SUCCESS = "1"
+_FAILURE = "0"
+
+class ProbeCache(object):
+    __version__ = "1"
+
+    def __init__(self, directory):
+        self.directory = os.path.abspath(directory)
+
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def _entry(self, key):
+        return os.path.join(self.directory, key[:2], key)
+
+    def key(self, conf, tasks, code):
+        """Compute the cache key of the probe made of the given tasks, which
+        build code."""
+        # The probe build directory name depends on the (randomized) string
+        # hash of the probe, and it may appear as an absolute or relative path
+        probe_dir = conf.bld_root.abspath()
+        replacements = [(probe_dir, "${PROBEDIR}"),
+                        (os.path.relpath(probe_dir), "${PROBEDIR}"),
+                        (os.path.abspath(conf.env["BLDDIR"]), "${BLDDIR}")]
+        def _normalize(value):
+            value = str(value)
+            for path, placeholder in replacements:
+                value = value.replace(path, placeholder)
+            return value
+
+        m = md5()
+        m.update(self.__version__.encode())
+        m.update(sys.version.encode("utf-8"))
+        m.update(code.encode("utf-8"))
+        for t in tasks:
+            m.update(t.__class__.__name__.encode())
+            for var in t.env_vars:
+                value = t.env.get(var, [])
+                m.update(("\0%s=%s" % (var, _normalize(value))).encode("utf-8"))
+                # The first word of a variable may name the program to run
+                if isinstance(value, list) and value and isinstance(value[0], str):
+                    identity = program_identity(value[0])
+                    if identity is not None:
+                        m.update(("\0%s" % identity).encode("utf-8"))
+            environ = t.env.get("ENV", None) or {}
+            for name in COMPILER_ENVIRON:
+                if name in environ:
+                    m.update(("\0$%s=%s" % (name, environ[name])).encode("utf-8"))
+        return m.hexdigest()
+
+    def _count(self, hit):
+        self._lock.acquire()
+        try:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+        finally:
+            self._lock.release()
+
+    def _read(self, entry):
+        try:
+            fid = open(entry, "r")
+            try:
+                return fid.read()
+            finally:
+                fid.close()
+        except (IOError, OSError):
+            return None
+
+    def _write(self, entry, data):
+        try:
+            ensure_dir(entry)
+        except OSError:
+            # Created concurrently by another configuration
+            if not os.path.isdir(os.path.dirname(entry)):
+                raise
+        tmp = "%s.%d.%d.tmp" % (entry, os.getpid(), id(threading.current_thread()))
+        fid = open(tmp, "w")
+        try:
+            fid.write(data)
+        finally:
+            fid.close()
+        try:
+            if sys.platform == "win32" and os.path.exists(entry):
+                os.remove(entry)
+            os.rename(tmp, entry)
+        except OSError:
+            # Another configuration stored the same entry concurrently
+            if os.path.exists(tmp):
+                os.remove(tmp)
+
+    def fetch(self, key):
+        """Return the recorded outcome (True or False) of the probe, or None if
+        unknown."""
+        value = self._read(self._entry(key))
+        if value == _SUCCESS:
+            ret = True
+        elif value == _FAILURE:
+            ret = False
+        else:
+            ret = None
+        self._count(ret is not None)
+        return ret
+
+    def store(self, key, succeed):
+        if succeed:
+            self._write(self._entry(key), _SUCCESS)
+        else:
+            self._write(self._entry(key), _FAILURE)
+
+    def detection_key(self, name, programs, args):
+        m = md5()
+        m.update(self.__version__.encode())
+        m.update(("\0%s" % name).encode("utf-8"))
+        m.update(sys.version.encode("utf-8"))
+        m.update(("\0%s" % program_identity(sys.executable)).encode("utf-8"))
+        m.update(("\0%s" % json.dumps(args, sort_keys=True)).encode("utf-8"))
+        for program in programs:
+            m.update(("\0%s" % program_identity(program)).encode("utf-8"))
+        for var in DETECTION_ENVIRON:
+            if var in os.environ:
+                m.update(("\0$%s=%s" % (var, os.environ[var])).encode("utf-8"))
+        return m.hexdigest()
+
+    def memoize(self, name, programs, args, func):
+        """Return the result of func, a toolchain detection function, reusing
+        the result recorded by a previous configuration if any.
+
+        Parameters
+        ----------
+        name: str
+            name of the detection
+        programs: sequence
+            programs (names or paths) the result depends on
+        args: object
+            arguments func depends on, serializable as JSON
+        func: callable
+            function to call on a miss, whose result is serializable as JSON
+        """
+        entry = self._entry(self.detection_key(name, programs, args)) + ".json"
+        data = self._read(entry)
+        if data is not None:
+            try:
+                value = json.loads(data)["value"]
+                self._count(True)
+                return value
+            except (ValueError, KeyError):
+                pass
+        self._count(False)
+        value = func()
+        self._write(entry, json.dumps({"value": value}))
+        return value
+
+    def clear(self):
+        """Remove every entry of the cache."""
+        if os.path.exists(self.directory):
+            shutil.rmtree(self.directory)
+
+def memoize_detection(ctx, name, programs, args, func):
+    """Call func through the probe cache of the configure context ctx if it
+    has one (see ProbeCache.memoize), or directly otherwise."""
+    probe_cache = getattr(ctx, "probe_cache", None)
+    if probe_cache is None:
+        return func()
+    return probe_cache.memoize(name, programs, args, func)
+
+def main(argv=None):
+    if argv is None:
+        argv = sys.argv[1:]
+    if len(argv) != 2 or argv[0] != "clear":
+        sys.stderr.write("Usage: python -m yaku.probecache clear DIRECTORY\n")
+        return 2
+    ProbeCache(argv[1]).clear()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
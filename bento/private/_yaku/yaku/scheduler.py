@@ -5,10 +5,22 @@ if sys.version_info[0] < 3:
 else:
     import queue
 import threading
+if sys.version_info[0] < 3:
+    from cPickle \
+        import \
+            dumps, loads
+else:
+    from pickle \
+        import \
+            dumps, loads
+try:
+    import multiprocessing
+except ImportError:
+    multiprocessing = None
 
 from yaku.task_manager \
     import \
-        run_task, order_tasks, TaskManager
+        run_task, order_tasks, task_graph, TaskManager
 from yaku.utils \
     import \
         get_exception
@@ -30,6 +42,216 @@ def run_tasks_parallel(ctx, tasks=None, maxjobs=1):
     r.start()
     r.run()
 
+def run_tasks_dependency(ctx, tasks=None, maxjobs=1):
+    if tasks is None:
+        tasks = ctx.tasks
+    task_manager = TaskManager(tasks)
+    r = DependencyRunner(ctx, task_manager, maxjobs)
+    r.start()
+    r.run()
+
+def task_priorities(tasks, rdeps, durations=None):
+    """Compute the priority of each task as the length of the longest
+    path from the task to the end of the build, weighted by task durations.
+
+    durations maps task uids to the duration of their last execution (see
+    BuildContext.task_durations). Tasks never run before are given the
+    mean duration of the known tasks of the same class, or of all known
+    tasks if none is known for that class (every task weights 1 if no
+    duration is known at all)."""
+    if durations is None:
+        durations = {}
+
+    known = {}
+    for t in tasks:
+        d = durations.get(t.get_uid(), None)
+        if d is not None:
+            known.setdefault(t.__class__.__name__, []).append(d)
+    all_known = []
+    for v in known.values():
+        all_known.extend(v)
+    if all_known:
+        default = sum(all_known) / len(all_known)
+    else:
+        default = 1.0
+
+    def _weight(t):
+        d = durations.get(t.get_uid(), None)
+        if d is None:
+            klass_known = known.get(t.__class__.__name__, None)
+            if klass_known:
+                d = sum(klass_known) / len(klass_known)
+            else:
+                d = default
+        return d
+
+    # Visit the tasks in reverse topological order, from the tasks nobody
+    # waits on up to the sources
+    waiting = dict([(t, len(rdeps[t])) for t in tasks])
+    deps = dict([(t, []) for t in tasks])
+    for t in tasks:
+        for r in rdeps[t]:
+            deps[r].append(t)
+    ordered = [t for t in tasks if waiting[t] == 0]
+    for t in ordered:
+        for d in deps[t]:
+            waiting[d] -= 1
+            if waiting[d] == 0:
+                ordered.append(d)
+
+    priorities = {}
+    for t in ordered:
+        downstream = [priorities[r] for r in rdeps[t]]
+        if downstream:
+            priorities[t] = _weight(t) + max(downstream)
+        else:
+            priorities[t] = _weight(t)
+    # Tasks within a cycle are never run anyway
+    for t in tasks:
+        if not t in priorities:
+            priorities[t] = _weight(t)
+    return priorities
+
+# Executors: how a task function is run once the task is known to be out of
+# date. The executor is chosen by the task class through its executor
+# attribute ("thread" or "process").
+class ThreadExecutor(object):
+    """Run tasks in the calling thread.
+
+    Suitable for tasks spending their time in subprocesses (compilers,
+    linkers, etc...)."""
+    def run(self, task):
+        task.run()
+
+    def close(self):
+        pass
+
+class _ProcessNode(object):
+    """Picklable stand-in for yaku.node.Node, giving the subset of the node
+    API available to tasks run in a process pool."""
+    def __init__(self, node):
+        self.name = node.name
+        self._abspath = node.abspath()
+        self._srcpath = node.srcpath()
+        self._bldpath = node.bldpath()
+
+    def abspath(self):
+        return self._abspath
+
+    def srcpath(self):
+        return self._srcpath
+
+    def bldpath(self):
+        return self._bldpath
+
+    def read(self, flags="r"):
+        fid = open(self._abspath, flags)
+        try:
+            return fid.read()
+        finally:
+            fid.close()
+
+    def write(self, data, flags="w"):
+        fid = open(self._abspath, flags)
+        try:
+            fid.write(data)
+        finally:
+            fid.close()
+
+class _ProcessTask(object):
+    """Picklable stand-in for a task, run in a process pool: only the
+    environment variables listed in env_vars are available."""
+    def __init__(self, task):
+        self.name = task.name
+        self.func = task.func
+        self.inputs = [_ProcessNode(n) for n in task.inputs]
+        self.outputs = [_ProcessNode(n) for n in task.outputs]
+        self.env_vars = task.env_vars
+        self.env = dict([(k, task.env[k]) for k in task.env_vars])
+
+    def run(self):
+        self.func(self)
+
+def _run_process_task(payload):
+    # Executed in the pool processes: exceptions are sent back as strings as
+    # they may not be picklable
+    try:
+        try:
+            task = _ProcessTask.__new__(_ProcessTask)
+            task.__dict__.update(loads(payload))
+            task.run()
+            return None
+        except yaku.errors.TaskRunFailure:
+            e = get_exception()
+            return (e.cmd, e.explain)
+        except Exception:
+            exc_type, exc_value, tb = sys.exc_info()
+            lines = traceback.format_exception(exc_type, exc_value, tb)
+            return ([], "".join(lines))
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+
+class ProcessPoolExecutor(object):
+    """Run pure python task functions in a pool of processes, to avoid
+    serializing them on the GIL.
+
+    The task function must be picklable (i.e. defined at the top level of a
+    module), and may only use the node API of _ProcessNode and the task
+    environment variables listed in env_vars. Tasks which cannot be sent to
+    the pool (unpicklable function or environment values) are run in the
+    calling thread instead. Each task is pickled once, by the executor, so
+    that this is checked for every task at no extra cost.
+
+    The pool is created when the executor is, so that the processes are
+    forked before the runner threads are started."""
+    def __init__(self, njobs):
+        self.njobs = njobs
+        self._pool = multiprocessing.Pool(njobs)
+
+    def run(self, task):
+        try:
+            payload = dumps(_ProcessTask(task).__dict__)
+        except Exception:
+            task.run()
+            return
+
+        error = self._pool.apply(_run_process_task, (payload,))
+        if error is not None:
+            cmd, msg = error
+            raise yaku.errors.TaskRunFailure(cmd, msg)
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+def create_executors(maxjobs=1, tasks=None):
+    """Return a dict mapping executor names to executor instances.
+
+    A process pool is only created if one of the given tasks uses the
+    process executor. This should be called from the main thread."""
+    executors = {"thread": ThreadExecutor()}
+    if tasks is None:
+        tasks = []
+    use_processes = [t for t in tasks if getattr(t, "executor", "thread") == "process"]
+    if maxjobs > 1 and use_processes and multiprocessing is not None:
+        executors["process"] = ProcessPoolExecutor(maxjobs)
+    else:
+        executors["process"] = executors["thread"]
+    return executors
+
+def _executor_run(executors, task):
+    executor = executors.get(getattr(task, "executor", "thread"), None)
+    if executor is None:
+        executor = executors["thread"]
+    return executor.run
+
+def _close_executors(executors):
+    for executor in executors.values():
+        executor.close()
+
 class SerialRunner(object):
     def __init__(self, ctx, task_manager):
         self.ctx = ctx
@@ -56,6 +278,7 @@ class ParallelRunner(object):
         self.error_out = queue.Queue()
         self.failure_lock = threading.Lock()
         self.stop = False
+        self.executors = create_executors(maxjobs, task_manager.tasks)
 
     def start(self):
         def _worker():
@@ -64,7 +287,7 @@ class ParallelRunner(object):
             while not self.stop:
                 task = self.worker_queue.get()
                 try:
-                    run_task(self.ctx, task)
+                    run_task(self.ctx, task, _executor_run(self.executors, task))
                 except yaku.errors.TaskRunFailure:
                     e = get_exception()
                     self.failure_lock.acquire()
@@ -91,6 +314,12 @@ class ParallelRunner(object):
             t.start()
 
     def run(self):
+        try:
+            self._run()
+        finally:
+            _close_executors(self.executors)
+
+    def _run(self):
         grp = self.task_manager.next_set()
         while grp:
             for task in grp:
@@ -109,3 +338,116 @@ class ParallelRunner(object):
                 raise yaku.errors.TaskRunFailure(cmd, msg)
 
             grp = self.task_manager.next_set()
+
+class DependencyRunner(object):
+    """Parallel runner without barriers between task groups.
+
+    Each task is put in a ready queue as soon as every task it depends on
+    (producers of its inputs and deps, and the classes in its before
+    attribute) has run. A slow task only delays the tasks which actually
+    need its outputs.
+
+    Idle workers take the ready task with the longest remaining dependency
+    chain first (see task_priorities), weighted by the task durations of
+    the previous builds, so that e.g. the link of a big extension does not
+    start last."""
+    def __init__(self, ctx, task_manager, maxjobs=1):
+        self.njobs = maxjobs
+        self.task_manager = task_manager
+        self.ctx = ctx
+
+        self.ready_queue = queue.PriorityQueue()
+        self.done_queue = queue.Queue()
+        self.executors = create_executors(maxjobs, task_manager.tasks)
+        self.priorities = {}
+        # Tie breaker for tasks of same priority, so that tasks themselves
+        # are never compared
+        self._count = 0
+
+    def _put(self, task):
+        self._count += 1
+        if task is None:
+            # Sentinels are sorted after every task
+            self.ready_queue.put((float("inf"), self._count, None))
+        else:
+            self.ready_queue.put((-self.priorities[task], self._count, task))
+
+    def start(self):
+        def _worker():
+            while True:
+                task = self.ready_queue.get()[2]
+                if task is None:
+                    break
+                try:
+                    run_task(self.ctx, task, _executor_run(self.executors, task))
+                    self.done_queue.put((task, None))
+                except yaku.errors.TaskRunFailure:
+                    e = get_exception()
+                    self.done_queue.put((task, (e.cmd, e.explain)))
+                except Exception:
+                    exc_type, exc_value, tb = sys.exc_info()
+                    lines = traceback.format_exception(exc_type, exc_value, tb)
+                    self.done_queue.put((task, ([], "".join(lines))))
+
+        for i in range(self.njobs):
+            t = threading.Thread(target=_worker)
+            t.setDaemon(True)
+            t.start()
+
+    def run(self):
+        tasks = self.task_manager.tasks
+        deps, rdeps = task_graph(tasks)
+        self.priorities = task_priorities(tasks, rdeps,
+                getattr(self.ctx, "task_durations", None))
+
+        missing = {}
+        initial = []
+        for t in tasks:
+            missing[t] = len(deps[t])
+            if missing[t] == 0:
+                initial.append(t)
+        # Workers are already waiting, so queue the initial tasks by
+        # decreasing priority
+        initial.sort(key=lambda t: -self.priorities[t])
+        running = 0
+        for t in initial:
+            self._put(t)
+            running += 1
+
+        done = 0
+        failure = None
+        try:
+            while running > 0:
+                task, error = self.done_queue.get()
+                running -= 1
+                done += 1
+                if error is not None:
+                    if failure is None:
+                        failure = error
+                        # Cancel tasks not yet picked up by a worker
+                        while True:
+                            try:
+                                self.ready_queue.get_nowait()
+                                running -= 1
+                            except queue.Empty:
+                                break
+                    continue
+                elif failure is not None:
+                    continue
+
+                for t in rdeps[task]:
+                    missing[t] -= 1
+                    if missing[t] == 0:
+                        self._put(t)
+                        running += 1
+        finally:
+            for i in range(self.njobs):
+                self._put(None)
+            _close_executors(self.executors)
+
+        if failure is not None:
+            cmd, msg = failure
+            raise yaku.errors.TaskRunFailure(cmd, msg)
+        if done < len(tasks):
+            remainder = [t for t in tasks if missing[t] > 0]
+            raise Exception("circular order constraint detected %r" % remainder)
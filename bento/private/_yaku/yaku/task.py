@@ -5,6 +5,7 @@ try:
 except ImportError:
     from md5 import md5
 import subprocess
+import time
 
 if sys.version_info[0] < 3:
     from cPickle \
@@ -20,7 +21,7 @@ from yaku.pprint \
         pprint
 from yaku.utils \
     import \
-        get_exception, is_string, function_code
+        get_exception, is_string, function_code, stat_signature, RACY_DELAY
 from yaku.errors \
     import \
         TaskRunFailure, WindowsError
@@ -48,9 +49,40 @@ def task_factory(name):
 
 base = _TaskFakeMetaclass('__task_base', (object,), {})
 
+def node_signature(node, node_sigs=None):
+    """Return the md5 digest of the given node content.
+
+    Parameters
+    ----------
+    node_sigs: dict or None
+        if given, maps node absolute paths to (stat signature, digest) pairs.
+        The content is only read and hashed again if the (mtime, size,
+        inode) signature of the file changed since it was recorded."""
+    if node_sigs is None:
+        return md5(node.read(flags="rb")).digest()
+
+    path = node.abspath()
+    st = os.stat(path)
+    stat_sig = stat_signature(st)
+    try:
+        old_stat_sig, digest = node_sigs[path]
+        if old_stat_sig == stat_sig:
+            return digest
+    except KeyError:
+        pass
+
+    digest = md5(node.read(flags="rb")).digest()
+    if st.st_mtime < time.time() - RACY_DELAY:
+        node_sigs[path] = (stat_sig, digest)
+    return digest
+
 class _Task(object):
     before = []
     after = []
+    # Executor running the task function in parallel builds: "thread" for
+    # functions spending their time in subprocesses, "process" for pure
+    # python, picklable functions (see yaku.scheduler)
+    executor = "thread"
     def __init__(self, outputs, inputs, func=None, deps=None, env=None, env_vars=None):
         if is_string(inputs):
             self.inputs = [inputs]
@@ -72,6 +104,12 @@ class _Task(object):
         self.scan = None
         self.disable_output = False
         self.log = None
+        # Whether the outputs may be taken from/stored into the build object
+        # cache (see yaku.objcache)
+        self.use_object_cache = False
+        # Execution details, for build traces
+        self.executed_cmd = None
+        self.object_cache_status = None
 
     # UID and signature functionalities
     #----------------------------------
@@ -85,29 +123,27 @@ class _Task(object):
             self.uid = m.digest()
         return self.uid
 
-    def signature(self):
+    def signature(self, node_sigs=None):
         if self.cache is None:
-            sig = self._signature()
+            sig = self._signature(node_sigs)
             self.cache = sig
             return sig
         else:
             return self.cache
 
-    def _signature(self):
+    def _signature(self, node_sigs=None):
         m = md5()
 
-        self._sig_explicit_deps(m)
+        self._sig_explicit_deps(m, node_sigs)
         for k in self.env_vars:
             m.update(dumps(self.env[k]))
         if self.func:
             m.update(function_code(self.func).co_code)
         return m.digest()
 
-    def _sig_explicit_deps(self, m):
+    def _sig_explicit_deps(self, m, node_sigs=None):
         for s in self.inputs + self.deps:
-            #if os.path.exists(s):
-            #    m.update(open(s).read())
-            m.update(s.read(flags="rb"))
+            m.update(node_signature(s, node_sigs))
         return m.digest()
         
     # execution
@@ -128,21 +164,32 @@ class _Task(object):
                 pprint('GREEN', "%-16s%s" % (self.name.upper(), " ".join([i.bldpath() for i in self.inputs])))
 
         self.gen.bld.set_cmd_cache(self, cmd)
+        self.executed_cmd = cmd
+
+        object_cache = None
+        if self.use_object_cache:
+            object_cache = getattr(self.gen.bld, "object_cache", None)
+        if object_cache is not None:
+            key = object_cache.key(self, cmd, getattr(self.gen.bld, "node_sigs", None))
+            stdout = object_cache.fetch(key, self.outputs)
+            if stdout is not None:
+                self.object_cache_status = "hit"
+                self._write_stdout(stdout)
+                return
+            self.object_cache_status = "miss"
+            # Outputs may be hardlinks to cache entries: never let the
+            # command overwrite them in place
+            for o in self.outputs:
+                if os.path.exists(o.abspath()):
+                    os.remove(o.abspath())
+
         try:
             p = subprocess.Popen(cmd, stdout=subprocess.PIPE,
                     stderr=subprocess.STDOUT, cwd=cwd, **kw)
             stdout = p.communicate()[0].decode("utf-8")
             if p.returncode:
                 raise TaskRunFailure(cmd, stdout)
-            if sys.version_info >= (3,):
-                stdout = stdout
-            else:
-                stdout = stdout.encode("utf-8")
-            if self.disable_output:
-                self.log.write(stdout)
-            else:
-                sys.stderr.write(stdout)
-            self.gen.bld.set_stdout_cache(self, stdout)
+            self._write_stdout(stdout)
         except OSError:
             e = get_exception()
             raise TaskRunFailure(cmd, str(e))
@@ -150,6 +197,22 @@ class _Task(object):
             e = get_exception()
             raise TaskRunFailure(cmd, str(e))
 
+        if object_cache is not None:
+            try:
+                object_cache.store(key, self.outputs, stdout)
+            except (IOError, OSError):
+                # Failing to fill the cache should never fail the build
+                pass
+
+    def _write_stdout(self, stdout):
+        if sys.version_info < (3,):
+            stdout = stdout.encode("utf-8")
+        if self.disable_output:
+            self.log.write(stdout)
+        else:
+            sys.stderr.write(stdout)
+        self.gen.bld.set_stdout_cache(self, stdout)
+
     def __repr__(self):
         ins = ",".join([i.name for i in self.inputs])
         outs = ",".join([i.name for i in self.outputs])
@@ -1,4 +1,5 @@
 import os
+import time
 
 from yaku.environment \
     import \
@@ -45,12 +46,29 @@ def hash_task(t):
     tup = tuple(ext_in + ext_out + t.before + t.after)
     return hash((t.__class__.__name__, tup))
 
+def _get_in(t):
+    return [os.path.splitext(s.name)[1] for s in t.inputs]
+
+def _get_out(t):
+    return [os.path.splitext(s.name)[1] for s in t.outputs]
+
+def _compare_exts(in1, out1, in2, out2):
+    for k in in1:
+        if k in out2:
+            return -1
+    for k in in2:
+        if k in out1:
+            return 1
+    return 0
+
 class TaskManager(object):
     def __init__(self, tasks):
         self.tasks = tasks
 
         self.groups = {}
         self.order = {}
+        self.in_degree = {}
+        self.ready = []
         self.make_groups()
         self.make_order()
 
@@ -60,24 +78,70 @@ class TaskManager(object):
         self.order[a].add(b)
 
     def make_order(self):
+        # Only groups related through a before constraint or through an
+        # extension produced by one and consumed by the other may be ordered,
+        # so we index groups by class name and by input/output extension
+        # instead of comparing every pair of groups.
         keys = list(self.groups.keys())
-        max = len(keys)
-        for i in range(max):
-            t1 = self.groups[keys[i]][0]
-            for j in range(i + 1, max):
-                t2 = self.groups[keys[j]][0]
-
-                if t2.__class__.__name__ in t1.before:
-                    self.set_order(keys[j], keys[i])
-                elif t1.__class__.__name__ in t2.before:
-                    self.set_order(keys[i], keys[j])
-                else:
-                    # add the constraints based on the comparisons
-                    val = self.compare_exts(t1, t2)
-                    if val > 0:
-                        self.set_order(keys[i], keys[j])
-                    elif val < 0:
-                        self.set_order(keys[j], keys[i])
+        position = {}
+        exts = {}
+        klass_to_keys = {}
+        producers = {}
+        consumers = {}
+        for i, k in enumerate(keys):
+            position[k] = i
+            t = self.groups[k][0]
+            ext_in, ext_out = _get_in(t), _get_out(t)
+            exts[k] = (ext_in, ext_out)
+            klass_to_keys.setdefault(t.__class__.__name__, []).append(k)
+            for e in ext_out:
+                producers.setdefault(e, set()).add(k)
+            for e in ext_in:
+                consumers.setdefault(e, set()).add(k)
+
+        pairs = set()
+        def _add_pair(a, b):
+            if a == b:
+                return
+            if position[a] < position[b]:
+                pairs.add((a, b))
+            else:
+                pairs.add((b, a))
+
+        for k in keys:
+            for name in self.groups[k][0].before:
+                for other in klass_to_keys.get(name, []):
+                    _add_pair(k, other)
+        for e, produced_by in producers.items():
+            for c in consumers.get(e, []):
+                for p in produced_by:
+                    _add_pair(p, c)
+
+        for ki, kj in pairs:
+            t1 = self.groups[ki][0]
+            t2 = self.groups[kj][0]
+
+            if t2.__class__.__name__ in t1.before:
+                self.set_order(kj, ki)
+            elif t1.__class__.__name__ in t2.before:
+                self.set_order(ki, kj)
+            else:
+                # add the constraints based on the comparisons
+                val = _compare_exts(exts[ki][0], exts[ki][1], exts[kj][0], exts[kj][1])
+                if val > 0:
+                    self.set_order(ki, kj)
+                elif val < 0:
+                    self.set_order(kj, ki)
+
+        # Kahn-style release: a group is ready once all its predecessors
+        # have been handed out by next_set
+        in_degree = self.in_degree
+        for k in keys:
+            in_degree[k] = 0
+        for successors in self.order.values():
+            for k in successors:
+                in_degree[k] += 1
+        self.ready = [k for k in keys if in_degree[k] == 0]
 
     def make_groups(self):
         # XXX: we assume tasks with same input/output suffix can run
@@ -91,75 +155,132 @@ class TaskManager(object):
                 groups[h] = [t]
 
     def next_set(self):
-        keys = self.groups.keys()
-
-        unconnected = []
-        remainder = []
-
-        for u in keys:
-            for k in self.order.values():
-                if u in k:
-                    remainder.append(u)
-                    break
-            else:
-                unconnected.append(u)
+        ready = self.ready
+        self.ready = []
 
         toreturn = []
-        for y in unconnected:
-            toreturn.extend(self.groups[y])
-
-        # remove stuff only after
-        for y in unconnected:
-                try:
-                    self.order.__delitem__(y)
-                except KeyError:
-                    pass
-                self.groups.__delitem__(y)
+        for k in ready:
+            toreturn.extend(self.groups.pop(k))
+            for successor in self.order.pop(k, []):
+                self.in_degree[successor] -= 1
+                if self.in_degree[successor] == 0:
+                    self.ready.append(successor)
 
-        if not toreturn and remainder:
-            raise Exception("circular order constraint detected %r" % remainder)
+        if not toreturn and self.groups:
+            raise Exception("circular order constraint detected %r" % list(self.groups.keys()))
 
         return toreturn
 
-
     def compare_exts(self, t1, t2):
         "extension production"
-        def _get_in(t):
-            return [os.path.splitext(s.name)[1] for s in t.inputs]
-        def _get_out(t):
-            return [os.path.splitext(s.name)[1] for s in t.outputs]
-
-        in_ = _get_in(t1)
-        out_ = _get_out(t2)
-        for k in in_:
-            if k in out_:
-                return -1
-        in_ = _get_in(t2)
-        out_ = _get_out(t1)
-        for k in in_:
-            if k in out_:
-                return 1
-        return 0
-
-def run_task(ctx, task):
+        return _compare_exts(_get_in(t1), _get_out(t1), _get_in(t2), _get_out(t2))
+
+def task_graph(tasks):
+    """Compute the task-level dependency graph of the given tasks.
+
+    A task depends on every task producing one of its inputs or deps, and on
+    every task whose class name is listed in its before attribute.
+
+    Returns
+    -------
+    deps: dict
+        deps[t] is the set of tasks which need to be run before t
+    rdeps: dict
+        rdeps[t] is the set of tasks waiting on t
+    """
+    producers = {}
+    klasses = {}
+    for t in tasks:
+        for o in t.outputs:
+            producers[o] = t
+        klass = t.__class__.__name__
+        if klass in klasses:
+            klasses[klass].append(t)
+        else:
+            klasses[klass] = [t]
+
+    deps = {}
+    rdeps = {}
+    for t in tasks:
+        deps[t] = set()
+        rdeps[t] = set()
+    for t in tasks:
+        for n in t.inputs + t.deps:
+            p = producers.get(n, None)
+            if p is not None and p is not t:
+                deps[t].add(p)
+                rdeps[p].add(t)
+        klass = t.__class__.__name__
+        for name in t.before:
+            # before is shared between task classes, so a class may find
+            # its own name there
+            if name == klass:
+                continue
+            for p in klasses.get(name, []):
+                deps[t].add(p)
+                rdeps[p].add(t)
+    return deps, rdeps
+
+def run_task(ctx, task, run=None):
+    """Run the given task if it is out of date.
+
+    run, if given, is called with the task to execute it instead of
+    task.run (see the executors in yaku.scheduler)."""
+    # Only the build context keeps a persistent node signature cache
+    node_sigs = getattr(ctx, "node_sigs", None)
+    task_durations = getattr(ctx, "task_durations", None)
+    tracer = getattr(ctx, "tracer", None)
+    start = time.time()
+    timings = {"signature": 0.0}
+
+    def _signature(t):
+        t0 = time.time()
+        try:
+            return t.signature(node_sigs)
+        finally:
+            timings["signature"] += time.time() - t0
+
     def _run(t):
-        t.run()
-        ctx.cache[tuid] = t.signature()
+        t0 = time.time()
+        if run is None:
+            t.run()
+        else:
+            run(t)
+        timings["executed"] = True
+        if task_durations is not None:
+            task_durations[tuid] = time.time() - t0
+        ctx.cache[tuid] = _signature(t)
+
+    # Implicit dependencies (e.g. included headers) are only looked for
+    # right before the task signature is needed
+    if task.scan is not None:
+        task.deps.extend(task.scan())
+        task.scan = None
 
     tuid = task.get_uid()
-    # XXX: there may be a better way to do this without stating output
-    # (we want to know if the task has already been executed in a
-    # previous run)
-    for o in task.outputs:
-        if not os.path.exists(o.abspath()):
-            _run(task)
-            break
-    if not tuid in ctx.cache:
-        _run(task)
-    else:
-        sig = task.signature()
-        if sig != ctx.cache[tuid]:
+    try:
+        # XXX: there may be a better way to do this without stating output
+        # (we want to know if the task has already been executed in a
+        # previous run)
+        for o in task.outputs:
+            if not os.path.exists(o.abspath()):
+                _run(task)
+                break
+        if not tuid in ctx.cache:
             _run(task)
+        else:
+            sig = _signature(task)
+            if sig != ctx.cache[tuid]:
+                _run(task)
+    finally:
+        if tracer is not None:
+            args = {"executed": timings.get("executed", False),
+                    "signature_time": timings["signature"]}
+            if task.executed_cmd is not None:
+                args["command"] = " ".join([str(c) for c in task.executed_cmd])
+            if task.object_cache_status is not None:
+                args["object_cache"] = task.object_cache_status
+            tracer.add_task(task, start, time.time(), args)
 
 def build_dag(tasks):
     # Build dependency graph (DAG)
@@ -234,6 +355,9 @@ class CompiledTaskGen(TaskGen):
         self.object_tasks = []
         self.link_task = None
         self.has_cxx = False
+        # include directories (absolute paths) scanned for header
+        # dependencies
+        self.scan_cpppath = []
 
     def add_objects(self, tasks):
         """Add new object tasks, assuming the link task has already
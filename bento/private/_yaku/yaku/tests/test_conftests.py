@@ -0,0 +1,195 @@
+import re
+import sys
+import unittest
+
+if sys.version_info[0] < 3:
+    from cStringIO \
+        import \
+            StringIO
+else:
+    from io \
+        import \
+            StringIO
+
+from yaku.tests.test_helpers \
+    import \
+        TmpContextBase
+from yaku.context \
+    import \
+        get_cfg
+from yaku.conftests \
+    import \
+        CheckBatch, check_header, check_func, check_type_size, check_lib, \
+        check_funcs_at_once, define
+from yaku.conftests.conftests \
+    import \
+        _check_funcs_at_once
+import yaku.conftests.batch
+
+def _declare_checks(checks):
+    checks.check_header("stdio.h")
+    checks.check_header("yaku_nonexisting_header.h")
+    checks.check_func("floor", libs=["m"])
+    # Same build directory as the previous check
+    checks.check_func("floor")
+    checks.check_type_size("long")
+    checks.check_lib(["m"], "exp")
+    checks.define("YAKU_FOO", 1)
+
+class _SerialChecks(object):
+    def __init__(self, conf):
+        self.conf = conf
+        self.results = []
+
+    def __getattr__(self, name):
+        func = {"check_header": check_header, "check_func": check_func,
+                "check_type_size": check_type_size, "check_lib": check_lib,
+                "define": define}[name]
+        def _check(*a, **kw):
+            self.results.append(func(self.conf, *a, **kw))
+        return _check
+
+class _FakeConf(object):
+    def __init__(self):
+        self.conf_results = []
+        self.messages = []
+
+    def start_message(self, msg):
+        self.messages.append(msg)
+
+    def end_message(self, msg):
+        self.messages.append(msg)
+
+def _fake_funcs_at_once(funcs, missing):
+    """Run the bisecting check_funcs_at_once with a fake linker, which fails
+    whenever one of the missing functions is used. Return the results and the
+    number of links."""
+    conf = _FakeConf()
+    check = _check_funcs_at_once(conf, funcs, bisect=True)
+    n_links = 0
+    item = next(check)
+    while not isinstance(item, dict):
+        n_links += 1
+        used = re.findall(r"char (\w+)\(\);", item.body)
+        item = check.send(not set(used).intersection(missing))
+    return item, n_links, conf
+
+class TestCheckFuncsAtOnce(TmpContextBase):
+    def test_bisect(self):
+        funcs = ["func%d" % i for i in range(100)]
+        for missing in [[], ["func42"], ["func0", "func99"], ["func3", "func4", "func50"]]:
+            results, n_links, conf = _fake_funcs_at_once(funcs, missing)
+            self.assertEqual(results, dict([(f, f not in missing) for f in funcs]))
+            self.assertEqual([r["value"] for r in conf.conf_results], funcs)
+            self.assertEqual([r["result"] for r in conf.conf_results],
+                             [f not in missing for f in funcs])
+            if missing:
+                self.assertTrue(n_links <= 1 + 2 * len(missing) * 7)
+            else:
+                self.assertEqual(n_links, 1)
+
+    def test_empty(self):
+        results, n_links, conf = _fake_funcs_at_once([], [])
+        self.assertEqual(results, {})
+        self.assertEqual(n_links, 0)
+        self.assertEqual(conf.conf_results, [])
+
+    def test_toolchain_failure(self):
+        # Nothing links: every function is reported as missing
+        funcs = ["foo", "bar", "fubar"]
+        conf = _FakeConf()
+        check = _check_funcs_at_once(conf, funcs, bisect=True)
+        item = next(check)
+        while not isinstance(item, dict):
+            item = check.send(False)
+        self.assertEqual(item, dict([(f, False) for f in funcs]))
+        self.assertEqual(conf.messages[-1], "no !")
+
+    def test_messages(self):
+        funcs = ["foo", "bar", "fubar"]
+        conf = _fake_funcs_at_once(funcs, ["bar"])[2]
+        self.assertEqual(conf.messages, ["Checking for functions foo, bar, fubar",
+                                         "no (missing: bar)"])
+        conf = _fake_funcs_at_once(funcs, funcs)[2]
+        self.assertEqual(conf.messages[-1], "no !")
+
+    def test_link(self):
+        conf = get_cfg()
+        try:
+            try:
+                conf.use_tools(["ctasks"])
+            except Exception:
+                raise unittest.SkipTest("No working C compiler")
+            if not conf.builders["ctasks"].configured:
+                raise unittest.SkipTest("No working C compiler")
+            funcs = ["floor", "yaku_nonexisting_func", "exp"]
+            self.assertFalse(check_funcs_at_once(conf, funcs, libs=["m"]))
+            self.assertEqual(check_funcs_at_once(conf, funcs, libs=["m"], bisect=True),
+                             {"floor": True, "yaku_nonexisting_func": False, "exp": True})
+        finally:
+            conf.log.close()
+
+class TestCheckBatch(TmpContextBase):
+    def setUp(self):
+        super(TestCheckBatch, self).setUp()
+        self.old_output = yaku.conftests.batch._OUTPUT
+        yaku.conftests.batch._OUTPUT = StringIO()
+
+    def tearDown(self):
+        yaku.conftests.batch._OUTPUT = self.old_output
+        super(TestCheckBatch, self).tearDown()
+
+    def _configure(self):
+        conf = get_cfg()
+        try:
+            conf.use_tools(["ctasks"])
+        except Exception:
+            conf.log.close()
+            raise unittest.SkipTest("No working C compiler")
+        if not conf.builders["ctasks"].configured:
+            conf.log.close()
+            raise unittest.SkipTest("No working C compiler")
+        return conf
+
+    def _log(self, conf):
+        conf.log.close()
+        fid = open(conf.log.name)
+        try:
+            log = fid.read()
+        finally:
+            fid.close()
+        # Only keep the log of the checks, without the per-run build
+        # directory names
+        log = log[log.index("Checking for header stdio.h"):]
+        return re.sub(r"\.conf-\w+--?\d+", ".conf", log)
+
+    def test_same_as_serial(self):
+        conf = self._configure()
+        serial = _SerialChecks(conf)
+        _declare_checks(serial)
+        serial_results = conf.conf_results
+        serial_log = self._log(conf)
+
+        for jobs in [1, 4]:
+            conf = self._configure()
+            batch = CheckBatch(conf)
+            _declare_checks(batch)
+            results = batch.run(jobs=jobs)
+
+            self.assertEqual(results, serial.results)
+            self.assertEqual(conf.conf_results, serial_results)
+            self.assertEqual(self._log(conf), serial_log)
+
+        self.assertEqual(results[:3], [True, False, True])
+
+    def test_messages_order(self):
+        conf = self._configure()
+        batch = CheckBatch(conf)
+        for header in ["stdio.h", "yaku_nonexisting_header.h", "stdlib.h"]:
+            batch.check_header(header)
+        self.assertEqual(batch.run(jobs=3), [True, False, True])
+        self.assertEqual(yaku.conftests.batch._OUTPUT.getvalue(),
+                         "Checking for header stdio.h... yes\n"
+                         "Checking for header yaku_nonexisting_header.h... no !\n"
+                         "Checking for header stdlib.h... yes\n")
+        conf.log.close()
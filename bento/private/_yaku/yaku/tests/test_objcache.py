@@ -0,0 +1,127 @@
+import os
+import sys
+import time
+
+from yaku.tests.test_helpers \
+    import \
+        TmpContextBase
+from yaku.context \
+    import \
+        get_cfg, get_bld
+from yaku.task \
+    import \
+        task_factory
+from yaku.task_manager \
+    import \
+        TaskGen
+from yaku.objcache \
+    import \
+        ObjectCache
+
+import yaku.utils
+
+# Fake compiler: copy the source into the target, and count invocations
+_COMPILE = """\
+import sys
+open(sys.argv[2], "w").write(open(sys.argv[1]).read())
+open(sys.argv[3], "a").write("x")
+"""
+
+class TestObjectCache(TmpContextBase):
+    def setUp(self):
+        super(TestObjectCache, self).setUp()
+        ctx = get_cfg()
+        ctx.store()
+        self.bld = get_bld()
+        self.cache = ObjectCache(os.path.join(self.d, "objcache"))
+        self.bld.object_cache = self.cache
+
+        self.counter = os.path.join(self.d, "counter")
+        self.source = self.bld.src_root.make_node("foo.c")
+        self.source.write("int foo;")
+
+    def _make_task(self, target_name="foo.o"):
+        target = self.bld.bld_root.make_node(target_name)
+        def func(task):
+            cmd = [sys.executable, "-c", _COMPILE, task.inputs[0].abspath(),
+                   task.outputs[0].abspath(), self.counter]
+            task.exec_command(cmd, None)
+        task = task_factory("objcache_cc")(inputs=[self.source], outputs=[target],
+                                           func=func, env={"VERBOSE": False, "ENV": None})
+        task.env_vars = []
+        task.gen = TaskGen("objcache", self.bld, [self.source], "foo")
+        task.use_object_cache = True
+        return task
+
+    def _compile_count(self):
+        if not os.path.exists(self.counter):
+            return 0
+        return len(open(self.counter).read())
+
+    def test_hit(self):
+        task = self._make_task()
+        task.run()
+        self.assertEqual(self._compile_count(), 1)
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 1))
+
+        os.remove(task.outputs[0].abspath())
+        task = self._make_task()
+        task.run()
+        self.assertEqual(self._compile_count(), 1)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+        self.assertEqual(task.outputs[0].read(), "int foo;")
+
+    def test_compiler_identity(self):
+        # Compiler upgraded in place: same command line, different key
+        compiler = os.path.join(self.d, "cc")
+        open(compiler, "w").write("old")
+        task = self._make_task()
+        try:
+            key = self.cache.key(task, [compiler, "foo.c"])
+            open(compiler, "w").write("new version")
+            yaku.utils._PROGRAM_IDENTITIES.clear()
+            self.assertNotEqual(self.cache.key(task, [compiler, "foo.c"]), key)
+        finally:
+            yaku.utils._PROGRAM_IDENTITIES.clear()
+
+    def test_other_location(self):
+        # Outputs paths are not part of the key
+        self._make_task("foo.o").run()
+        self._make_task("bar.o").run()
+        self.assertEqual(self._compile_count(), 1)
+        self.assertEqual(self.bld.bld_root.make_node("bar.o").read(), "int foo;")
+
+    def test_modified_source(self):
+        self._make_task().run()
+        self.source.write("int bar;")
+        task = self._make_task()
+        task.run()
+        self.assertEqual(self._compile_count(), 2)
+        self.assertEqual(task.outputs[0].read(), "int bar;")
+
+    def test_disabled(self):
+        self.bld.object_cache = None
+        self._make_task().run()
+        self._make_task().run()
+        self.assertEqual(self._compile_count(), 2)
+
+    def test_trim(self):
+        self._make_task().run()
+        self.source.write("int bar;")
+        self._make_task().run()
+
+        entries = []
+        for prefix in os.listdir(self.cache.directory):
+            for key in os.listdir(os.path.join(self.cache.directory, prefix)):
+                entries.append(os.path.join(self.cache.directory, prefix, key))
+        self.assertEqual(len(entries), 2)
+        # Make the first entry the least recently used one
+        t = time.time() - 3600
+        for e in entries:
+            t += 1
+            os.utime(os.path.join(e, "stdout"), (t, t))
+
+        self.cache.max_size = 9
+        self.cache.trim()
+        self.assertFalse(os.path.exists(entries[0]))
+        self.assertTrue(os.path.exists(entries[1]))
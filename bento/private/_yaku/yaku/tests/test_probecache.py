@@ -0,0 +1,118 @@
+import os
+import unittest
+
+from yaku.tests.test_helpers \
+    import \
+        TmpContextBase
+from yaku.context \
+    import \
+        get_cfg
+from yaku.conftests \
+    import \
+        check_header, check_func
+from yaku.probecache \
+    import \
+        ProbeCache, main
+
+class TestProbeCache(TmpContextBase):
+    def setUp(self):
+        super(TestProbeCache, self).setUp()
+        self.cache_dir = os.path.join(self.d, "probecache")
+
+    def _configure(self, build_path):
+        conf = get_cfg(build_path=build_path)
+        conf.probe_cache = ProbeCache(self.cache_dir)
+        try:
+            conf.use_tools(["ctasks"])
+        except Exception:
+            conf.log.close()
+            raise unittest.SkipTest("No working C compiler")
+        if not conf.builders["ctasks"].configured:
+            conf.log.close()
+            raise unittest.SkipTest("No working C compiler")
+        return conf
+
+    def _checks(self, conf):
+        try:
+            return [check_header(conf, "stdio.h"),
+                    check_header(conf, "yaku_nonexisting_header.h"),
+                    check_func(conf, "floor", libs=["m"])]
+        finally:
+            conf.log.close()
+
+    def test_shared_between_build_directories(self):
+        conf = self._configure("build1")
+        results = self._checks(conf)
+        self.assertEqual(results, [True, False, True])
+        self.assertEqual(conf.probe_cache.hits, 0)
+        n_probes = conf.probe_cache.misses
+
+        conf = self._configure("build2")
+        self.assertEqual(self._checks(conf), results)
+        self.assertEqual(conf.probe_cache.hits, n_probes)
+        self.assertEqual(conf.probe_cache.misses, 0)
+        self.assertTrue("(cached)" in open(conf.log.name).read())
+
+    def test_flags_change(self):
+        conf = self._configure("build1")
+        self._checks(conf)
+
+        conf = self._configure("build2")
+        hits = conf.probe_cache.hits
+        conf.env["CFLAGS"].append("-DYAKU_PROBE_CACHE_TEST")
+        self._checks(conf)
+        self.assertEqual(conf.probe_cache.hits, hits)
+
+    def test_clear(self):
+        conf = self._configure("build1")
+        self._checks(conf)
+        self.assertTrue(os.listdir(self.cache_dir))
+
+        self.assertEqual(main(["clear", self.cache_dir]), 0)
+        self.assertFalse(os.path.exists(self.cache_dir))
+
+        conf = self._configure("build2")
+        self._checks(conf)
+        self.assertEqual(conf.probe_cache.hits, 0)
+
+    def test_toolchain_checks(self):
+        conf = self._configure("build1")
+        conf.log.close()
+        self.assertFalse("(cached)" in open(conf.log.name).read())
+
+        conf = self._configure("build2")
+        conf.log.close()
+        log = open(conf.log.name).read()
+        self.assertTrue("toolchain works" in log and "(cached)" in log)
+        self.assertFalse("can build objects" in log)
+        self.assertEqual(conf.env["cc_type"], "gcc")
+
+    def test_memoize(self):
+        cache = ProbeCache(self.cache_dir)
+        calls = []
+        def detect():
+            calls.append(True)
+            return {"CC": ["gcc"], "SO": None}
+
+        for i in range(2):
+            self.assertEqual(cache.memoize("detect", [], ["default"], detect),
+                             {"CC": ["gcc"], "SO": None})
+        self.assertEqual(len(calls), 1)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+        cache.memoize("detect", [], ["unix"], detect)
+        self.assertEqual(len(calls), 2)
+
+        old = os.environ.get("CFLAGS")
+        os.environ["CFLAGS"] = "-DYAKU_PROBE_CACHE_TEST"
+        try:
+            cache.memoize("detect", [], ["default"], detect)
+        finally:
+            if old is None:
+                del os.environ["CFLAGS"]
+            else:
+                os.environ["CFLAGS"] = old
+        self.assertEqual(len(calls), 3)
+
+    def test_usage(self):
+        self.assertEqual(main(["remove", self.cache_dir]), 2)
@@ -0,0 +1,101 @@
+import os
+import unittest
+
+try:
+    import lib2to3
+    _HAS_LIB2TO3 = True
+except ImportError:
+    _HAS_LIB2TO3 = False
+
+from yaku.tests.test_helpers \
+    import \
+        TmpContextBase
+from yaku.tools.python_2to3 \
+    import \
+        convert_file, default_fixers
+
+_SOURCE = """\
+def f(d):
+    print "keys", d.keys()
+"""
+
+class TestConvertFile(TmpContextBase):
+    def setUp(self):
+        if not _HAS_LIB2TO3:
+            raise unittest.SkipTest("lib2to3 not available")
+        super(TestConvertFile, self).setUp()
+        self.filename = os.path.join(self.d, "foo.py")
+        fid = open(self.filename, "w")
+        try:
+            fid.write(_SOURCE)
+        finally:
+            fid.close()
+        self.cache_dir = os.path.join(self.d, "cache")
+
+    def _cache_entries(self):
+        entries = []
+        for root, dirs, files in os.walk(self.cache_dir):
+            entries.extend(files)
+        return entries
+
+    def test_convert(self):
+        converted = convert_file(self.filename, default_fixers())
+        self.assertEqual(converted.decode("ascii"), """\
+def f(d):
+    print("keys", list(d.keys()))
+""")
+
+    def test_encoding(self):
+        fid = open(self.filename, "wb")
+        try:
+            fid.write(b"# -*- coding: latin-1 -*-\nprint '\xe9'\n")
+        finally:
+            fid.close()
+        converted = convert_file(self.filename, default_fixers())
+        self.assertEqual(converted, b"# -*- coding: latin-1 -*-\nprint('\xe9')\n")
+
+    def test_nofix(self):
+        converted = convert_file(self.filename, default_fixers(["dict"]))
+        self.assertTrue("list(d.keys())" not in converted.decode("ascii"))
+
+    def test_cache(self):
+        fixers = default_fixers()
+        converted = convert_file(self.filename, fixers, self.cache_dir)
+        self.assertEqual(len(self._cache_entries()), 1)
+
+        self.assertEqual(convert_file(self.filename, fixers, self.cache_dir), converted)
+        self.assertEqual(len(self._cache_entries()), 1)
+
+        # Different fixers set -> different entry
+        convert_file(self.filename, default_fixers(["dict"]), self.cache_dir)
+        self.assertEqual(len(self._cache_entries()), 2)
+
+    def _write(self, filename, content):
+        if not os.path.exists(os.path.dirname(filename)):
+            os.makedirs(os.path.dirname(filename))
+        fid = open(filename, "w")
+        try:
+            fid.write(content)
+        finally:
+            fid.close()
+
+    def test_cache_local_import(self):
+        # 'import bar' is only a local import in the package containing bar
+        fixers = default_fixers()
+        for name in ["pkg/__init__.py", "pkg/bar.py", "other/__init__.py"]:
+            self._write(os.path.join(self.d, name), "")
+        for name in ["pkg/foo.py", "other/foo.py"]:
+            self._write(os.path.join(self.d, name), "import bar\n")
+
+        converted = convert_file(os.path.join(self.d, "pkg", "foo.py"), fixers,
+                                 self.cache_dir, self.d)
+        self.assertEqual(converted, b"from . import bar\n")
+        converted = convert_file(os.path.join(self.d, "other", "foo.py"), fixers,
+                                 self.cache_dir, self.d)
+        self.assertEqual(converted, b"import bar\n")
+
+        # Adding a sibling module changes the conversion
+        self._write(os.path.join(self.d, "other", "bar.py"), "")
+        converted = convert_file(os.path.join(self.d, "other", "foo.py"), fixers,
+                                 self.cache_dir, self.d)
+        self.assertEqual(converted, b"from . import bar\n")
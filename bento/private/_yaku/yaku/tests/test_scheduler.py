@@ -0,0 +1,247 @@
+import os
+import threading
+import time
+
+from yaku.tests.test_helpers \
+    import \
+        TmpContextBase
+from yaku.context \
+    import \
+        create_top_nodes
+from yaku.task \
+    import \
+        task_factory
+from yaku.task_manager \
+    import \
+        TaskManager, task_graph
+from yaku.scheduler \
+    import \
+        SerialRunner, ParallelRunner, DependencyRunner, ProcessPoolExecutor, \
+        task_priorities, create_executors
+from yaku.errors \
+    import \
+        TaskRunFailure
+from yaku.utils \
+    import \
+        get_exception
+
+def _write_pid(task):
+    task.outputs[0].write(str(os.getpid()))
+
+def _fail(task):
+    raise TaskRunFailure(["fail"], "failed in %s" % task.name)
+
+class FakeContext(object):
+    def __init__(self):
+        self.cache = {}
+
+class SchedulerTestBase(TmpContextBase):
+    def setUp(self):
+        super(SchedulerTestBase, self).setUp()
+        self.src_root, self.bld_root = create_top_nodes(self.d, os.path.join(self.d, "build"))
+        self.ctx = FakeContext()
+        self.lock = threading.Lock()
+        self.executed = []
+
+    def _make_task(self, name, inputs, outputs, func=None):
+        def _func(task):
+            self.lock.acquire()
+            try:
+                self.executed.append(task)
+            finally:
+                self.lock.release()
+            for o in task.outputs:
+                o.write("")
+        if func is None:
+            func = _func
+        task = task_factory(name)(inputs=inputs, outputs=outputs, func=func, env={})
+        task.env_vars = []
+        return task
+
+    def _make_chains(self, n):
+        # n independent source -> object -> library chains
+        tasks = []
+        for i in range(n):
+            src = self.src_root.make_node("src%d.c" % i)
+            src.write("")
+            obj = self.bld_root.make_node("src%d.o" % i)
+            lib = self.bld_root.make_node("src%d.so" % i)
+            tasks.append(self._make_task("sched_cc", [src], [obj]))
+            tasks.append(self._make_task("sched_link", [obj], [lib]))
+        return tasks
+
+    def _run(self, runner_klass, tasks, *a):
+        runner = runner_klass(self.ctx, TaskManager(tasks), *a)
+        runner.start()
+        runner.run()
+
+class TestTaskGraph(SchedulerTestBase):
+    def test_node_dependencies(self):
+        tasks = self._make_chains(2)
+        deps, rdeps = task_graph(tasks)
+        self.assertEqual(deps[tasks[0]], set())
+        self.assertEqual(deps[tasks[1]], set([tasks[0]]))
+        self.assertEqual(rdeps[tasks[2]], set([tasks[3]]))
+        self.assertEqual(deps[tasks[3]], set([tasks[2]]))
+
+    def test_before_constraint(self):
+        first = task_factory("sched_first")
+        second = task_factory("sched_second")
+        second.before = [first.__name__]
+        try:
+            a = self.src_root.make_node("a")
+            b = self.src_root.make_node("b")
+            t1 = first(inputs=[], outputs=[a])
+            t2 = second(inputs=[], outputs=[b])
+            deps, rdeps = task_graph([t2, t1])
+            self.assertEqual(deps[t2], set([t1]))
+            self.assertEqual(deps[t1], set())
+        finally:
+            del second.before
+
+class TestTaskPriorities(SchedulerTestBase):
+    def test_no_history(self):
+        tasks = self._make_chains(2)
+        deps, rdeps = task_graph(tasks)
+        priorities = task_priorities(tasks, rdeps)
+        self.assertEqual(priorities[tasks[0]], 2)
+        self.assertEqual(priorities[tasks[1]], 1)
+
+    def test_history(self):
+        tasks = self._make_chains(2)
+        deps, rdeps = task_graph(tasks)
+        durations = {tasks[0].get_uid(): 1.0, tasks[1].get_uid(): 10.0,
+                     tasks[2].get_uid(): 3.0}
+        priorities = task_priorities(tasks, rdeps, durations)
+        self.assertEqual(priorities[tasks[0]], 11.0)
+        self.assertEqual(priorities[tasks[1]], 10.0)
+        # Unknown link duration: mean of the known link durations
+        self.assertEqual(priorities[tasks[3]], 10.0)
+        self.assertEqual(priorities[tasks[2]], 13.0)
+
+class TestDependencyRunner(SchedulerTestBase):
+    def test_simple(self):
+        tasks = self._make_chains(10)
+        self._run(DependencyRunner, tasks, 4)
+
+        self.assertEqual(len(self.executed), len(tasks))
+        for i in range(0, len(tasks), 2):
+            self.assertTrue(self.executed.index(tasks[i]) < self.executed.index(tasks[i+1]))
+
+    def test_no_barrier(self):
+        # A slow chain should not prevent the link step of the fast chains
+        # from running
+        tasks = self._make_chains(3)
+        def _slow(task):
+            time.sleep(0.5)
+            self.executed.append(task)
+            task.outputs[0].write("")
+        tasks[0].func = _slow
+        self._run(DependencyRunner, tasks, 2)
+
+        self.assertEqual(len(self.executed), len(tasks))
+        self.assertTrue(self.executed.index(tasks[3]) < self.executed.index(tasks[0]))
+        self.assertTrue(self.executed.index(tasks[5]) < self.executed.index(tasks[0]))
+
+    def test_failure(self):
+        tasks = self._make_chains(2)
+        def _fail(task):
+            raise TaskRunFailure(["cc"], "failed")
+        tasks[0].func = _fail
+        self.assertRaises(TaskRunFailure, lambda: self._run(DependencyRunner, tasks, 2))
+        self.assertTrue(tasks[1] not in self.executed)
+
+    def test_same_as_serial(self):
+        tasks = self._make_chains(5)
+        self._run(SerialRunner, tasks)
+        serial = set(self.executed)
+
+        self.executed = []
+        self.ctx = FakeContext()
+        self._run(DependencyRunner, tasks, 3)
+        self.assertEqual(set(self.executed), serial)
+
+    def test_priorities(self):
+        # With a single worker, the chain known to be the longest is started
+        # first
+        tasks = self._make_chains(3)
+        self.ctx.task_durations = dict([(t.get_uid(), 1.0) for t in tasks])
+        self.ctx.task_durations[tasks[5].get_uid()] = 10.0
+        self._run(DependencyRunner, tasks, 1)
+        self.assertEqual(self.executed[0], tasks[4])
+
+    def test_record_durations(self):
+        tasks = self._make_chains(2)
+        self.ctx.task_durations = {}
+        self._run(DependencyRunner, tasks, 2)
+        self.assertEqual(set(self.ctx.task_durations.keys()),
+                         set([t.get_uid() for t in tasks]))
+
+class TestExecutors(SchedulerTestBase):
+    def _make_pid_tasks(self, n, func=_write_pid):
+        tasks = []
+        for i in range(n):
+            out = self.bld_root.make_node("pid%d" % i)
+            task = self._make_task("sched_pid", [], [out], func)
+            task.executor = "process"
+            tasks.append(task)
+        return tasks
+
+    def _pids(self, tasks):
+        return set([int(t.outputs[0].read()) for t in tasks])
+
+    def test_process(self):
+        for klass in [DependencyRunner, ParallelRunner]:
+            tasks = self._make_pid_tasks(4)
+            self.ctx = FakeContext()
+            self._run(klass, tasks, 2)
+            pids = self._pids(tasks)
+            self.assertTrue(os.getpid() not in pids)
+
+    def test_unpicklable(self):
+        # Functions which cannot be sent to the pool are run in the calling
+        # process
+        def _func(task):
+            task.outputs[0].write(str(os.getpid()))
+        tasks = self._make_pid_tasks(2, _func)
+        self._run(DependencyRunner, tasks, 2)
+        self.assertEqual(self._pids(tasks), set([os.getpid()]))
+
+    def test_create_executors(self):
+        # The pool is only created (in the calling thread) when needed
+        executors = create_executors(2, self._make_chains(1))
+        self.assertTrue(executors["process"] is executors["thread"])
+
+        executors = create_executors(2, self._make_pid_tasks(1))
+        try:
+            self.assertTrue(isinstance(executors["process"], ProcessPoolExecutor))
+        finally:
+            executors["process"].close()
+
+    def test_unpicklable_env(self):
+        # Tasks of the same class and function may carry different
+        # environments: only the unpicklable one runs in the calling process
+        tasks = self._make_pid_tasks(2)
+        for task in tasks:
+            task.env_vars = ["VALUE"]
+        tasks[0].env = {"VALUE": 1}
+        tasks[1].env = {"VALUE": lambda: 1}
+        executor = ProcessPoolExecutor(2)
+        try:
+            for task in tasks:
+                executor.run(task)
+        finally:
+            executor.close()
+        pids = [int(t.outputs[0].read()) for t in tasks]
+        self.assertNotEqual(pids[0], os.getpid())
+        self.assertEqual(pids[1], os.getpid())
+
+    def test_process_failure(self):
+        tasks = self._make_pid_tasks(1, _fail)
+        try:
+            self._run(DependencyRunner, tasks, 2)
+            self.fail("TaskRunFailure not raised")
+        except TaskRunFailure:
+            e = get_exception()
+            self.assertEqual(e.cmd, ["fail"])
+            self.assertEqual(e.explain, "failed in sched_pid")
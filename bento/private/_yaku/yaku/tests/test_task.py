@@ -0,0 +1,75 @@
+import os
+import time
+
+from yaku.tests.test_helpers \
+    import \
+        TmpContextBase
+from yaku.context \
+    import \
+        create_top_nodes, get_cfg, get_bld
+from yaku.task \
+    import \
+        node_signature, task_factory
+
+class TestNodeSignature(TmpContextBase):
+    def setUp(self):
+        super(TestNodeSignature, self).setUp()
+        self.src_root, self.bld_root = create_top_nodes(self.d, os.path.join(self.d, "build"))
+
+    def _make_old_node(self, name, content):
+        node = self.src_root.make_node(name)
+        node.write(content)
+        old = time.time() - 3600
+        os.utime(node.abspath(), (old, old))
+        return node
+
+    def test_no_cache(self):
+        node = self._make_old_node("foo.c", "int foo;")
+        self.assertEqual(node_signature(node), node_signature(node, {}))
+
+    def test_stat_only(self):
+        node = self._make_old_node("foo.c", "int foo;")
+        node_sigs = {}
+        sig = node_signature(node, node_sigs)
+        self.assertTrue(node.abspath() in node_sigs)
+
+        # Same stat signature: content is not hashed again
+        st = os.stat(node.abspath())
+        node.write("int bar;")
+        if hasattr(st, "st_mtime_ns"):
+            os.utime(node.abspath(), ns=(st.st_atime_ns, st.st_mtime_ns))
+        else:
+            os.utime(node.abspath(), (st.st_atime, st.st_mtime))
+        self.assertEqual(node_signature(node, node_sigs), sig)
+
+        # Different stat signature: content is hashed again
+        node.write("int foobar;")
+        self.assertNotEqual(node_signature(node, node_sigs), sig)
+
+    def test_racy_file(self):
+        node = self.src_root.make_node("foo.c")
+        node.write("int foo;")
+        node_sigs = {}
+        node_signature(node, node_sigs)
+        self.assertFalse(node.abspath() in node_sigs)
+
+    def test_task_signature(self):
+        node = self._make_old_node("foo.c", "int foo;")
+        target = self.bld_root.make_node("foo.o")
+        t1 = task_factory("sig_cc")(inputs=[node], outputs=[target], env={})
+        t1.env_vars = []
+        t2 = task_factory("sig_cc")(inputs=[node], outputs=[target], env={})
+        t2.env_vars = []
+        self.assertEqual(t1.signature(), t2.signature({}))
+
+class TestNodeSignatureStorage(TmpContextBase):
+    def test_load_store(self):
+        ctx = get_cfg()
+        ctx.store()
+
+        ctx = get_bld()
+        ctx.node_sigs["foo"] = ((1, 2, 3), "bar")
+        ctx.store()
+
+        ctx = get_bld()
+        self.assertEqual(ctx.node_sigs, {"foo": ((1, 2, 3), "bar")})
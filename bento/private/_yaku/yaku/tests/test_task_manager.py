@@ -0,0 +1,117 @@
+import gc
+import time
+
+from unittest import TestCase
+
+from yaku.tests.test_helpers \
+    import \
+        benchmarks_enabled
+from yaku.node \
+    import \
+        Node
+from yaku.task \
+    import \
+        task_factory
+from yaku.task_manager \
+    import \
+        TaskManager
+
+def _make_root():
+    root = Node("", None)
+    return root.make_node("tm")
+
+def _drain(task_manager):
+    ret = []
+    grp = task_manager.next_set()
+    while grp:
+        ret.append(grp)
+        grp = task_manager.next_set()
+    return ret
+
+def _chain_tasks(root, n):
+    # n tasks foo.e0 -> foo.e1 -> ... -> foo.en, each one in its own group
+    tasks = []
+    klass = task_factory("tm_chain")
+    for i in range(n):
+        src = root.make_node("foo.e%d" % i)
+        tgt = root.make_node("foo.e%d" % (i + 1))
+        tasks.append(klass(inputs=[src], outputs=[tgt]))
+    return tasks
+
+class TestTaskManager(TestCase):
+    def setUp(self):
+        self.root = _make_root()
+
+    def test_extension_order(self):
+        cc = task_factory("tm_cc")
+        link = task_factory("tm_link")
+        objects = []
+        tasks = []
+        for i in range(3):
+            o = self.root.make_node("foo%d.o" % i)
+            objects.append(o)
+            tasks.append(cc(inputs=[self.root.make_node("foo%d.c" % i)], outputs=[o]))
+        ltask = link(inputs=objects, outputs=[self.root.make_node("foo.so")])
+
+        sets = _drain(TaskManager([ltask] + tasks))
+        self.assertEqual(len(sets), 2)
+        self.assertEqual(set(sets[0]), set(tasks))
+        self.assertEqual(sets[1], [ltask])
+
+    def test_chain(self):
+        tasks = _chain_tasks(self.root, 20)
+        # Shuffle the declaration order
+        sets = _drain(TaskManager(tasks[::-1]))
+        self.assertEqual(sets, [[t] for t in tasks])
+
+    def test_before(self):
+        first = task_factory("tm_first")
+        second = task_factory("tm_second")
+        second.before = [first.__name__]
+        try:
+            t2 = second(inputs=[self.root.make_node("a.py")], outputs=[self.root.make_node("b.py")])
+            t1 = first(inputs=[self.root.make_node("c.py")], outputs=[self.root.make_node("a.py")])
+            sets = _drain(TaskManager([t2, t1]))
+            self.assertEqual(sets, [[t1], [t2]])
+        finally:
+            del second.before
+
+    def test_cycle(self):
+        klass = task_factory("tm_cycle")
+        t1 = klass(inputs=[self.root.make_node("a.x")], outputs=[self.root.make_node("a.y")])
+        t2 = klass(inputs=[self.root.make_node("a.y")], outputs=[self.root.make_node("a.z")])
+        t3 = klass(inputs=[self.root.make_node("a.z")], outputs=[self.root.make_node("a.x")])
+        task_manager = TaskManager([t1, t2, t3])
+        self.assertRaises(Exception, lambda: _drain(task_manager))
+
+class TestTaskManagerBenchmark(TestCase):
+    """Ordering 10k synthetic tasks should scale linearly (timings only
+    checked if benchmarks are enabled, see yaku.tests.test_helpers)."""
+    def _time_order(self, n):
+        tasks = _chain_tasks(_make_root(), n)
+        # Garbage collection cost depends on every object alive in the
+        # process, not only on the tasks being ordered
+        gc.disable()
+        try:
+            t0 = time.time()
+            sets = _drain(TaskManager(tasks))
+            elapsed = time.time() - t0
+        finally:
+            gc.enable()
+        self.assertEqual(len(sets), n)
+        return elapsed
+
+    def _best_time_order(self, n):
+        if benchmarks_enabled():
+            repeat = 3
+        else:
+            repeat = 1
+        return min([self._time_order(n) for i in range(repeat)])
+
+    def test_scaling(self):
+        t_small = max(self._best_time_order(5000), 1e-2)
+        t_large = self._best_time_order(10000)
+        if benchmarks_enabled():
+            # Quadratic behavior would give a ratio of ~4
+            self.assertTrue(t_large < 3 * t_small,
+                            "10k tasks: %.3fs, 5k tasks: %.3fs" % (t_large, t_small))
@@ -0,0 +1,29 @@
+from yaku.tests.test_scheduler \
+    import \
+        SchedulerTestBase
+from yaku.scheduler \
+    import \
+        DependencyRunner
+
+class _RecordingTracer(object):
+    def __init__(self):
+        self.tasks = []
+
+    def add_task(self, task, start, end, args=None):
+        self.tasks.append((task, start, end, args))
+
+class TestTracer(SchedulerTestBase):
+    def setUp(self):
+        super(TestTracer, self).setUp()
+        self.ctx.tracer = _RecordingTracer()
+
+    def test_tasks(self):
+        tasks = self._make_chains(3)
+        self._run(DependencyRunner, tasks, 2)
+
+        tracer = self.ctx.tracer
+        self.assertEqual(set([t[0] for t in tracer.tasks]), set(tasks))
+        for task, start, end, args in tracer.tasks:
+            self.assertTrue(start <= end)
+            self.assertTrue(args["executed"])
+            self.assertTrue("signature_time" in args)
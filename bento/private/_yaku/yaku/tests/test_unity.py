@@ -0,0 +1,142 @@
+import os
+import sys
+import unittest
+
+from yaku.tests.test_helpers \
+    import \
+        TmpContextBase
+from yaku.context \
+    import \
+        get_cfg, get_bld
+from yaku.scheduler \
+    import \
+        run_tasks
+from yaku.tools.ctasks \
+    import \
+        unity_sources
+
+_MODULE = """\
+#include <Python.h>
+
+int foo(void);
+int bar(void);
+
+static PyObject *
+get(PyObject *self, PyObject *args)
+{
+    return PyLong_FromLong(foo() + bar());
+}
+
+static PyMethodDef methods[] = {
+    {"get", get, METH_NOARGS, NULL},
+    {NULL, NULL, 0, NULL}
+};
+
+static struct PyModuleDef module = {
+    PyModuleDef_HEAD_INIT, "_unity", NULL, -1, methods
+};
+
+PyMODINIT_FUNC
+PyInit__unity(void)
+{
+    return PyModule_Create(&module);
+}
+"""
+
+# foo.c and bar.c define the same static function: they cannot be compiled
+# in the same translation unit
+_SOURCES = {
+    "src/_unity.c": _MODULE,
+    "src/foo.c": '#include "foo.h"\nstatic int value(void) { return FOO; }\nint foo(void) { return value(); }\n',
+    "src/foo.h": "#define FOO 1\n",
+    "src/bar.c": "static int value(void) { return 2; }\nint bar(void) { return value(); }\n",
+}
+
+class TestUnitySources(TmpContextBase):
+    def setUp(self):
+        super(TestUnitySources, self).setUp()
+        ctx = get_cfg()
+        ctx.store()
+        self.bld = get_bld()
+
+    def _nodes(self, names):
+        nodes = []
+        for name in names:
+            node = self.bld.src_root.make_node(name)
+            node.parent.mkdir()
+            node.write("")
+            nodes.append(node)
+        return nodes
+
+    def test_groups(self):
+        sources = self._nodes(["a.c", "b.c", "c.cxx", "d.c", "e.c", "f.c"])
+        nodes, unity_dirs = unity_sources(self.bld, "foo.bar", sources, 2)
+        self.assertEqual([n.name for n in nodes],
+                         ["bar_unity0.c", "c.cxx", "bar_unity1.c"])
+        self.assertEqual(nodes[0].read().splitlines()[1:],
+                         ['#include "../../a.c"', '#include "../../b.c"',
+                          '#include "../../d.c"'])
+        self.assertEqual(nodes[2].read().splitlines()[1:],
+                         ['#include "../../e.c"', '#include "../../f.c"'])
+        self.assertEqual(unity_dirs[nodes[0]], [self.bld.src_root.abspath()])
+
+    def test_excludes(self):
+        sources = self._nodes(["a.c", "b.c", "c.c"])
+        nodes = unity_sources(self.bld, "foo", sources, 4, [sources[1]])[0]
+        self.assertEqual([n.name for n in nodes], ["foo_unity0.c", "b.c", "foo_unity1.c"])
+
+        # Nothing left to group
+        nodes = unity_sources(self.bld, "foo", sources, 4, sources[1:])[0]
+        self.assertEqual(nodes, sources)
+        nodes = unity_sources(self.bld, "foo", sources, 0)[0]
+        self.assertEqual(nodes, sources)
+
+    def test_unchanged(self):
+        sources = self._nodes(["a.c", "b.c"])
+        unity = unity_sources(self.bld, "foo", sources, 1)[0][0]
+        os.utime(unity.abspath(), (0, 0))
+        unity_sources(self.bld, "foo", sources, 1)
+        self.assertEqual(os.stat(unity.abspath()).st_mtime, 0)
+
+class TestUnityExtension(TmpContextBase):
+    def setUp(self):
+        super(TestUnityExtension, self).setUp()
+        if sys.version_info[0] < 3:
+            raise unittest.SkipTest("Test extension uses the python 3 C API")
+        for name, content in _SOURCES.items():
+            if not os.path.exists(os.path.dirname(name)):
+                os.makedirs(os.path.dirname(name))
+            open(name, "w").write(content)
+
+        ctx = get_cfg()
+        try:
+            try:
+                ctx.use_tools(["ctasks", "pyext"])
+            except Exception:
+                raise unittest.SkipTest("No working C compiler")
+            if not ctx.builders["pyext"].configured:
+                raise unittest.SkipTest("Cannot build python extensions")
+            ctx.store()
+        finally:
+            ctx.log.close()
+
+    def _build(self, unity_excludes=None):
+        bld = get_bld()
+        tasks = bld.builders["pyext"].extension("_unity",
+                    ["src/_unity.c", "src/foo.c", "src/bar.c"], unity=1,
+                    unity_excludes=unity_excludes)
+        run_tasks(bld)
+        bld.store()
+        return tasks
+
+    def test_excludes(self):
+        # bar.c cannot be compiled with foo.c
+        tasks = self._build(["src/bar.c"])
+        sources = [t.inputs[0].name for t in tasks[:-1]]
+        self.assertEqual(sources, ["_unity_unity0.c", "bar.c"])
+        self.assertTrue(os.path.exists(tasks[-1].outputs[0].abspath()))
+
+    def test_header_dependencies(self):
+        tasks = self._build(["src/bar.c"])
+        deps = [n.abspath() for n in tasks[0].deps]
+        self.assertTrue(os.path.abspath("src/foo.h") in deps)
@@ -0,0 +1,57 @@
+import os
+import time
+
+from yaku.tests.test_helpers \
+    import \
+        TmpContextBase
+from yaku.utils \
+    import \
+        find_deps, scan_includes
+
+def _write(name, content, old=True):
+    f = open(name, "w")
+    try:
+        f.write(content)
+    finally:
+        f.close()
+    if old:
+        t = time.time() - 3600
+        os.utime(name, (t, t))
+
+class TestFindDeps(TmpContextBase):
+    def setUp(self):
+        super(TestFindDeps, self).setUp()
+        os.makedirs("include")
+        _write("foo.c", '#include "foo.h"\n#include <stdio.h>\n#include "missing.h"\n')
+        _write(os.path.join("include", "foo.h"), '#include "bar.h"\n')
+        _write(os.path.join("include", "bar.h"), '#include "foo.h"\n/* #include "commented.h" */\n')
+        _write(os.path.join("include", "commented.h"), '')
+
+    def test_simple(self):
+        deps = find_deps("foo.c", ["include"])
+        self.assertEqual(deps, [os.path.join("include", "foo.h"),
+                                os.path.join("include", "bar.h")])
+
+    def test_scan_cache(self):
+        scan_cache = {}
+        deps = find_deps("foo.c", ["include"], scan_cache)
+        self.assertEqual(deps, find_deps("foo.c", ["include"]))
+        self.assertEqual(scan_cache[os.path.join("include", "bar.h")][1], ["foo.h"])
+
+        # Unchanged stat signature: cached result is used without reading
+        # the file
+        scan_cache["foo.c"] = (scan_cache["foo.c"][0], ["bar.h"])
+        self.assertEqual(find_deps("foo.c", ["include"], scan_cache),
+                         [os.path.join("include", "bar.h"),
+                          os.path.join("include", "foo.h")])
+
+        # Modified file is scanned again
+        _write("foo.c", '#include "commented.h"\n', False)
+        self.assertEqual(find_deps("foo.c", ["include"], scan_cache),
+                         [os.path.join("include", "commented.h")])
+
+    def test_racy_file(self):
+        _write("racy.c", '#include "foo.h"\n', False)
+        scan_cache = {}
+        self.assertEqual(scan_includes("racy.c", scan_cache), ["foo.h"])
+        self.assertFalse("racy.c" in scan_cache)
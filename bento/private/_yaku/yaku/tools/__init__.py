@@ -16,7 +16,7 @@ from yaku.scheduler \
         run_tasks
 from yaku.conf \
     import \
-        with_conf_blddir, create_file, write_log
+        with_conf_blddir, create_file, write_log, write_cached_log
 from yaku.utils \
     import \
         get_exception
@@ -76,7 +76,14 @@ class Builder(object):
         outputs = tasks[0].outputs[:]
         return outputs
 
-def try_task_maker(conf, task_maker, name, body, headers, env=None):
+def try_task_maker(conf, task_maker, name, body, headers, env=None, cached=False):
+    tasks, code = create_conf_tasks(conf, task_maker, name, body, headers, env)
+    return run_conf_tasks(conf, tasks, code, cached)
+
+def create_conf_tasks(conf, task_maker, name, body, headers, env=None):
+    """Create the tasks building the given test code, without running them.
+
+    Returns the tasks and the full test code."""
     if headers:
         head = "\n".join(["#include <%s>" % h for h in headers])
     else:
@@ -95,6 +102,24 @@ def try_task_maker(conf, task_maker, name, body, headers, env=None):
     for t in tasks:
         t.disable_output = True
         t.log = conf.log
+    return tasks, code
+
+def run_conf_tasks(conf, tasks, code, cached=False):
+    """Run the tasks created by create_conf_tasks, and log the outcome in
+    conf.log. Return True if the tasks succeeded.
+
+    If cached is True, the outcome is looked up in (and stored into) the
+    probe cache of the configure context, if any. Only probes which do not
+    depend on the outputs of other probes may be cached."""
+    probe_cache = None
+    if cached:
+        probe_cache = getattr(conf, "probe_cache", None)
+    if probe_cache is not None:
+        key = probe_cache.key(conf, tasks, code)
+        succeed = probe_cache.fetch(key)
+        if succeed is not None:
+            write_cached_log(conf.log, code, succeed)
+            return succeed
 
     succeed = False
     explanation = None
@@ -108,6 +133,8 @@ def try_task_maker(conf, task_maker, name, body, headers, env=None):
             #raise
     finally:
         write_log(conf, conf.log, tasks, code, succeed, explanation)
+    if probe_cache is not None:
+        probe_cache.store(key, succeed)
     return succeed
 
 def _merge_env(_env, new_env):
@@ -28,6 +28,9 @@ from yaku.conf \
 from yaku._config \
     import \
         _OUTPUT
+from yaku.probecache \
+    import \
+        memoize_detection
 import yaku.tools
 
 ccompile, cc_vars = compile_fun("cc", "${CC} ${CFLAGS} ${APP_DEFINES} ${INCPATH} ${CC_TGT_F}${TGT[0].abspath()} ${CC_SRC_F}${SRC}", False)
@@ -40,6 +43,85 @@ cshlink, cshlink_vars = compile_fun("cshlib", "${SHLINK} ${APP_LIBDIR} ${APP_LIB
 
 clink, clink_vars = compile_fun("clib", "${STLINK} ${STLINKFLAGS} ${STLINK_TGT_F}${TGT[0].abspath()} ${STLINK_SRC_F}${SRC}", False)
 
+def set_include_scanner(task, node, extra_cpppaths=None):
+    """Make the task depend on the project headers included (recursively)
+    by node.
+
+    Only headers found in the source directory of node, in extra_cpppaths
+    and in the task generator scan_cpppath are considered - system headers
+    are ignored. Headers are scanned when the task is about to run, and the
+    scan results are cached in the build context across builds."""
+    if extra_cpppaths is None:
+        extra_cpppaths = []
+    def scan():
+        bld = task.gen.bld
+        scan_cache = getattr(bld, "header_scan", None)
+        cpppaths = [node.parent.abspath()] + extra_cpppaths + task.gen.scan_cpppath
+
+        root = node
+        while root.parent:
+            root = root.parent
+        deps = []
+        for path in find_deps(node.abspath(), cpppaths, scan_cache):
+            n = root.find_node(path)
+            if n is not None:
+                deps.append(n)
+        return deps
+    task.scan = scan
+
+def unity_sources(bld, name, sources, units, excludes=None):
+    """Group the C sources of the target name into at most units generated
+    translation units (unity build), each one including a contiguous range of
+    the sources.
+
+    Sources in excludes (e.g. files defining static symbols with the same
+    names) and non-C sources are left alone. Return the new list of source
+    nodes, and a dict unity node -> directories of the sources it includes,
+    to be scanned for headers (see set_include_scanner)."""
+    if excludes is None:
+        excludes = []
+    excluded = set([n.abspath() for n in excludes])
+    candidates = [n for n in sources
+                  if n.name.endswith(".c") and not n.abspath() in excluded]
+    if units < 1 or len(candidates) < 2:
+        return sources, {}
+    units = min(units, len(candidates))
+
+    size, extra = divmod(len(candidates), units)
+    groups = {}
+    unity_dirs = {}
+    start = 0
+    for i in range(units):
+        group = candidates[start:start + size + (i < extra)]
+        start += len(group)
+
+        unity = bld.path.declare("%s_unity%d.c" % (name.replace(".", "/"), i))
+        lines = ["/* Unity build of %s: generated by yaku, do not edit */" % name]
+        dirs = []
+        for n in group:
+            path = os.path.relpath(n.abspath(), unity.parent.abspath())
+            lines.append('#include "%s"' % path.replace(os.sep, "/"))
+            if not n.parent.abspath() in dirs:
+                dirs.append(n.parent.abspath())
+        content = "\n".join(lines) + "\n"
+
+        # Only write the file when changed, to keep incremental builds
+        filename = unity.abspath()
+        if not os.path.exists(filename) or open(filename).read() != content:
+            ensure_dir(filename)
+            unity.write(content)
+        groups[group[0].abspath()] = unity
+        unity_dirs[unity] = dirs
+
+    ret = []
+    for n in sources:
+        if n in candidates:
+            if n.abspath() in groups:
+                ret.append(groups[n.abspath()])
+        else:
+            ret.append(n)
+    return ret, unity_dirs
+
 @extension('.c')
 def c_hook(self, node):
     tasks = ccompile_task(self, node)
@@ -54,6 +136,8 @@ def ccompile_task(self, node):
     task = task_factory("cc")(inputs=[node], outputs=[target], func=ccompile, env=self.env)
     task.gen = self
     task.env_vars = cc_vars
+    set_include_scanner(task, node)
+    task.use_object_cache = True
     return [task]
 
 def shared_c_hook(self, node):
@@ -69,6 +153,8 @@ def shared_ccompile_task(self, node):
     task = task_factory("shcc")(inputs=[node], outputs=[target], func=shccompile, env=self.env)
     task.gen = self
     task.env_vars = cc_vars
+    set_include_scanner(task, node)
+    task.use_object_cache = True
     return [task]
 
 def shlink_task(self, name):
@@ -122,14 +208,17 @@ def apply_cpppath(task_gen):
     srcnode = task_gen.sources[0].ctx.srcnode
 
     relcpppaths = []
+    scan_cpppath = []
     for p in cpppaths:
         if not os.path.isabs(p):
             node = srcnode.find_node(p)
             assert node is not None, "could not find %s" % p
             relcpppaths.append(node.bldpath())
+            scan_cpppath.append(node.abspath())
         else:
             relcpppaths.append(p)
     cpppaths = list(implicit_paths) + relcpppaths
+    task_gen.scan_cpppath = scan_cpppath
     task_gen.env["INCPATH"] = [
             task_gen.env["CPPPATH_FMT"] % p
             for p in cpppaths]
@@ -172,9 +261,10 @@ class CCBuilder(yaku.tools.Builder):
             outputs.extend(t.outputs)
         return outputs
 
-    def try_compile(self, name, body, headers=None):
+    def try_compile(self, name, body, headers=None, cached=False):
         return with_conf_blddir(self.ctx, name, body,
-                                lambda : yaku.tools.try_task_maker(self.ctx, self._compile, name, body, headers))
+                                lambda : yaku.tools.try_task_maker(self.ctx, self._compile, name, body, headers,
+                                                                   cached=cached))
 
     def try_compile_no_blddir(self, name, body, headers=None, env=None):
         return yaku.tools.try_task_maker(self.ctx, self._compile, name, body, headers, env)
@@ -276,9 +366,10 @@ class CCBuilder(yaku.tools.Builder):
         task_gen.link_task = ltask
         return tasks
 
-    def try_program(self, name, body, headers=None, env=None):
+    def try_program(self, name, body, headers=None, env=None, cached=False):
         return with_conf_blddir(self.ctx, name, body,
-                                lambda : yaku.tools.try_task_maker(self.ctx, self._program, name, body, headers, env))
+                                lambda : yaku.tools.try_task_maker(self.ctx, self._program, name, body, headers, env,
+                                                                   cached))
 
     def try_program_no_blddir(self, name, body, headers=None, env=None):
         return yaku.tools.try_task_maker(self.ctx, self._program, name, body, headers, env)
@@ -321,6 +412,27 @@ class CCBuilder(yaku.tools.Builder):
             ar = ctx.load_tool("ar")
             ar.setup(ctx)
 
+        # The checks only depend on the toolchain: they are skipped if they
+        # already passed for the same programs and environment
+        toolchain = {}
+        for k, v in ctx.env.items():
+            if not k in ["BLDDIR", "ENV", "VERBOSE"]:
+                toolchain[k] = v
+        programs = [ctx.env[k][0] for k in ["CC", "LINK", "SHLINK", "STLINK"]
+                    if ctx.env.get(k)]
+        checked = []
+        def _check():
+            checked.append(True)
+            return self._check_toolchain(cc_type)
+        memoize_detection(ctx, "ctasks_toolchain", programs, toolchain, _check)
+        if not checked:
+            ctx.start_message("Checking whether %s toolchain works" % cc_type)
+            ctx.log.write("---> Succeeded ! (cached)\n\n")
+            ctx.end_message("yes (cached)")
+        self.configured = True
+
+    def _check_toolchain(self, cc_type):
+        ctx = self.ctx
         ctx.start_message("Checking whether %s can build objects" % cc_type)
         if self.try_compile("foo", "int foo() {return 0;}"):
             ctx.end_message("yes")
@@ -379,7 +491,7 @@ __YAKU_DLL_MARK int foo()
                 ctx.end_message("no")
                 ctx.fail_configuration("")
         with_conf_blddir(self.ctx, "exeshlib", "checking shared link", f)
-        self.configured = True
+        return True
 
 def get_builder(ctx):
     return CCBuilder(ctx)
@@ -12,13 +12,14 @@ from yaku.task_manager \
         extension, CompiledTaskGen
 from yaku.utils \
     import \
-        find_deps, ensure_dir, get_exception
+        ensure_dir, get_exception
 from yaku.compiled_fun \
     import \
         compile_fun
 from yaku.tools.ctasks \
     import \
-        apply_cpppath, apply_libdir, apply_libs, apply_define
+        apply_cpppath, apply_libdir, apply_libs, apply_define, \
+        set_include_scanner
 import yaku.tools
 
 cxxcompile, cxx_vars = compile_fun("cxx", "${CXX} ${CXXFLAGS} ${INCPATH} ${APP_DEFINES} ${CXX_TGT_F}${TGT[0].abspath()} ${CXX_SRC_F}${SRC}", False)
@@ -39,9 +40,8 @@ def cxxcompile_task(self, node):
     task = task_factory("cxx")(inputs=[node], outputs=[target])
     task.gen = self
     task.env_vars = cxx_vars
-    #print find_deps("foo.c", ["."])
-    #task.scan = lambda : find_deps(node, ["."])
-    #task.deps.extend(task.scan())
+    set_include_scanner(task, node)
+    task.use_object_cache = True
     task.env = self.env
     task.func = cxxcompile
     return [task]
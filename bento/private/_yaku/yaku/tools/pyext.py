@@ -35,7 +35,7 @@ from yaku.conftests \
         check_compiler, check_header
 from yaku.tools.ctasks \
     import \
-        apply_define
+        apply_define, set_include_scanner, unity_sources
 from yaku.scheduler \
     import \
         run_tasks
@@ -45,6 +45,9 @@ from yaku.conf \
 from yaku.errors \
     import \
         TaskRunFailure
+from yaku.probecache \
+    import \
+        memoize_detection
 from yaku._config \
     import \
         _OUTPUT
@@ -102,10 +105,13 @@ _SYS_TO_CCENV = {
 def setup_pyext_env(ctx, cc_type="default", use_distutils=True):
     pyenv = Environment()
     if use_distutils:
-        if cc_type == "default":
-            dist_env = get_configuration()
-        else:
-            dist_env = get_configuration(cc_type)
+        def _get_configuration():
+            if cc_type == "default":
+                return get_configuration()
+            else:
+                return get_configuration(cc_type)
+        dist_env = memoize_detection(ctx, "pyext_configuration", [], [cc_type],
+                                     _get_configuration)
         for name, value in dist_env.items():
             pyenv["PYEXT_%s" % name] = value
         pyenv["PYEXT_FMT"] = "%%s%s" % dist_env["SO"]
@@ -155,6 +161,8 @@ def pycc_task(self, node):
     task.env_vars = pycc_vars
     task.env = self.env
     task.func = pycc
+    set_include_scanner(task, node)
+    task.use_object_cache = True
     return [task]
 
 def pycxx_hook(self, node):
@@ -173,6 +181,8 @@ def pycxx_task(self, node):
     task.env_vars = pycxx_vars
     task.env = self.env
     task.func = pycxx
+    set_include_scanner(task, node)
+    task.use_object_cache = True
     return [task]
 
 def pylink_task(self, name):
@@ -211,19 +221,21 @@ class PythonBuilder(yaku.tools.Builder):
             t.env = task_gen.env
         return tasks
 
-    def try_compile(self, name, body, headers=None):
+    def try_compile(self, name, body, headers=None, cached=False):
         old_hook = set_extension_hook(".c", pycc_task)
         try:
             return with_conf_blddir(self.ctx, name, body,
-                                    lambda : yaku.tools.try_task_maker(self.ctx, self._compile, name, body, headers))
+                                    lambda : yaku.tools.try_task_maker(self.ctx, self._compile, name, body, headers,
+                                                                       cached=cached))
         finally:
             set_extension_hook(".c", old_hook)
 
-    def try_extension(self, name, body, headers=None):
+    def try_extension(self, name, body, headers=None, cached=False):
         old_hook = set_extension_hook(".c", pycc_task)
         try:
             return with_conf_blddir(self.ctx, name, body,
-                                    lambda : yaku.tools.try_task_maker(self.ctx, self._extension, name, body, headers))
+                                    lambda : yaku.tools.try_task_maker(self.ctx, self._extension, name, body, headers,
+                                                                       cached=cached))
         finally:
             set_extension_hook(".c", old_hook)
 
@@ -258,12 +270,27 @@ class PythonBuilder(yaku.tools.Builder):
         set_extension_hook(".cxx", old_hook_cxx)
         return tasks
 
-    def extension(self, name, sources, env=None):
+    def extension(self, name, sources, env=None, unity=0, unity_excludes=None):
+        """Declare the tasks building the given extension.
+
+        If unity is > 0, the C sources but the ones in unity_excludes are
+        compiled as at most unity concatenated translation units (see
+        yaku.tools.ctasks.unity_sources)."""
         sources = self.to_nodes(sources)
+        unity_dirs = {}
+        if unity > 0:
+            if unity_excludes:
+                excludes = self.to_nodes(unity_excludes)
+            else:
+                excludes = []
+            sources, unity_dirs = unity_sources(self.ctx, name, sources, unity, excludes)
         task_gen = CompiledTaskGen("pyext", self.ctx, sources, name)
         task_gen.bld = self.ctx
         task_gen.env = yaku.tools._merge_env(self.env, env)
         tasks = self._extension(task_gen, name)
+        for t in tasks:
+            if t.inputs and t.inputs[0] in unity_dirs:
+                set_include_scanner(t, t.inputs[0], unity_dirs[t.inputs[0]])
         self.ctx.tasks.extend(tasks)
 
         outputs = []
@@ -272,9 +299,10 @@ class PythonBuilder(yaku.tools.Builder):
         task_gen.outputs = outputs
         return tasks
 
-    def try_extension(self, name, body, headers=None):
+    def try_extension(self, name, body, headers=None, cached=False):
         return with_conf_blddir(self.ctx, name, body,
-                                lambda : yaku.tools.try_task_maker(self.ctx, self._extension, name, body, headers))
+                                lambda : yaku.tools.try_task_maker(self.ctx, self._extension, name, body, headers,
+                                                                   cached=cached))
 
     def configure(self, candidates=None, use_distutils=True):
         ctx = self.ctx
@@ -339,7 +367,7 @@ init_bar(void)
 """
         ctx.start_message("Checking whether %s can build python object code" % compiler_type)
         try:
-            self.try_compile("foo", pycode)
+            self.try_compile("foo", pycode, cached=True)
             ctx.end_message("yes")
         except TaskRunFailure:
             e = get_exception()
@@ -348,7 +376,7 @@ init_bar(void)
 
         ctx.start_message("Checking whether %s can build python extension" % compiler_type)
         try:
-            self.try_extension("foo", pycode)
+            self.try_extension("foo", pycode, cached=True)
             ctx.end_message("yes")
         except TaskRunFailure:
             e = get_exception()
@@ -376,6 +404,13 @@ def detect_cxx_type(ctx, cxx_cmd):
         return cxx_type
 
 def _detect_cc_type(ctx, cc_cmd):
+    _OUTPUT.write("Detecting CC type... ")
+    cc_type = memoize_detection(ctx, "cc_type", cc_cmd[:1], cc_cmd,
+                                lambda: _run_cc_type_detection(cc_cmd))
+    _OUTPUT.write("%s\n" % cc_type)
+    return cc_type
+
+def _run_cc_type_detection(cc_cmd):
     cc_type = None
 
     def detect_type(vflag):
@@ -390,7 +425,6 @@ def _detect_cc_type(ctx, cc_cmd):
                 return k
         return None
 
-    _OUTPUT.write("Detecting CC type... ")
     if sys.platform == "win32":
         for v in ["", "-v"]:
             cc_type = detect_type(v)
@@ -403,19 +437,24 @@ def _detect_cc_type(ctx, cc_cmd):
             if cc_type is None:
                 cc_type = "cc"
         except OSError:
-            e = extract_exception()
+            e = get_exception()
             if e.errno == errno.ENOENT:
                 raise ValueError("compiler %r not found" % " ".join(cc_cmd))
             else:
                 raise ValueError("Unexpected error %r when testing compiler %r" % (e, cc_cmd))
-    _OUTPUT.write("%s\n" % cc_type)
     return cc_type
 
 def get_distutils_cc_exec(ctx, compiler_type="default"):
+    _OUTPUT.write("Detecting distutils CC exec ... ")
+    cc = memoize_detection(ctx, "distutils_cc_exec", [], [compiler_type],
+                           lambda: _get_distutils_cc_exec(compiler_type))
+    _OUTPUT.write("%s\n" % " ".join(cc))
+    return cc
+
+def _get_distutils_cc_exec(compiler_type):
     from distutils import ccompiler
     from distutils.sysconfig import customize_compiler
 
-    _OUTPUT.write("Detecting distutils CC exec ... ")
     if compiler_type == "default":
         compiler_type = \
                 distutils.ccompiler.get_default_compiler()
@@ -427,14 +466,19 @@ def get_distutils_cc_exec(ctx, compiler_type="default"):
         cc = [compiler.cc]
     else:
         cc = compiler.compiler_so[:1]
-    _OUTPUT.write("%s\n" % " ".join(cc))
     return cc
 
 def get_distutils_cxx_exec(ctx, compiler_type="default"):
+    _OUTPUT.write("Detecting distutils CXX exec ... ")
+    cc = memoize_detection(ctx, "distutils_cxx_exec", [], [compiler_type],
+                           lambda: _get_distutils_cxx_exec(compiler_type))
+    _OUTPUT.write("%s\n" % " ".join(cc))
+    return cc
+
+def _get_distutils_cxx_exec(compiler_type):
     from distutils import ccompiler
     from distutils.sysconfig import customize_compiler
 
-    _OUTPUT.write("Detecting distutils CXX exec ... ")
     if compiler_type == "default":
         compiler_type = \
                 distutils.ccompiler.get_default_compiler()
@@ -446,7 +490,6 @@ def get_distutils_cxx_exec(ctx, compiler_type="default"):
     else:
         customize_compiler(compiler)
         cc = compiler.compiler_cxx
-    _OUTPUT.write("%s\n" % " ".join(cc))
     return cc
 
 def _setup_compiler(ctx, cc_type):
@@ -525,14 +568,17 @@ def apply_cpppath(task_gen):
     srcnode = task_gen.sources[0].ctx.srcnode
 
     relcpppaths = []
+    scan_cpppath = []
     for p in cpppaths:
         if not os.path.isabs(p):
             node = srcnode.find_node(p)
             assert node is not None, "could not find %s" % p
             relcpppaths.append(node.bldpath())
+            scan_cpppath.append(node.abspath())
         else:
             relcpppaths.append(p)
     cpppaths = list(implicit_paths) + relcpppaths
+    task_gen.scan_cpppath = scan_cpppath
     task_gen.env["PYEXT_INCPATH"] = [
             task_gen.env["PYEXT_CPPPATH_FMT"] % p
             for p in cpppaths]
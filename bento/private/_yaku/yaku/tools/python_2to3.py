@@ -1,13 +1,17 @@
 import os
 import sys
-import shutil
-import subprocess
-
-from cStringIO \
-    import \
-        StringIO
-
-import lib2to3.main
+try:
+    from hashlib import md5
+except ImportError:
+    from md5 import md5
+if sys.version_info[0] < 3:
+    from cStringIO \
+        import \
+            StringIO as BytesIO
+else:
+    from io \
+        import \
+            BytesIO
 
 from yaku.errors \
     import \
@@ -21,23 +25,144 @@ from yaku.task_manager \
 from yaku.pprint \
     import \
         pprint
+from yaku.utils \
+    import \
+        ensure_dir, rename, get_exception
 
 import yaku.tools
 
+# relative to the build directory
+LIB2TO3_CACHE = ".lib2to3_cache"
+
+# Number of files converted by each convert task: the refactoring tool
+# creation and the task scheduling overhead are shared by a whole batch
+BATCH_SIZE = 16
+
+# Refactoring tools are expensive to create (grammar loading, fixers
+# compilation), so we only create one per fixer set and process
+# fixers tuple -> lib2to3.refactor.RefactoringTool
+_REFACTORING_TOOLS = {}
+
+def default_fixers(nofix=None):
+    """Return the sorted list of lib2to3 fixers applied by default, minus the
+    ones listed in nofix (short names, as given to the -x option of 2to3)."""
+    from lib2to3.refactor \
+        import \
+            get_fixers_from_package
+    if nofix is None:
+        nofix = []
+    excluded = set(["lib2to3.fixes.fix_" + f for f in nofix])
+    return sorted([f for f in get_fixers_from_package("lib2to3.fixes") \
+                   if not f in excluded])
+
+def get_refactoring_tool(fixers):
+    key = tuple(fixers)
+    try:
+        return _REFACTORING_TOOLS[key]
+    except KeyError:
+        from lib2to3.refactor \
+            import \
+                RefactoringTool
+        tool = _REFACTORING_TOOLS[key] = RefactoringTool(list(fixers))
+        return tool
+
+def _sibling_modules(filename):
+    """Return the sorted names of the files and directories next to filename
+    which fix_import may take for local modules (only files in packages are
+    concerned)."""
+    dirname = os.path.dirname(os.path.abspath(filename))
+    if not os.path.exists(os.path.join(dirname, "__init__.py")):
+        return []
+    names = []
+    for name in os.listdir(dirname):
+        if os.path.splitext(name)[1] in (".py", ".pyc", ".so", ".sl", ".pyd") \
+                or os.path.isdir(os.path.join(dirname, name)):
+            names.append(name)
+    return sorted(names)
+
+def _cache_key(content, fixers, filename, top_dir):
+    m = md5()
+    m.update(content)
+    m.update(("\0".join(fixers)).encode())
+    # Fixers behaviour depends on the lib2to3 version
+    m.update(sys.version.encode())
+    if "lib2to3.fixes.fix_import" in fixers:
+        # fix_import converts 'import foo' to 'from . import foo' if foo is
+        # a sibling module: the result depends on the file location
+        if top_dir is None:
+            path = os.path.abspath(filename)
+        else:
+            path = os.path.relpath(filename, top_dir)
+        m.update(("\0".join([path.replace(os.sep, "/")] + _sibling_modules(filename))).encode("utf-8"))
+    return m.hexdigest()
+
+def convert_file(filename, fixers, cache_dir=None, top_dir=None):
+    """Convert the given python file with lib2to3 in the current process,
+    and return the converted content (as bytes).
+
+    If cache_dir is given, results are cached there, keyed by the source
+    content and the fixers set, so that unchanged files are not converted
+    again. If fix_import is used, the key also covers the file path relative
+    to top_dir and its sibling files."""
+    fid = open(filename, "rb")
+    try:
+        content = fid.read()
+    finally:
+        fid.close()
+
+    if cache_dir is not None:
+        key = _cache_key(content, fixers, filename, top_dir)
+        cache_file = os.path.join(cache_dir, key[:2], key)
+        try:
+            fid = open(cache_file, "rb")
+            try:
+                return fid.read()
+            finally:
+                fid.close()
+        except IOError:
+            pass
+
+    from lib2to3.pgen2.tokenize \
+        import \
+            detect_encoding
+    encoding = detect_encoding(BytesIO(content).readline)[0]
+    source = content.decode(encoding)
+
+    tool = get_refactoring_tool(fixers)
+    # Same as RefactoringTool.refactor_file: the extra newline silences some
+    # parse errors
+    tree = tool.refactor_string(source + "\n", filename)
+    if sys.version_info[0] < 3:
+        converted = unicode(tree)[:-1].encode(encoding)
+    else:
+        converted = str(tree)[:-1].encode(encoding)
+
+    if cache_dir is not None:
+        ensure_dir(cache_file)
+        tmp = "%s.%d.tmp" % (cache_file, os.getpid())
+        fid = open(tmp, "wb")
+        try:
+            fid.write(converted)
+        finally:
+            fid.close()
+        rename(tmp, cache_file)
+    return converted
+
 def convert_func(self):
-    if not len(self.inputs) == 1:
-        raise ValueError("convert_func needs exactly one input")
-    source, target = self.inputs[0], self.outputs[0]
+    if not len(self.inputs) == len(self.outputs):
+        raise ValueError("convert_func needs one output per input")
 
     pprint('GREEN', "%-16s%s" % (self.name.upper(),
            " ".join([s.srcpath() for s in self.inputs])))
-    cmd = ["2to3", "-w", "--no-diffs", "-n", source.abspath()]
-    st = subprocess.call(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-    if st != 0:
-        pprint('RED', "FAILED %-16s%s" % (self.name.upper(),
-               " ".join([s.srcpath() for s in self.inputs])))
-        raise TaskRunFailure(cmd)
-    target.write(source.read())
+    for source, target in zip(self.inputs, self.outputs):
+        try:
+            converted = convert_file(source.abspath(), self.env["2TO3_FIXERS"],
+                                     self.env["2TO3_CACHE_DIR"], self.env["2TO3_TMP_DIR"])
+        except Exception:
+            e = get_exception()
+            pprint('RED', "FAILED %-16s%s" % (self.name.upper(), source.srcpath()))
+            raise TaskRunFailure(["2to3", source.abspath()], str(e))
+        target.write(converted, "wb")
 
 def copy_func(self):
     source, target = self.inputs[0], self.outputs[0]
@@ -86,16 +211,25 @@ class Py3kConverterBuilder(yaku.tools.Builder):
 
         flter = self._process_exclude(env)
         self.env["__2TO3_FILTER"] = flter
+        if not "2TO3_FIXERS" in env:
+            env["2TO3_FIXERS"] = default_fixers(env.get("2TO3_NOFIX", None))
+        env["2TO3_CACHE_DIR"] = self.ctx.bld_root.declare(LIB2TO3_CACHE).abspath()
 
         files = [self.ctx.src_root.find_resource(f) for f in sources]
 
         convert_tf = task_factory("2to3")
         copy_tf = task_factory("2to3_prepare")
+        # Pure python functions: may be run in a process pool
+        convert_tf.executor = "process"
+        copy_tf.executor = "process"
         convert_tf.before.append(copy_tf.__name__)
 
         py3k_tmp = self.ctx.bld_root.declare("_py3k_tmp")
         py3k_top = self.ctx.bld_root.declare("py3k")
+        env["2TO3_TMP_DIR"] = py3k_tmp.abspath()
         tasks = []
+        # python files are converted by batches of BATCH_SIZE files
+        to_convert = []
         for f in files:
             target = py3k_tmp.declare(f.srcpath())
             task = copy_tf(inputs=[f], outputs=[target])
@@ -105,13 +239,7 @@ class Py3kConverterBuilder(yaku.tools.Builder):
             tasks.append(task)
 
             if f.name.endswith(".py") and not flter(f):
-                source = target
-                target = py3k_top.declare(source.path_from(py3k_tmp))
-                task = convert_tf(inputs=[source], outputs=[target])
-                task.func = convert_func
-                task.env_vars = {}
-                task.env = env
-                tasks.append(task)
+                to_convert.append((target, py3k_top.declare(target.path_from(py3k_tmp))))
             else:
                 source = f
                 target = py3k_top.declare(source.srcpath())
@@ -121,6 +249,15 @@ class Py3kConverterBuilder(yaku.tools.Builder):
                 task.env = env
                 tasks.append(task)
 
+        for i in range(0, len(to_convert), BATCH_SIZE):
+            batch = to_convert[i:i+BATCH_SIZE]
+            task = convert_tf(inputs=[source for source, target in batch],
+                              outputs=[target for source, target in batch])
+            task.func = convert_func
+            task.env_vars = ["2TO3_FIXERS", "2TO3_CACHE_DIR"]
+            task.env = env
+            tasks.append(task)
+
         self.ctx.tasks.extend(tasks)
 
         outputs = []
@@ -17,7 +17,10 @@ def render(task):
 def template_task(task_gen, node):
     out = node.change_ext("")
     target = node.parent.declare(out.name)
-    task = task_factory("subst")(inputs=[node], outputs=[target], func=render)
+    klass = task_factory("subst")
+    # Pure python function: may be run in a process pool
+    klass.executor = "process"
+    task = klass(inputs=[node], outputs=[target], func=render)
     task.env_vars = ["SUBST_DICT"]
     task.env = task_gen.env
     return [task]
@@ -1,6 +1,7 @@
 import sys
 import re
 import os
+import time
 
 from yaku.compat.rename \
     import \
@@ -52,41 +53,97 @@ def lines_includes(filename):
     code = re_cpp.sub(repl, code)
     return [(m.group(2), m.group(3)) for m in re.finditer(re_inc, code)]
 
-def find_deps(node, cpppaths=["/usr/include", "."]):
+# Files modified less than this many seconds before being read are not
+# cached, as a later modification may not change their stat signature
+# (coarse mtime resolution)
+RACY_DELAY = 2
+
+def stat_signature(st):
+    """(mtime, size, inode) signature of the given stat result."""
+    try:
+        mtime = st.st_mtime_ns
+    except AttributeError:
+        mtime = int(st.st_mtime * 1e9)
+    return (mtime, st.st_size, st.st_ino)
+
+def scan_includes(filename, scan_cache=None):
+    """Return the list of file names included by the given C/C++ file.
+
+    Parameters
+    ----------
+    scan_cache: dict or None
+        if given, maps file paths to (stat signature, includes) pairs. The
+        file is only read and scanned again if its stat signature changed
+        since it was recorded."""
+    if scan_cache is not None:
+        st = os.stat(filename)
+        sig = stat_signature(st)
+        try:
+            old_sig, includes = scan_cache[filename]
+            if old_sig == sig:
+                return includes
+        except KeyError:
+            pass
+
+    includes = []
+    for (_, line) in lines_includes(filename):
+        t, name = extract_include(line, None)
+        if t is not None:
+            includes.append(name)
+
+    if scan_cache is not None and st.st_mtime < time.time() - RACY_DELAY:
+        scan_cache[filename] = (sig, includes)
+    return includes
+
+def find_deps(node, cpppaths=["/usr/include", "."], scan_cache=None):
     nodes = []
-    names = []
+    seen = set()
+    names = set()
 
     def _find_deps(node):
-        lst = lines_includes(node)
-
-        for (_, line) in lst:
-            t, filename = extract_include(line, None)
-            if t is None:
-                continue
+        for filename in scan_includes(node, scan_cache):
             if filename in names:
                 continue
 
             found = None
             for n in cpppaths:
-                if found:
+                candidate = os.path.join(n, filename)
+                if os.path.exists(candidate):
+                    found = candidate
                     break
-                if os.path.exists(os.path.join(n, filename)):
-                    found = os.path.join(n, filename)
-                #else:
-                #    # XXX: most likely wrong
-                #    found = os.path.join(n, filename)
-                #    nodes.append(found)
 
             if not found:
-                if not filename in names:
-                    names.append(filename)
-            elif not found in nodes:
+                names.add(filename)
+            elif not found in seen:
+                seen.add(found)
                 nodes.append(found)
                 _find_deps(found)
 
     _find_deps(node)
     return nodes
 
+# program name -> identity string, computed once per process
+_PROGRAM_IDENTITIES = {}
+
+def program_identity(name):
+    """Return a string identifying the given program (resolved path, size
+    and mtime), or None if it cannot be found."""
+    try:
+        return _PROGRAM_IDENTITIES[name]
+    except KeyError:
+        pass
+    if os.path.isabs(name):
+        path = name
+    else:
+        path = find_program(name)
+    identity = None
+    if path is not None and os.path.isfile(path):
+        path = os.path.realpath(path)
+        st = os.stat(path)
+        identity = "%s:%d:%r" % (path, st.st_size, st.st_mtime)
+    _PROGRAM_IDENTITIES[name] = identity
+    return identity
+
 def find_program(program, path_list=None):
     if path_list is None:
         path_list = os.environ["PATH"].split(os.pathsep)
@@ -0,0 +1,36 @@
+"""Helpers for the benchmarks of the test suite.
+
+Wall-clock comparisons are not reliable on loaded machines, so timings are
+only checked when the BENTO_BENCHMARKS environment variable is set. Otherwise
+benchmarks run their code once, as ordinary tests checking its results.
+"""
+import os
+import gc
+import time
+
+BENCHMARKS_ENV = "BENTO_BENCHMARKS"
+
+def benchmarks_enabled():
+    return bool(os.environ.get(BENCHMARKS_ENV))
+
+def best_time(func, repeat=None):
+    """Call func repeat times (3 if benchmarks are enabled, 1 otherwise), and
+    return the best elapsed time with the result of the last call.
+
+    The garbage collector is disabled while func runs, as its cost depends on
+    every object alive in the process, not only on the ones used by func."""
+    if repeat is None:
+        if benchmarks_enabled():
+            repeat = 3
+        else:
+            repeat = 1
+    times = []
+    for i in range(repeat):
+        gc.disable()
+        try:
+            t0 = time.time()
+            result = func()
+            times.append(time.time() - t0)
+        finally:
+            gc.enable()
+    return min(times), result
@@ -0,0 +1,441 @@
+"""
+Reproducible archive writers, compressing in parallel.
+
+Archives only depend on the content and the executable bit of the archived
+files: members are sorted by name, and their mtime, owner and permissions are
+normalized. The mtime is taken from the SOURCE_DATE_EPOCH environment variable
+if set (see https://reproducible-builds.org/specs/source-date-epoch/).
+
+Tarballs are written as a stream, cut in fixed-size chunks which are compressed
+independently in a thread pool: the result is a multi-member gzip file or a
+multi-stream xz file, which any gzip/xz decompressor handles transparently.
+Zip entries are deflated in the thread pool. In both cases, the output is the
+same whatever the number of threads.
+
+Zip archives may also be written incrementally: a manifest records a content
+key for each entry, and the entries whose key did not change are copied
+compressed from the previous archive. Entries of incremental archives may be
+given their own date, e.g. for eggs, where zipimport compares the date of a
+.py entry with the header of its bytecode.
+"""
+import os
+import stat
+import struct
+import tarfile
+import time
+import zipfile
+import zlib
+import hashlib
+
+import os.path as op
+
+from collections \
+    import \
+        deque
+
+try:
+    import lzma
+except ImportError:
+    lzma = None
+
+import bento.errors
+
+from bento.compat.api \
+    import \
+        json
+from bento.utils.io2 \
+    import \
+        safe_write
+from bento.utils.os2 \
+    import \
+        rename
+
+# 1980-01-01 00:00:00 UTC, the smallest date which can be stored in a zip file
+_DEFAULT_MTIME = 315532800
+
+# Size of the uncompressed tar stream chunks compressed independently
+CHUNK_SIZE = 1024 * 1024
+
+GZIP_LEVEL = 9
+XZ_PRESET = 6
+DEFLATE_LEVEL = 6
+
+def archive_mtime():
+    """Return the mtime used for every archive member."""
+    try:
+        return int(os.environ["SOURCE_DATE_EPOCH"])
+    except (KeyError, ValueError):
+        return _DEFAULT_MTIME
+
+def _sorted_members(files):
+    """Return the list of (filename, archive name) sorted by archive name,
+    with '/' as the separator in archive names."""
+    return sorted([(filename, arcname.replace(os.sep, "/")) for filename, arcname in files],
+                  key=lambda item: item[1])
+
+def is_executable(filename):
+    return bool(os.stat(filename).st_mode & stat.S_IXUSR)
+
+def _read(filename):
+    fid = open(filename, "rb")
+    try:
+        return fid.read()
+    finally:
+        fid.close()
+
+class _OrderedPool(object):
+    """Apply a function to items in a thread pool, and yield the results in
+    submission order.
+
+    At most max_pending items are being processed at any time, so that memory
+    usage is bounded whatever the number of items."""
+    def __init__(self, jobs):
+        if jobs > 1:
+            from multiprocessing.pool import ThreadPool
+            self._pool = ThreadPool(jobs)
+        else:
+            self._pool = None
+        self._pending = deque()
+        self._max_pending = 2 * jobs
+
+    def submit(self, func, *args):
+        """Submit func(*args), and return the results ready to be consumed."""
+        if self._pool is None:
+            return [func(*args)]
+        self._pending.append(self._pool.apply_async(func, args))
+        ret = []
+        while len(self._pending) > self._max_pending:
+            ret.append(self._pending.popleft().get())
+        return ret
+
+    def drain(self):
+        """Return every remaining result."""
+        ret = []
+        while self._pending:
+            ret.append(self._pending.popleft().get())
+        return ret
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+
+def _gzip_member(data):
+    # Header with no file name and a null mtime, so that the output only
+    # depends on the data
+    compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, -zlib.MAX_WBITS)
+    return b"".join([b"\037\213\010\000\000\000\000\000\002\377",
+                     compressor.compress(data), compressor.flush(),
+                     struct.pack("<LL", zlib.crc32(data) & 0xffffffff, len(data) & 0xffffffff)])
+
+def _xz_stream(data):
+    return lzma.compress(data, format=lzma.FORMAT_XZ, check=lzma.CHECK_CRC64, preset=XZ_PRESET)
+
+class _ChunkedWriter(object):
+    """Write-only file object which compresses what is written to it by
+    fixed-size chunks in parallel, and writes the compressed chunks in order to
+    the given file."""
+    def __init__(self, fid, compress, pool):
+        self._fid = fid
+        self._compress = compress
+        self._pool = pool
+        self._buffer = []
+        self._size = 0
+
+    def write(self, data):
+        self._buffer.append(data)
+        self._size += len(data)
+        if self._size >= CHUNK_SIZE:
+            data = b"".join(self._buffer)
+            n = len(data) - len(data) % CHUNK_SIZE
+            for i in range(0, n, CHUNK_SIZE):
+                self._write_compressed(self._pool.submit(self._compress, data[i:i+CHUNK_SIZE]))
+            self._buffer = [data[n:]]
+            self._size = len(data) - n
+
+    def _write_compressed(self, chunks):
+        for chunk in chunks:
+            self._fid.write(chunk)
+
+    def close(self):
+        if self._size > 0:
+            self._write_compressed(self._pool.submit(self._compress, b"".join(self._buffer)))
+            self._buffer = []
+            self._size = 0
+        self._write_compressed(self._pool.drain())
+
+_TAR_COMPRESSORS = {"gz": _gzip_member, "xz": _xz_stream}
+
+def write_tarball(archive, files, compression="gz", jobs=1):
+    """Write a reproducible compressed tarball.
+
+    Parameters
+    ----------
+    archive: str
+        filename of the archive to create
+    files: iterable
+        (filename, archive name) pairs
+    compression: str
+        "gz" or "xz"
+    jobs: int
+        number of compression threads
+    """
+    if compression == "xz" and lzma is None:
+        raise bento.errors.BentoError("xz compression requires the lzma module")
+    compress = _TAR_COMPRESSORS[compression]
+    mtime = archive_mtime()
+
+    pool = _OrderedPool(jobs)
+    try:
+        fid = open(archive, "wb")
+        try:
+            writer = _ChunkedWriter(fid, compress, pool)
+            tf = tarfile.open(fileobj=writer, mode="w|", format=tarfile.PAX_FORMAT)
+            try:
+                for filename, arcname in _sorted_members(files):
+                    tarinfo = tarfile.TarInfo(arcname)
+                    tarinfo.size = os.stat(filename).st_size
+                    tarinfo.mtime = mtime
+                    if is_executable(filename):
+                        tarinfo.mode = int("755", 8)
+                    else:
+                        tarinfo.mode = int("644", 8)
+                    tarinfo.uid = tarinfo.gid = 0
+                    tarinfo.uname = tarinfo.gname = ""
+                    member = open(filename, "rb")
+                    try:
+                        tf.addfile(tarinfo, member)
+                    finally:
+                        member.close()
+            finally:
+                tf.close()
+            writer.close()
+        finally:
+            fid.close()
+    finally:
+        pool.close()
+
+def _dos_fields(date_time):
+    year, month, day, hour, minute, second = date_time[:6]
+    if year < 1980:
+        year, month, day, hour, minute, second = 1980, 1, 1, 0, 0, 0
+    dos_date = (year - 1980) << 9 | month << 5 | day
+    dos_time = hour << 11 | minute << 5 | second // 2
+    return dos_date, dos_time
+
+def _dos_date_time(mtime):
+    return _dos_fields(time.gmtime(max(mtime, _DEFAULT_MTIME)))
+
+def _deflate(data):
+    compressor = zlib.compressobj(DEFLATE_LEVEL, zlib.DEFLATED, -zlib.MAX_WBITS)
+    compressed = compressor.compress(data) + compressor.flush()
+    return zlib.crc32(data) & 0xffffffff, len(data), compressed
+
+class _ZipWriter(object):
+    """Minimal zip writer, for entries which are already compressed.
+
+    Entries get the date of the archive unless given their own date_time (a
+    local time tuple, as ZipInfo.date_time), and are marked as created on
+    unix so that their mode is honored."""
+    def __init__(self, fid, mtime):
+        self._fid = fid
+        self._dos_date, self._dos_time = _dos_date_time(mtime)
+        self._offset = 0
+        self._directory = []
+
+    def add(self, arcname, method, crc, size, compressed, executable=False, date_time=None):
+        if size >= 0xffffffff or self._offset >= 0xffffffff:
+            raise bento.errors.BentoError("File too big for a zip archive: %r" % arcname)
+        if len(self._directory) >= 0xffff:
+            raise bento.errors.BentoError("Too many files for a zip archive")
+        name = arcname.encode("utf-8")
+        if date_time is None:
+            dos_date, dos_time = self._dos_date, self._dos_time
+        else:
+            dos_date, dos_time = _dos_fields(date_time)
+        # Flag bit 11: file name encoded in UTF-8
+        header = struct.pack("<4s5H3L2H", b"PK\003\004", 20, 0x800,
+                             method, dos_time, dos_date,
+                             crc, len(compressed), size, len(name), 0)
+        if executable:
+            mode = int("100755", 8)
+        else:
+            mode = int("100644", 8)
+        # Made by unix (3) version 2.0
+        self._directory.append(struct.pack("<4s6H3L5H2L", b"PK\001\002",
+                                           3 << 8 | 20, 20, 0x800,
+                                           method, dos_time, dos_date,
+                                           crc, len(compressed), size,
+                                           len(name), 0, 0, 0, 0,
+                                           mode << 16, self._offset) + name)
+        self._fid.write(header)
+        self._fid.write(name)
+        self._fid.write(compressed)
+        self._offset += len(header) + len(name) + len(compressed)
+
+    def close(self):
+        directory = b"".join(self._directory)
+        self._fid.write(directory)
+        self._fid.write(struct.pack("<4s4H2LH", b"PK\005\006", 0, 0,
+                                    len(self._directory), len(self._directory),
+                                    len(directory), self._offset, 0))
+
+def _deflate_file(filename, arcname):
+    crc, size, compressed = _deflate(_read(filename))
+    return arcname, crc, size, compressed, is_executable(filename)
+
+def write_zarchive(archive, files, jobs=1):
+    """Write a reproducible zip archive, with deflated entries.
+
+    Parameters
+    ----------
+    archive: str
+        filename of the archive to create
+    files: iterable
+        (filename, archive name) pairs
+    jobs: int
+        number of compression threads
+    """
+    pool = _OrderedPool(jobs)
+    try:
+        fid = open(archive, "wb")
+        try:
+            writer = _ZipWriter(fid, archive_mtime())
+
+            def _write_entries(entries):
+                for arcname, crc, size, compressed, executable in entries:
+                    writer.add(arcname, zlib.DEFLATED, crc, size, compressed, executable)
+
+            for filename, arcname in _sorted_members(files):
+                _write_entries(pool.submit(_deflate_file, filename, arcname))
+            _write_entries(pool.drain())
+            writer.close()
+        finally:
+            fid.close()
+    finally:
+        pool.close()
+
+def content_key(data):
+    """Key identifying the given content in an incremental zip manifest."""
+    return hashlib.sha1(data).hexdigest()
+
+def load_zip_manifest(archive, manifest):
+    """Return the dictionary archive name -> content key recorded in the
+    manifest file for the given archive, or an empty dictionary if the archive
+    was modified or does not exist anymore."""
+    try:
+        fid = open(manifest, "r")
+        try:
+            data = json.load(fid)
+        finally:
+            fid.close()
+        st = os.stat(archive)
+    except (IOError, OSError, ValueError):
+        return {}
+
+    if not isinstance(data, dict) or data.get("archive") != op.abspath(archive) \
+            or data.get("signature") != [st.st_size, st.st_mtime]:
+        return {}
+    return data.get("entries", {})
+
+def _read_raw_entries(archive):
+    """Yield (archive name, method, crc, size, compressed data) for every entry
+    of the given zip archive, without decompressing them."""
+    z = zipfile.ZipFile(archive)
+    try:
+        infos = z.infolist()
+    finally:
+        z.close()
+
+    fid = open(archive, "rb")
+    try:
+        for info in infos:
+            fid.seek(info.header_offset)
+            header = fid.read(30)
+            if header[:4] != b"PK\003\004":
+                raise zipfile.BadZipfile("Bad local header for %r" % info.filename)
+            name_length, extra_length = struct.unpack("<2H", header[26:30])
+            fid.seek(info.header_offset + 30 + name_length + extra_length)
+            executable = bool((info.external_attr >> 16) & stat.S_IXUSR)
+            yield info.filename, info.compress_type, info.CRC, info.file_size, \
+                  fid.read(info.compress_size), executable
+    finally:
+        fid.close()
+
+def _deflate_entry(arcname, content, executable, date_time):
+    crc, size, compressed = _deflate(content())
+    return arcname, zlib.DEFLATED, crc, size, compressed, executable, date_time
+
+def _reused_entry(entry, date_time):
+    return entry + (date_time,)
+
+def write_zarchive_incremental(archive, entries, manifest, jobs=1):
+    """Write a zip archive, copying the entries which did not change since the
+    previous archive without compressing them again.
+
+    Parameters
+    ----------
+    archive: str
+        filename of the archive to create
+    entries: iterable
+        (archive name, content key, content, executable, date_time) tuples,
+        where content is a callable returning the entry content. It is only
+        called if the content key or the executable bit of the entry changed
+        since the previous archive. date_time is the local time tuple of the
+        entry date, or None for the reproducible archive date.
+    manifest: str
+        filename of the manifest recording the content keys of the archive.
+    jobs: int
+        number of compression threads
+
+    Returns
+    -------
+    reused: int
+        number of entries copied from the previous archive
+    """
+    old_keys = load_zip_manifest(archive, manifest)
+    reused = {}
+    if old_keys:
+        try:
+            for entry in _read_raw_entries(archive):
+                # Only reuse the plain, deflated or stored, entries
+                if entry[1] in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED):
+                    reused[entry[0]] = entry
+        except (IOError, zipfile.BadZipfile):
+            reused = {}
+
+    keys = {}
+    n_reused = 0
+    pool = _OrderedPool(jobs)
+    try:
+        fid = open(archive + ".tmp", "wb")
+        try:
+            writer = _ZipWriter(fid, archive_mtime())
+
+            def _write_entries(entries):
+                for arcname, method, crc, size, compressed, executable, date_time in entries:
+                    writer.add(arcname, method, crc, size, compressed, executable, date_time)
+
+            for arcname, key, content, executable, date_time in entries:
+                arcname = arcname.replace(os.sep, "/")
+                keys[arcname] = key
+                if arcname in reused and old_keys.get(arcname) == key \
+                        and reused[arcname][5] == executable:
+                    _write_entries(pool.submit(_reused_entry, reused[arcname], date_time))
+                    n_reused += 1
+                else:
+                    _write_entries(pool.submit(_deflate_entry, arcname, content, executable, date_time))
+            _write_entries(pool.drain())
+            writer.close()
+        finally:
+            fid.close()
+    finally:
+        pool.close()
+    rename(archive + ".tmp", archive)
+
+    st = os.stat(archive)
+    data = {"archive": op.abspath(archive), "signature": [st.st_size, st.st_mtime],
+            "entries": keys}
+    safe_write(manifest, lambda fd: json.dump(data, fd), mode="w")
+    return n_reused
@@ -1,3 +1,4 @@
+import os
 import errno
 import shutil
 
@@ -8,6 +9,16 @@ from bento.compat.api \
     import \
         rename as _rename
 
+# Size of the blocks copied at once by copy_file_range/sendfile
+COPY_CHUNK_SIZE = 8 * 1024 * 1024
+
+# errno values meaning that copy_file_range/sendfile cannot be used for the
+# given files, in which case we fall back to a plain copy
+_UNSUPPORTED_ERRNOS = set(getattr(errno, name) for name in
+                          ["EINVAL", "ENOSYS", "EXDEV", "EBADF", "ENOTSUP",
+                           "EOPNOTSUPP", "ENOTSOCK", "EPERM"]
+                          if hasattr(errno, name))
+
 def rename(source, target):
     try:
         _rename(source, target)
@@ -18,3 +29,63 @@ def rename(source, target):
         else:
             raise
 
+def _copy_file_range(infd, outfd, offset):
+    return os.copy_file_range(infd, outfd, COPY_CHUNK_SIZE, offset, offset)
+
+def _sendfile(infd, outfd, offset):
+    return os.sendfile(outfd, infd, offset, COPY_CHUNK_SIZE)
+
+# In-kernel copy functions, in order of preference
+_KERNEL_COPIES = []
+if hasattr(os, "copy_file_range"):
+    _KERNEL_COPIES.append(_copy_file_range)
+if hasattr(os, "sendfile"):
+    _KERNEL_COPIES.append(_sendfile)
+
+def _kernel_copy(copy, infd, outfd):
+    """Copy infd into outfd with the given in-kernel copy function. Return False
+    if the function is not supported for those files."""
+    offset = 0
+    while True:
+        try:
+            n = copy(infd, outfd, offset)
+        except OSError:
+            e = extract_exception()
+            if offset == 0 and e.errno in _UNSUPPORTED_ERRNOS:
+                return False
+            raise
+        if n == 0:
+            return True
+        offset += n
+
+def copy_file_data(fsrc, fdst):
+    """Copy the content of the file object fsrc into fdst, without going
+    through user space when copy_file_range or sendfile are available."""
+    for copy in _KERNEL_COPIES:
+        if _kernel_copy(copy, fsrc.fileno(), fdst.fileno()):
+            return
+    shutil.copyfileobj(fsrc, fdst)
+
+def copy_times(source_stat, target):
+    """Set the access and modification times of target from the given stat
+    result, with a nanosecond resolution when available."""
+    if hasattr(source_stat, "st_mtime_ns"):
+        os.utime(target, ns=(source_stat.st_atime_ns, source_stat.st_mtime_ns))
+    else:
+        os.utime(target, (source_stat.st_atime, source_stat.st_mtime))
+
+def copy_file(source, target):
+    """Copy source into target, with its permissions and times, as 'cp -p'
+    would."""
+    fsrc = open(source, "rb")
+    try:
+        fdst = open(target, "wb")
+        try:
+            copy_file_data(fsrc, fdst)
+        finally:
+            fdst.close()
+        st = os.fstat(fsrc.fileno())
+    finally:
+        fsrc.close()
+    shutil.copymode(source, target)
+    copy_times(st, target)
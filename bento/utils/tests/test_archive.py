@@ -0,0 +1,240 @@
+import os
+import stat
+import shutil
+import tarfile
+import tempfile
+import time
+import zipfile
+
+import os.path as op
+
+from bento.compat.api.moves \
+    import \
+        unittest
+
+import bento.utils.archive
+
+from bento.utils.archive \
+    import \
+        write_tarball, write_zarchive, archive_mtime, lzma, content_key, \
+        load_zip_manifest, write_zarchive_incremental
+
+class TestArchive(unittest.TestCase):
+    def setUp(self):
+        self.d = tempfile.mkdtemp()
+        self.files = []
+        # Big enough to be split in several compressed chunks
+        self.big = "".join("line %d\n" % i for i in range(300000)).encode()
+        for name, content in [("foo.py", b"print(1)\n"), ("big.txt", self.big),
+                              (op.join("sub", "bar.txt"), b"")]:
+            filename = op.join(self.d, name)
+            if not op.exists(op.dirname(filename)):
+                os.makedirs(op.dirname(filename))
+            fid = open(filename, "wb")
+            try:
+                fid.write(content)
+            finally:
+                fid.close()
+            self.files.append((filename, op.join("foo-1.0", name)))
+        os.chmod(self.files[0][0], int("755", 8))
+
+        self.old_chunk_size = bento.utils.archive.CHUNK_SIZE
+        bento.utils.archive.CHUNK_SIZE = 256 * 1024
+
+    def tearDown(self):
+        bento.utils.archive.CHUNK_SIZE = self.old_chunk_size
+        shutil.rmtree(self.d)
+
+    def _archive(self, name):
+        return op.join(self.d, name)
+
+    def _read(self, filename):
+        fid = open(filename, "rb")
+        try:
+            return fid.read()
+        finally:
+            fid.close()
+
+    def _check_tarball(self, compression):
+        archive = self._archive("foo.tar." + compression)
+        write_tarball(archive, reversed(self.files), compression, jobs=3)
+
+        tf = tarfile.open(archive)
+        try:
+            members = tf.getmembers()
+            self.assertEqual([m.name for m in members],
+                             ["foo-1.0/big.txt", "foo-1.0/foo.py", "foo-1.0/sub/bar.txt"])
+            self.assertEqual([m.mode for m in members], [int("644", 8), int("755", 8), int("644", 8)])
+            self.assertEqual(set(m.mtime for m in members), set([archive_mtime()]))
+            self.assertEqual(set((m.uid, m.gid, m.uname, m.gname) for m in members), set([(0, 0, "", "")]))
+            self.assertEqual(tf.extractfile(members[0]).read(), self.big)
+        finally:
+            tf.close()
+
+        # Same output whatever the number of threads or the mtime of the files
+        reference = self._read(archive)
+        os.utime(self.files[1][0], (0, 0))
+        write_tarball(archive, self.files, compression, jobs=1)
+        self.assertEqual(self._read(archive), reference)
+
+    def test_gztar(self):
+        self._check_tarball("gz")
+
+    def test_xztar(self):
+        if lzma is None:
+            raise unittest.SkipTest("lzma not available")
+        self._check_tarball("xz")
+
+    def test_zip(self):
+        archive = self._archive("foo.zip")
+        write_zarchive(archive, reversed(self.files), jobs=3)
+
+        z = zipfile.ZipFile(archive)
+        try:
+            self.assertTrue(z.testzip() is None)
+            infos = z.infolist()
+            self.assertEqual([i.filename for i in infos],
+                             ["foo-1.0/big.txt", "foo-1.0/foo.py", "foo-1.0/sub/bar.txt"])
+            self.assertEqual([stat.S_IMODE(i.external_attr >> 16) for i in infos],
+                             [int("644", 8), int("755", 8), int("644", 8)])
+            self.assertEqual(set(i.date_time for i in infos), set([(1980, 1, 1, 0, 0, 0)]))
+            self.assertEqual(z.read("foo-1.0/big.txt"), self.big)
+        finally:
+            z.close()
+
+        reference = self._read(archive)
+        write_zarchive(archive, self.files, jobs=1)
+        self.assertEqual(self._read(archive), reference)
+
+    def test_source_date_epoch(self):
+        old = os.environ.get("SOURCE_DATE_EPOCH")
+        try:
+            os.environ["SOURCE_DATE_EPOCH"] = "1234567890"
+            self.assertEqual(archive_mtime(), 1234567890)
+        finally:
+            if old is None:
+                del os.environ["SOURCE_DATE_EPOCH"]
+            else:
+                os.environ["SOURCE_DATE_EPOCH"] = old
+
+class TestIncrementalZip(unittest.TestCase):
+    def setUp(self):
+        self.d = tempfile.mkdtemp()
+        self.archive = op.join(self.d, "foo.egg")
+        self.manifest = op.join(self.d, "manifest.json")
+        self.called = []
+
+    def tearDown(self):
+        shutil.rmtree(self.d)
+
+    def _entries(self, contents, executables):
+        def _content(name, data):
+            def _f():
+                self.called.append(name)
+                return data
+            return _f
+        return [(name, content_key(data), _content(name, data), name in executables, None)
+                for name, data in contents]
+
+    def _write(self, contents, jobs=1, executables=None):
+        if executables is None:
+            executables = []
+        self.called = []
+        return write_zarchive_incremental(self.archive, self._entries(contents, executables),
+                                          self.manifest, jobs)
+
+    def _read(self):
+        fid = open(self.archive, "rb")
+        try:
+            return fid.read()
+        finally:
+            fid.close()
+
+    def test_reuse(self):
+        contents = [("EGG-INFO/PKG-INFO", b"Name: foo\n"),
+                    (op.join("foo", "__init__.py"), b"print(1)\n" * 1000),
+                    ("foo/bar.py", b"")]
+        self.assertEqual(self._write(contents), 0)
+        self.assertEqual(len(self.called), 3)
+        self.assertEqual(sorted(load_zip_manifest(self.archive, self.manifest)),
+                         ["EGG-INFO/PKG-INFO", "foo/__init__.py", "foo/bar.py"])
+
+        self.assertEqual(self._write(contents, jobs=3), 3)
+        self.assertEqual(self.called, [])
+
+        contents[2] = ("foo/bar.py", b"print(2)\n")
+        self.assertEqual(self._write(contents), 2)
+        self.assertEqual(self.called, ["foo/bar.py"])
+        incremental = self._read()
+
+        z = zipfile.ZipFile(self.archive)
+        try:
+            self.assertTrue(z.testzip() is None)
+            self.assertEqual(z.namelist(), ["EGG-INFO/PKG-INFO", "foo/__init__.py", "foo/bar.py"])
+            self.assertEqual(z.read("foo/__init__.py"), b"print(1)\n" * 1000)
+            self.assertEqual(z.read("foo/bar.py"), b"print(2)\n")
+        finally:
+            z.close()
+
+        # Same archive as a full rebuild
+        os.remove(self.manifest)
+        self.assertEqual(self._write(contents), 0)
+        self.assertEqual(self._read(), incremental)
+
+    def test_executable(self):
+        contents = [("foo/bar.py", b"print(1)\n"), ("foo/_bar.so", b"\0")]
+        def _modes():
+            z = zipfile.ZipFile(self.archive)
+            try:
+                return [(info.external_attr >> 16) & 0o777 for info in z.infolist()]
+            finally:
+                z.close()
+
+        self._write(contents, executables=["foo/_bar.so"])
+        self.assertEqual(_modes(), [0o644, 0o755])
+
+        # The executable bit is kept for reused entries, and a change of the
+        # executable bit only is taken into account
+        self.assertEqual(self._write(contents, executables=["foo/_bar.so"]), 2)
+        self.assertEqual(_modes(), [0o644, 0o755])
+        self.assertEqual(self._write(contents), 1)
+        self.assertEqual(self.called, ["foo/_bar.so"])
+        self.assertEqual(_modes(), [0o644, 0o644])
+
+    def test_modified_archive(self):
+        contents = [("foo/bar.py", b"print(1)\n")]
+        self._write(contents)
+
+        z = zipfile.ZipFile(self.archive, "a")
+        try:
+            z.writestr("foo/baz.py", b"")
+        finally:
+            z.close()
+        self.assertEqual(load_zip_manifest(self.archive, self.manifest), {})
+        self.assertEqual(self._write(contents), 0)
+        self.assertEqual(self.called, ["foo/bar.py"])
+
+    def test_invalid_manifest(self):
+        self._write([("foo/bar.py", b"")])
+        fid = open(self.manifest, "w")
+        try:
+            fid.write("garbage")
+        finally:
+            fid.close()
+        self.assertEqual(load_zip_manifest(self.archive, self.manifest), {})
+        self.assertEqual(self._write([("foo/bar.py", b"")]), 0)
+
+    def test_date_time(self):
+        entries = [("foo/bar.py", content_key(b""), lambda: b"", False, (2011, 5, 3, 12, 30, 41)),
+                   ("foo/fubar.py", content_key(b""), lambda: b"", False, None)]
+        write_zarchive_incremental(self.archive, entries, self.manifest)
+        # Reused entries get the new date
+        entries[0] = entries[0][:4] + ((2012, 1, 2, 3, 4, 6),)
+        self.assertEqual(write_zarchive_incremental(self.archive, entries, self.manifest), 2)
+
+        z = zipfile.ZipFile(self.archive)
+        try:
+            self.assertEqual([info.date_time for info in z.infolist()],
+                             [(2012, 1, 2, 3, 4, 6), time.gmtime(archive_mtime())[:6]])
+        finally:
+            z.close()
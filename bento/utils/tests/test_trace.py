@@ -0,0 +1,65 @@
+import os
+import shutil
+import tempfile
+try:
+    import json
+except ImportError:
+    import simplejson as json
+
+from bento.compat.api.moves \
+    import \
+        unittest
+from bento.utils.trace \
+    import \
+        Tracer
+
+# Two independent cc -> link chains
+_DEPS = {"cc0": [], "link0": ["cc0"], "cc1": [], "link1": ["cc1"]}
+
+def _task_graph(tasks):
+    deps = dict([(t, set(_DEPS[t])) for t in tasks])
+    rdeps = dict([(t, set()) for t in tasks])
+    for t in tasks:
+        for d in deps[t]:
+            rdeps[d].add(t)
+    return deps, rdeps
+
+class TestTracer(unittest.TestCase):
+    def setUp(self):
+        self.d = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.d)
+
+    def test_write(self):
+        tracer = Tracer()
+        tracer.add_task("cc0", 10, 10.5, {"executed": True})
+        tracer.add_event("compile", "bento", 10, 11)
+
+        filename = os.path.join(self.d, "trace.json")
+        tracer.write(filename)
+        events = json.load(open(filename))["traceEvents"]
+        self.assertEqual(len(events), 2)
+        for e in events:
+            self.assertEqual(e["ph"], "X")
+        compile_event = [e for e in events if e["name"] == "compile"][0]
+        self.assertEqual(compile_event["dur"], 1000000)
+
+    def test_critical_path(self):
+        tracer = Tracer(_task_graph)
+        # Chain 0 takes 1 + 2s, chain 1 takes 2 + 2s
+        for task, start, end in [("cc0", 0, 1), ("cc1", 0, 2),
+                                 ("link0", 2, 4), ("link1", 2, 4)]:
+            tracer.add_task(task, start, end)
+
+        length, path = tracer.critical_path()
+        self.assertEqual(length, 4)
+        self.assertEqual(path, ["cc1", "link1"])
+        self.assertEqual([t for d, t in tracer.slowest_tasks(1)], ["cc1"])
+        self.assertTrue("Critical path: 4.000s (2 tasks)" in tracer.summary())
+
+    def test_no_task_graph(self):
+        tracer = Tracer()
+        tracer.add_task("cc0", 0, 1)
+        self.assertEqual(tracer.critical_path(), (0.0, []))
+        self.assertFalse("Critical path" in tracer.summary())
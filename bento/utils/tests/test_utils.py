@@ -28,7 +28,8 @@ from bento.utils.io2 \
         safe_write
 from bento.utils.os2 \
     import \
-        rename
+        rename, copy_file
+import bento.utils.os2
 import bento.utils.path
 
 def raise_oserror(err):
@@ -110,6 +111,22 @@ class TestSameFile(unittest.TestCase):
         finally:
             os.remove(f1.name)
 
+    def test_different_size(self):
+        f1 = NamedTemporaryFile("wt", delete=False)
+        try:
+            f1.write("fofo")
+            f1.close()
+            f2 = NamedTemporaryFile("wt", delete=False)
+            try:
+                f2.write("fofofo")
+                f2.close()
+                self.assertFalse(same_content(f1.name, f2.name))
+                self.assertFalse(same_content(f1.name, f2.name, bufsize=1))
+            finally:
+                os.remove(f2.name)
+        finally:
+            os.remove(f1.name)
+
 class TestMisc(unittest.TestCase):
     def test_cmd_is_runnable(self):
         st = cmd_is_runnable(["python", "-c", "''"])
@@ -155,6 +172,69 @@ class TestMisc(unittest.TestCase):
     def test_rename_failure(self):
         self.assertRaises(OSError, self._test_rename)
 
+class TestCopyFile(unittest.TestCase):
+    def setUp(self):
+        self.d = tempfile.mkdtemp()
+        self.source = op.join(self.d, "source")
+        self.target = op.join(self.d, "target")
+        self.content = "".join("line %d\n" % i for i in range(100000)).encode()
+        fid = open(self.source, "wb")
+        try:
+            fid.write(self.content)
+        finally:
+            fid.close()
+        os.chmod(self.source, int("755", 8))
+        os.utime(self.source, (1000000000, 1000000000))
+
+        self.old_chunk_size = bento.utils.os2.COPY_CHUNK_SIZE
+        bento.utils.os2.COPY_CHUNK_SIZE = 64 * 1024
+
+    def tearDown(self):
+        bento.utils.os2.COPY_CHUNK_SIZE = self.old_chunk_size
+        shutil.rmtree(self.d)
+
+    def _check_copy(self):
+        copy_file(self.source, self.target)
+        fid = open(self.target, "rb")
+        try:
+            self.assertEqual(fid.read(), self.content)
+        finally:
+            fid.close()
+        st = os.stat(self.target)
+        self.assertEqual(st.st_mode & int("777", 8), int("755", 8))
+        self.assertEqual(st.st_mtime, os.stat(self.source).st_mtime)
+
+    def test_simple(self):
+        self._check_copy()
+        # Overwrite a bigger file
+        self.content = self.content[:100]
+        fid = open(self.source, "wb")
+        try:
+            fid.write(self.content)
+        finally:
+            fid.close()
+        self._check_copy()
+
+    def test_unsupported(self):
+        def _unsupported(infd, outfd, offset):
+            raise_oserror(errno.EXDEV)
+        old_copies = bento.utils.os2._KERNEL_COPIES
+        bento.utils.os2._KERNEL_COPIES = [_unsupported]
+        try:
+            self._check_copy()
+        finally:
+            bento.utils.os2._KERNEL_COPIES = old_copies
+
+    def test_failure(self):
+        def _failure(infd, outfd, offset):
+            raise_oserror(errno.ENOSPC)
+        old_copies = bento.utils.os2._KERNEL_COPIES
+        bento.utils.os2._KERNEL_COPIES = [_failure]
+        try:
+            self.assertRaises(OSError, lambda: copy_file(self.source, self.target))
+        finally:
+            bento.utils.os2._KERNEL_COPIES = old_copies
+
 class TestMemoize(unittest.TestCase):
     def test_simple_no_arguments(self):
         lst = []
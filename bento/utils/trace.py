@@ -0,0 +1,139 @@
+"""Build tracing: timing of build phases and tasks.
+
+Traces are written in the Chrome trace-event format (JSON), which can be
+loaded in chrome://tracing or any compatible viewer.
+
+This module does not depend on any build backend: backends feed the tracer
+with their tasks (see Tracer.add_task), and give the function computing the
+dependencies between them to report the critical path.
+"""
+import os
+import threading
+try:
+    import json
+except ImportError:
+    import simplejson as json
+
+class Tracer(object):
+    def __init__(self, task_graph=None):
+        # Function computing the (deps, rdeps) graph of a list of tasks, as
+        # yaku.task_manager.task_graph. The critical path is only reported
+        # if available.
+        self.task_graph = task_graph
+        # (name, category, start, end, worker id, args)
+        self.events = []
+        # task -> (start, end)
+        self.tasks = {}
+        self._workers = {}
+        self._lock = threading.Lock()
+
+    def _worker_id(self):
+        # Map threads to small integers, in order of first appearance
+        ident = threading.current_thread().ident
+        try:
+            return self._workers[ident]
+        except KeyError:
+            wid = self._workers[ident] = len(self._workers)
+            return wid
+
+    def add_event(self, name, category, start, end, args=None):
+        """Record an event which started and ended at the given times (as
+        returned by time.time())."""
+        if args is None:
+            args = {}
+        self._lock.acquire()
+        try:
+            self.events.append((name, category, start, end, self._worker_id(), args))
+        finally:
+            self._lock.release()
+
+    def add_task(self, task, start, end, args=None):
+        self.add_event(repr(task).strip("'"), "task", start, end, args)
+        self._lock.acquire()
+        try:
+            self.tasks[task] = (start, end)
+        finally:
+            self._lock.release()
+
+    def trace_events(self):
+        """Return the recorded events as a list of trace-event dicts."""
+        if not self.events:
+            return []
+        t0 = min([e[2] for e in self.events])
+        pid = os.getpid()
+        ret = []
+        for name, category, start, end, wid, args in self.events:
+            ret.append({"name": name, "cat": category, "ph": "X",
+                        "ts": int((start - t0) * 1e6),
+                        "dur": int((end - start) * 1e6),
+                        "pid": pid, "tid": wid, "args": args})
+        return ret
+
+    def write(self, filename):
+        fid = open(filename, "w")
+        try:
+            json.dump({"traceEvents": self.trace_events(),
+                       "displayTimeUnit": "ms"}, fid)
+        finally:
+            fid.close()
+
+    def slowest_tasks(self, n=10):
+        """Return the n slowest tasks as a list of (duration, task)."""
+        durations = [(end - start, task) for task, (start, end) in self.tasks.items()]
+        durations.sort(key=lambda x: -x[0])
+        return durations[:n]
+
+    def critical_path(self):
+        """Return the critical path of the traced tasks as a (length, tasks)
+        pair, where length is the sum of the durations of the tasks on the
+        longest dependency chain."""
+        tasks = list(self.tasks.keys())
+        if not tasks or self.task_graph is None:
+            return 0.0, []
+        deps, rdeps = self.task_graph(tasks)
+
+        # Visit the tasks in topological order
+        missing = dict([(t, len(deps[t])) for t in tasks])
+        ordered = [t for t in tasks if missing[t] == 0]
+        for t in ordered:
+            for r in rdeps[t]:
+                missing[r] -= 1
+                if missing[r] == 0:
+                    ordered.append(r)
+
+        length = {}
+        previous = {}
+        for t in ordered:
+            start, end = self.tasks[t]
+            best, best_dep = 0.0, None
+            for d in deps[t]:
+                if length[d] > best:
+                    best, best_dep = length[d], d
+            length[t] = best + end - start
+            previous[t] = best_dep
+
+        last = max(ordered, key=lambda t: length[t])
+        path = []
+        t = last
+        while t is not None:
+            path.append(t)
+            t = previous[t]
+        path.reverse()
+        return length[last], path
+
+    def summary(self, n=10):
+        lines = []
+        phases = [e for e in self.events if e[1] != "task"]
+        if phases:
+            lines.append("Phases:")
+            for name, category, start, end, wid, args in phases:
+                lines.append("    %8.3fs  %s" % (end - start, name))
+        slowest = self.slowest_tasks(n)
+        if slowest:
+            lines.append("Slowest tasks:")
+            for duration, task in slowest:
+                lines.append("    %8.3fs  %s" % (duration, repr(task).strip("'")))
+            if self.task_graph is not None:
+                length, path = self.critical_path()
+                lines.append("Critical path: %.3fs (%d tasks)" % (length, len(path)))
+        return "\n".join(lines)
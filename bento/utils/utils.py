@@ -18,11 +18,6 @@ from bento.compat.api \
     import \
         partial
 
-try:
-    from hashlib import md5
-except ImportError:
-    from md5 import md5
-
 
 
 # Color handling for terminals (taken from waf)
@@ -161,13 +156,20 @@ def cpu_count():
         return 1
         #raise NotImplementedError('cannot determine number of cpus')
 
-def same_content(f1, f2):
+def same_content(f1, f2, bufsize=1024 * 1024):
     """Return true if files in f1 and f2 has the same content."""
+    if os.path.getsize(f1) != os.path.getsize(f2):
+        return False
     fid1 = open(f1, "rb")
     try:
         fid2 = open(f2, "rb")
         try:
-            return md5(fid1.read()).digest() == md5(fid2.read()).digest()
+            while True:
+                b1 = fid1.read(bufsize)
+                if b1 != fid2.read(bufsize):
+                    return False
+                if not b1:
+                    return True
         finally:
             fid2.close()
     finally:
@@ -366,3 +368,12 @@ def read_or_create_dict(filename):
             fid.close()
     else:
         return {}
+
+# Files or directories modified less than RACY_DELAY seconds before being
+# looked at may be modified again without changing their mtime (coarse mtime
+# resolution), so their stat results should not be trusted
+RACY_DELAY = 2
+
+def stat_signature(st):
+    """(mtime, size, inode) signature of the given stat result."""
+    return (st.st_mtime, st.st_size, st.st_ino)
@@ -3,6 +3,7 @@
 #demandimport.enable()
 import sys
 import os
+import time
 import traceback
 import warnings
 
@@ -13,7 +14,7 @@ from bento.utils.utils \
         pprint, extract_exception
 from bento._config \
     import \
-        BENTO_SCRIPT, DB_FILE, _SUB_BUILD_DIR
+        BENTO_SCRIPT, DB_FILE, NODE_SNAPSHOT, _SUB_BUILD_DIR, _USE_NODE_SNAPSHOT
 from bento.core \
     import \
         PackageDescription
@@ -21,25 +22,10 @@ from bento.compat.api \
     import \
         defaultdict, input
 import bento.core.node
-
-from bento.commands.build \
-    import \
-        BuildCommand
-from bento.commands.build_egg \
-    import \
-        BuildEggCommand
-from bento.commands.build_pkg_info \
-    import \
-        BuildPkgInfoCommand
-from bento.commands.build_wininst \
-    import \
-        BuildWininstCommand
-from bento.commands.configure \
-    import \
-        ConfigureCommand
-from bento.commands.core \
+from bento.core.node_snapshot \
     import \
-        HelpCommand
+        DirectorySnapshot
+
 from bento.commands.dependency \
     import \
         CommandScheduler
@@ -47,27 +33,9 @@ from bento.commands.hooks \
     import \
         find_pre_hooks, find_post_hooks, find_startup_hooks, \
         find_shutdown_hooks, find_options_hooks, find_command_hooks
-from bento.commands.install \
-    import \
-        InstallCommand
-from bento.commands.parse \
-    import \
-        ParseCommand
-from bento.commands.register \
-    import \
-        RegisterPyPI
 from bento.commands.registries \
     import \
         CommandRegistry, ContextRegistry, OptionsRegistry
-from bento.commands.sdist \
-    import \
-        SdistCommand
-from bento.commands.sphinx_command \
-    import \
-        SphinxCommand
-from bento.commands.upload \
-    import \
-        UploadPyPI
 from bento.commands.options \
     import \
         OptionsContext, Option
@@ -75,9 +43,6 @@ from bento.commands.options \
 from bento.backends.utils \
     import \
         load_backend
-from bento.backends.yaku_backend \
-    import \
-        BuildYakuContext, ConfigureYakuContext
 from bento.commands.command_contexts \
     import \
         HelpContext, SdistContext, ContextWithBuildDirectory
@@ -87,9 +52,6 @@ from bento.commands.wrapper_utils \
 from bento.commands.contexts \
     import \
         GlobalContext
-from bento.convert \
-    import \
-        ConvertCommand, DetectTypeCommand
 import bento.errors
 
 from bentomakerlib.package_cache \
@@ -124,42 +86,46 @@ class GlobalOptions(object):
 #================================
 #   Create the command line UI
 #================================
+# Commands modules are only imported when the command is used (or its help
+# requested), to keep bentomaker startup fast.
+# (command name, module name, class name, public)
+_COMMANDS = [
+    ("help", "bento.commands.core", "HelpCommand", True),
+    ("configure", "bento.commands.configure", "ConfigureCommand", True),
+    ("build", "bento.commands.build", "BuildCommand", True),
+    ("install", "bento.commands.install", "InstallCommand", True),
+    ("convert", "bento.convert", "ConvertCommand", True),
+    ("sdist", "bento.commands.sdist", "SdistCommand", True),
+    ("build_egg", "bento.commands.build_egg", "BuildEggCommand", True),
+    ("build_wininst", "bento.commands.build_wininst", "BuildWininstCommand", True),
+    ("sphinx", "bento.commands.sphinx_command", "SphinxCommand", True),
+    ("register_pypi", "bento.commands.register", "RegisterPyPI", True),
+    ("upload_pypi", "bento.commands.upload", "UploadPyPI", True),
+    ("build_pkg_info", "bento.commands.build_pkg_info", "BuildPkgInfoCommand", False),
+    ("parse", "bento.commands.parse", "ParseCommand", False),
+    ("detect_type", "bento.convert", "DetectTypeCommand", False),
+]
+
 def register_commands(global_context):
-    global_context.register_command("help", HelpCommand())
-    global_context.register_command("configure", ConfigureCommand())
-    global_context.register_command("build", BuildCommand())
-    global_context.register_command("install", InstallCommand())
-    global_context.register_command("convert", ConvertCommand())
-    global_context.register_command("sdist", SdistCommand())
-    global_context.register_command("build_egg", BuildEggCommand())
-    global_context.register_command("build_wininst", BuildWininstCommand())
-    global_context.register_command("sphinx", SphinxCommand())
-    global_context.register_command("register_pypi", RegisterPyPI())
-    global_context.register_command("upload_pypi", UploadPyPI())
-
-    global_context.register_command("build_pkg_info", BuildPkgInfoCommand(), public=False)
-    global_context.register_command("parse", ParseCommand(), public=False)
-    global_context.register_command("detect_type", DetectTypeCommand(), public=False)
- 
+    for cmd_name, module_name, klass_name, public in _COMMANDS:
+        global_context.register_lazy_command(cmd_name, module_name, klass_name, public)
+
     if sys.platform == "darwin":
-        import bento.commands.build_mpkg
-        global_context.register_command("build_mpkg",
-            bento.commands.build_mpkg.BuildMpkgCommand(), public=False)
+        global_context.register_lazy_command("build_mpkg",
+            "bento.commands.build_mpkg", "BuildMpkgCommand", public=False)
         global_context.set_before("build_mpkg", "build")
 
     if sys.platform == "win32":
-        from bento.commands.build_msi \
-            import \
-                BuildMsiCommand
-        global_context.register_command("build_msi", BuildMsiCommand())
+        global_context.register_lazy_command("build_msi",
+            "bento.commands.build_msi", "BuildMsiCommand")
         global_context.set_before("build_msi", "build")
 
 def register_options(global_context, cmd_name):
     """Register options for the given command."""
-    cmd = global_context.retrieve_command(cmd_name)
-    context = OptionsContext.from_command(cmd)
-
+    # Lazily registered commands get their options context on demand
     if not global_context.is_options_context_registered(cmd_name):
+        cmd = global_context.retrieve_command(cmd_name)
+        context = OptionsContext.from_command(cmd)
         global_context.register_options_context(cmd_name, context)
 
 def register_options_special(global_context):
@@ -183,18 +149,24 @@ def register_command_contexts(global_context):
    # global_context.register_default_context(CmdContext)
     default_mapping = defaultdict(lambda: ContextWithBuildDirectory)
     default_mapping.update(dict([
-            ("configure", ConfigureYakuContext),
-            ("build", BuildYakuContext),
             ("build_egg", ContextWithBuildDirectory),
             ("build_wininst", ContextWithBuildDirectory),
             ("build_mpkg", ContextWithBuildDirectory),
             ("install", ContextWithBuildDirectory),
             ("sdist", SdistContext),
             ("help", HelpContext)]))
+    # Only imported if the command is run
+    lazy_mapping = {
+            "configure": ("bento.backends.yaku_backend", "ConfigureYakuContext"),
+            "build": ("bento.backends.yaku_backend", "BuildYakuContext")}
 
     for cmd_name in global_context.command_names(public_only=False):
         if not global_context.is_command_context_registered(cmd_name):
-            global_context.register_command_context(cmd_name, default_mapping[cmd_name])
+            if cmd_name in lazy_mapping:
+                module_name, klass_name = lazy_mapping[cmd_name]
+                global_context.register_lazy_command_context(cmd_name, module_name, klass_name)
+            else:
+                global_context.register_command_context(cmd_name, default_mapping[cmd_name])
 
 # All the global state/registration stuff goes here
 def register_stuff(global_context):
@@ -229,7 +201,13 @@ def main(argv=None):
     source_root = os.path.join(os.getcwd(), os.path.dirname(popts.bento_info))
     build_root = os.path.join(os.getcwd(), popts.build_directory)
 
-    top_node, build_node, run_node = bento.core.node.create_base_nodes(source_root, build_root)
+    if _USE_NODE_SNAPSHOT:
+        snapshot = DirectorySnapshot(os.path.join(build_root, NODE_SNAPSHOT),
+                                     source_root, [build_root])
+    else:
+        snapshot = None
+    top_node, build_node, run_node = bento.core.node.create_base_nodes(source_root, build_root,
+                                                                       snapshot=snapshot)
     if run_node != top_node and run_node.is_src():
         raise bento.errors.UsageException("You cannot execute bentomaker in a subdirectory of the source tree !")
     if run_node != build_node and run_node.is_bld():
@@ -247,14 +225,18 @@ def main(argv=None):
     global_context.set_before("install", "build")
 
     if cmd_name and cmd_name not in ["convert"]:
-        return _wrapped_main(global_context, popts, run_node, top_node, build_node)
+        ret = _wrapped_main(global_context, popts, run_node, top_node, build_node)
     else:
         # XXX: is cached package necessary here ?
         cached_package = None
         register_stuff(global_context)
         for cmd_name in global_context.command_names():
             register_options(global_context, cmd_name)
-        return _main(global_context, cached_package, popts, run_node, top_node, build_node)
+        ret = _main(global_context, cached_package, popts, run_node, top_node, build_node)
+    # Only saved after successful commands, and if they walked the tree
+    if snapshot is not None:
+        snapshot.save()
+    return ret
 
 def _wrapped_main(global_context, popts, run_node, top_node, build_node):
     # Some commands work without a bento description file (convert, help)
@@ -264,7 +246,9 @@ def _wrapped_main(global_context, popts, run_node, top_node, build_node):
     if bento_info_node is not None:
         db_node = build_node.make_node(DB_FILE)
         cached_package = CachedPackage(db_node)
+        start = time.time()
         package = cached_package.get_package(bento_info_node)
+        global_context.tracer.add_event("CachedPackage.get_package", "bento", start, time.time())
         package_options = cached_package.get_options(bento_info_node)
 
         if package.use_backends:
@@ -275,7 +259,9 @@ def _wrapped_main(global_context, popts, run_node, top_node, build_node):
                 global_context.backend = load_backend(package.use_backends[0])()
         global_context.register_package_options(package_options)
 
+        start = time.time()
         mods = set_main(package, top_node, build_node)
+        global_context.tracer.add_event("hook loading", "bento", start, time.time())
 
     else:
         warnings.warn("No %r file in current directory - only generic options "
@@ -447,7 +433,11 @@ def get_running_package(global_context, cached_package, bento_info):
     package_options = cached_package.get_options(bento_info)
     configure_argv = global_context.retrieve_command_argv("configure")
     flag_values = _get_package_user_flags(global_context, package_options, configure_argv)
-    return cached_package.get_package(bento_info, flag_values)
+    start = time.time()
+    try:
+        return cached_package.get_package(bento_info, flag_values)
+    finally:
+        global_context.tracer.add_event("CachedPackage.get_package", "bento", start, time.time())
 
 def run_cmd(global_context, cached_package, cmd_name, cmd_argv, run_node, top_node, build_node):
     cmd = global_context.retrieve_command(cmd_name)
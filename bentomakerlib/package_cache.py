@@ -1,17 +1,31 @@
 """
-Cache version 1
+Cache version 5
 
 db["version"] : version number
-db["magic"]   : "BENTOMAGIC"
-db["bento_checkums"] : pickled dictionary {filename: checksum(filename)} for
-                       each bento.info (including subentos)
-db["package_description"] : pickled PackageDescription instance
-db["user_flags"] : pickled user_flags dict
-db["parsed_dict"]: pickled raw parsed dictionary (as returned by
-                   raw_parse, before having been seen by the visitor)
+db["magic"]   : "CACHED_PACKAGE_BENTOMAGIC"
+db["bentos_signatures"] : dictionary {filename: (stat signature, checksum)}
+                          for each bento.info (including subentos and hook
+                          files). The stat signature is None if the file was
+                          modified too recently for its stat to be trusted.
+db["packages"] : dictionary {user flags key: pickled PackageDescription
+                 instance}, one entry per set of user flags seen since the
+                 last change of the bento files
+db["package_options"] : pickled PackageOptions instance
+db["parsed_dict"]: (checksum, pickled raw parsed dictionary) of the top
+                   bento.info (as returned by raw_parse, before having been
+                   seen by the visitor)
+db["subentos"] : dictionary {filename: (checksum, result)} for each subento,
+                 result being the raw_to_subpkg_kw output for its parsed
+                 bento.info
+
+The bento files are only read and hashed again when their stat signature
+(mtime, size, inode) changed, so that the common case (nothing changed)
+does not need to read, hash or parse any bento file. When some files did
+change, only those are parsed again.
 """
 import os
 import sys
+import time
 import warnings
 
 from bento.parser.misc \
@@ -23,7 +37,9 @@ from bento.core.package \
 from bento.core.options \
     import \
         raw_to_options_kw, PackageOptions
-from bento.utils.utils import extract_exception
+from bento.utils.utils \
+    import \
+        extract_exception, stat_signature, RACY_DELAY
 import bento.utils.path
 import bento.utils.io2
 
@@ -37,27 +53,54 @@ try:
 except ImportError:
     from md5 import md5
 
+def _checksum(filename):
+    fid = open(filename, "rb")
+    try:
+        return md5(fid.read()).hexdigest()
+    finally:
+        fid.close()
+
+def _file_signature(filename):
+    st = os.stat(filename)
+    if st.st_mtime < time.time() - RACY_DELAY:
+        stat_sig = stat_signature(st)
+    else:
+        stat_sig = None
+    return stat_sig, _checksum(filename)
+
+def _user_flags_key(user_flags):
+    if user_flags is None:
+        return None
+    else:
+        return tuple(sorted(user_flags.items()))
 
 class CachedPackage(object):
     def __init__(self, db_node):
         self._db_location = db_node
+        self._cache = None
+
+    def _get_cache(self):
+        # The db is only loaded once per instance
+        if self._cache is None:
+            self._cache = _CachedPackageImpl(self._db_location.abspath())
+        return self._cache
 
     def get_package(self, bento_info, user_flags=None):
-        cache = _CachedPackageImpl(self._db_location.abspath())
+        cache = self._get_cache()
         try:
             return cache.get_package(bento_info, user_flags)
         finally:
             cache.close()
 
     def get_options(self, bento_info):
-        cache = _CachedPackageImpl(self._db_location.abspath())
+        cache = self._get_cache()
         try:
             return cache.get_options(bento_info)
         finally:
             cache.close()
 
 class _CachedPackageImpl(object):
-    __version__ = "2"
+    __version__ = "5"
     __magic__ = "CACHED_PACKAGE_BENTOMAGIC"
 
     def _has_valid_magic(self, db):
@@ -75,27 +118,32 @@ class _CachedPackageImpl(object):
         self.db["magic"] = self.__magic__
         self.db["version"] = self.__version__
         self._first_time = True
+        self._dirty = True
 
     def _load_existing_cache(self, db_location):
         fid = open(db_location, "rb")
         try:
             db = pickle.load(fid)
-            if not self._has_valid_magic(db):
-                warnings.warn("Resetting invalid cached db")
-                self._reset()
         finally:
             fid.close()
 
+        if not self._has_valid_magic(db):
+            warnings.warn("Resetting invalid cached db")
+            self._reset()
+            return self.db
+
         version = db["version"]
         if version != self.__version__:
             warnings.warn("Resetting invalid version of cached db")
             self._reset()
+            return self.db
 
         return db
 
     def __init__(self, db_location):
         self._location = db_location
         self._first_time = False
+        self._dirty = False
         if not os.path.exists(db_location):
             bento.utils.path.ensure_dir(db_location)
             self._reset()
@@ -108,12 +156,24 @@ class _CachedPackageImpl(object):
                 self._reset()
 
     def _has_invalidated_cache(self):
-        if "bentos_checksums" in self.db:
-            r_checksums = pickle.loads(self.db["bentos_checksums"])
-            for f in r_checksums:
-                checksum = md5(open(f, "rb").read()).hexdigest()
-                if checksum != r_checksums[f]:
+        if "bentos_signatures" in self.db:
+            signatures = self.db["bentos_signatures"]
+            for f, (stat_sig, checksum) in signatures.items():
+                try:
+                    st = os.stat(f)
+                except OSError:
+                    return True
+                if stat_sig is not None and stat_signature(st) == stat_sig:
+                    continue
+                new_stat_sig, new_checksum = _file_signature(f)
+                if new_checksum != checksum:
                     return True
+                else:
+                    # Same content (e.g. file touched): record the new stat
+                    # signature so that we do not hash it next time
+                    if new_stat_sig != stat_sig:
+                        signatures[f] = (new_stat_sig, checksum)
+                        self._dirty = True
             return False
         else:
             return True
@@ -128,23 +188,21 @@ class _CachedPackageImpl(object):
             return self._get_package(bento_info, user_flags)
 
     def _get_package(self, bento_info, user_flags=None):
-        if self._first_time:
+        if self._first_time or self._has_invalidated_cache():
             self._first_time = False
+            self._dirty = True
             return _create_package_nocached(bento_info, user_flags, self.db)
         else:
-            if self._has_invalidated_cache():
-                return _create_package_nocached(bento_info, user_flags, self.db)
+            key = _user_flags_key(user_flags)
+            packages = self.db["packages"]
+            if key in packages:
+                return pickle.loads(packages[key])
             else:
-                r_user_flags = pickle.loads(self.db["user_flags"])
-                if user_flags is None:
-                    # FIXME: this case is wrong
-                    return pickle.loads(self.db["package_description"])
-                elif r_user_flags != user_flags:
-                    return _create_package_nocached(bento_info, user_flags, self.db)
-                else:
-                    raw = pickle.loads(self.db["parsed_dict"])
-                    pkg, files = _raw_to_pkg(raw, user_flags, bento_info)
-                    return pkg
+                raw = pickle.loads(self.db["parsed_dict"][1])
+                pkg, files = _raw_to_pkg(raw, user_flags, bento_info, self.db["subentos"])
+                _record_package(bento_info, user_flags, pkg, files, self.db)
+                self._dirty = True
+                return pkg
 
     def get_options(self, bento_info):
         try:
@@ -156,18 +214,17 @@ class _CachedPackageImpl(object):
             return self._get_options(bento_info)
 
     def _get_options(self, bento_info):
-        if self._first_time:
+        if self._first_time or self._has_invalidated_cache():
             self._first_time = False
+            self._dirty = True
             return _create_options_nocached(bento_info, {}, self.db)
         else:
-            if self._has_invalidated_cache():
-                return _create_options_nocached(bento_info, {}, self.db)
-            else:
-                raw = pickle.loads(self.db["parsed_dict"])
-                return _raw_to_options(raw)
+            return pickle.loads(self.db["package_options"])
 
     def close(self):
-        bento.utils.io2.safe_write(self._location, lambda fd: pickle.dump(self.db, fd))
+        if self._dirty:
+            bento.utils.io2.safe_write(self._location, lambda fd: pickle.dump(self.db, fd))
+            self._dirty = False
 
 def _create_package_nocached(bento_info, user_flags, db):
     pkg, options = _create_objects_no_cached(bento_info, user_flags, db)
@@ -181,28 +238,47 @@ def _raw_to_options(raw):
     kw = raw_to_options_kw(raw)
     return PackageOptions(**kw)
 
-def _raw_to_pkg(raw, user_flags, bento_info):
-    kw, files = raw_to_pkg_kw(raw, user_flags, bento_info)
+def _raw_to_pkg(raw, user_flags, bento_info, subento_cache=None):
+    kw, files = raw_to_pkg_kw(raw, user_flags, bento_info, subento_cache)
     pkg = PackageDescription(**kw)
     return pkg, files
 
-def _create_objects_no_cached(bento_info, user_flags, db):
+def _record_package(bento_info, user_flags, pkg, files, db):
     d = os.path.dirname(bento_info.abspath())
-    info_file = open(bento_info.abspath(), 'r')
-    try:
-        data = info_file.read()
-        raw = raw_parse(data, bento_info.abspath())
+    signatures = db["bentos_signatures"]
+    for f in files:
+        f = os.path.join(d, f)
+        if not f in signatures:
+            signatures[f] = _file_signature(f)
+    db["packages"][_user_flags_key(user_flags)] = pickle.dumps(pkg)
 
-        pkg, files = _raw_to_pkg(raw, user_flags, bento_info)
-        files = [os.path.join(d, f) for f in files]
-        options = _raw_to_options(raw)
+def _create_objects_no_cached(bento_info, user_flags, db):
+    filename = bento_info.abspath()
+    checksum = _checksum(filename)
+    # Results of the previous build for the files which did not change are
+    # reused
+    parsed_dict = db.get("parsed_dict")
+    if parsed_dict is not None and parsed_dict[0] == checksum:
+        raw = pickle.loads(parsed_dict[1])
+    else:
+        info_file = open(filename, 'r')
+        try:
+            raw = raw_parse(info_file.read(), filename)
+        finally:
+            info_file.close()
+    subento_cache = db.get("subentos", {})
 
-        checksums = [md5(open(f, "rb").read()).hexdigest() for f in files]
-        db["bentos_checksums"] = pickle.dumps(dict(zip(files, checksums)))
-        db["package_description"] = pickle.dumps(pkg)
-        db["user_flags"] = pickle.dumps(user_flags)
-        db["parsed_dict"] = pickle.dumps(raw)
+    pkg, files = _raw_to_pkg(raw, user_flags, bento_info, subento_cache)
+    options = _raw_to_options(raw)
 
-        return pkg, options
-    finally:
-        info_file.close()
+    d = os.path.dirname(filename)
+    used = set([os.path.normpath(os.path.join(d, f)) for f in files])
+
+    db["bentos_signatures"] = {}
+    db["packages"] = {}
+    db["package_options"] = pickle.dumps(options)
+    db["parsed_dict"] = (checksum, pickle.dumps(raw))
+    db["subentos"] = dict([(f, v) for f, v in subento_cache.items() if f in used])
+    _record_package(bento_info, user_flags, pkg, files, db)
+
+    return pkg, options
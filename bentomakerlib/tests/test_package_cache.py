@@ -0,0 +1,170 @@
+import os
+import time
+import tempfile
+import shutil
+
+import os.path as op
+
+from bento.compat.api.moves \
+    import \
+        unittest
+from bento.core.node \
+    import \
+        create_base_nodes
+
+import bento.core.package
+import bentomakerlib.package_cache
+
+from bentomakerlib.package_cache \
+    import \
+        CachedPackage
+
+BENTO_INFO = """\
+Name: foo
+
+Flag: bundle
+    Description: foo
+    Default: true
+
+Library:
+    if flag(bundle):
+        Packages: yeah
+"""
+
+BENTO_INFO_RECURSE = """\
+Name: foo
+
+Recurse: foo, bar
+"""
+
+SUBENTO_INFO = """\
+Library:
+    Packages: %s
+"""
+
+class TestCachedPackage(unittest.TestCase):
+    def setUp(self):
+        self.d = tempfile.mkdtemp()
+        self.old = os.getcwd()
+        try:
+            os.chdir(self.d)
+            self.top_node, self.build_node, self.run_node = \
+                create_base_nodes(self.d, op.join(self.d, "build"), self.d)
+            self.bento_info = self.top_node.make_node("bento.info")
+            self._write_bento_info(BENTO_INFO)
+            self.db_node = self.build_node.make_node("db")
+        except:
+            os.chdir(self.old)
+            shutil.rmtree(self.d)
+            raise
+
+        self.counts = {"parse": 0, "checksum": 0, "subento_parse": 0}
+        self._old_funcs = []
+        for module, name, count_key in [
+                (bentomakerlib.package_cache, "raw_parse", "parse"),
+                (bentomakerlib.package_cache, "_checksum", "checksum"),
+                (bento.core.package, "raw_parse", "subento_parse")]:
+            self._count_calls(module, name, count_key)
+
+    def tearDown(self):
+        for module, name, func in self._old_funcs:
+            setattr(module, name, func)
+        os.chdir(self.old)
+        shutil.rmtree(self.d)
+
+    def _count_calls(self, module, name, count_key):
+        func = getattr(module, name)
+        def _wrapped(*a, **kw):
+            self.counts[count_key] += 1
+            return func(*a, **kw)
+        self._old_funcs.append((module, name, func))
+        setattr(module, name, _wrapped)
+
+    def _reset_counts(self):
+        for k in self.counts:
+            self.counts[k] = 0
+
+    def _write_bento_info(self, content, node=None):
+        if node is None:
+            node = self.bento_info
+        node.write(content)
+        # Make sure the stat signature is not considered racy
+        past = time.time() - 60
+        os.utime(node.abspath(), (past, past))
+
+    def test_no_change(self):
+        package = CachedPackage(self.db_node).get_package(self.bento_info)
+        self.assertEqual(package.packages, ["yeah"])
+        self.assertEqual(self.counts["parse"], 1)
+
+        self._reset_counts()
+        cached = CachedPackage(self.db_node)
+        package = cached.get_package(self.bento_info, {"bundle": True})
+        self.assertEqual(package.packages, ["yeah"])
+        package = cached.get_package(self.bento_info, {"bundle": True})
+        options = cached.get_options(self.bento_info)
+        self.assertEqual(list(options.flag_options.keys()), ["bundle"])
+        # Neither parsed nor hashed again
+        self.assertEqual(self.counts, {"parse": 0, "checksum": 0, "subento_parse": 0})
+
+    def test_user_flags(self):
+        cached = CachedPackage(self.db_node)
+        self.assertEqual(cached.get_package(self.bento_info, {"bundle": True}).packages, ["yeah"])
+        self.assertEqual(cached.get_package(self.bento_info, {"bundle": False}).packages, [])
+
+        self._reset_counts()
+        cached = CachedPackage(self.db_node)
+        self.assertEqual(cached.get_package(self.bento_info, {"bundle": False}).packages, [])
+        self.assertEqual(cached.get_package(self.bento_info, {"bundle": True}).packages, ["yeah"])
+        self.assertEqual(self.counts["parse"], 0)
+
+    def test_modified(self):
+        CachedPackage(self.db_node).get_package(self.bento_info)
+        self._write_bento_info(BENTO_INFO.replace("yeah", "nope"))
+
+        package = CachedPackage(self.db_node).get_package(self.bento_info)
+        self.assertEqual(package.packages, ["nope"])
+        self.assertEqual(self.counts["parse"], 2)
+
+    def test_touched(self):
+        CachedPackage(self.db_node).get_package(self.bento_info)
+        past = time.time() - 30
+        os.utime(self.bento_info.abspath(), (past, past))
+
+        self._reset_counts()
+        CachedPackage(self.db_node).get_package(self.bento_info)
+        self.assertEqual(self.counts, {"parse": 0, "checksum": 1, "subento_parse": 0})
+
+        # New stat signature recorded
+        self._reset_counts()
+        CachedPackage(self.db_node).get_package(self.bento_info)
+        self.assertEqual(self.counts, {"parse": 0, "checksum": 0, "subento_parse": 0})
+
+    def test_modified_subento(self):
+        self._write_bento_info(BENTO_INFO_RECURSE)
+        subentos = {}
+        for name in ["foo", "bar"]:
+            self.top_node.make_node(name).mkdir()
+            subentos[name] = self.top_node.make_node(op.join(name, "bento.info"))
+            self._write_bento_info(SUBENTO_INFO % name, subentos[name])
+
+        package = CachedPackage(self.db_node).get_package(self.bento_info)
+        self.assertEqual(self.counts["subento_parse"], 2)
+        self.assertEqual(package.subpackages[op.join("bar", "bento.info")].packages, ["bar"])
+
+        # Only the modified subento is parsed again
+        self._reset_counts()
+        self._write_bento_info(SUBENTO_INFO % "baz", subentos["bar"])
+        package = CachedPackage(self.db_node).get_package(self.bento_info)
+        self.assertEqual(package.subpackages[op.join("foo", "bento.info")].packages, ["foo"])
+        self.assertEqual(package.subpackages[op.join("bar", "bento.info")].packages, ["baz"])
+        self.assertEqual(self.counts["parse"], 0)
+        self.assertEqual(self.counts["subento_parse"], 1)
+
+        # Modified top bento.info: subentos are not parsed again
+        self._reset_counts()
+        self._write_bento_info(BENTO_INFO_RECURSE.replace("foo, bar", "foo"))
+        package = CachedPackage(self.db_node).get_package(self.bento_info)
+        self.assertEqual(list(package.subpackages.keys()), [op.join("foo", "bento.info")])
+        self.assertEqual(self.counts["parse"], 1)
+        self.assertEqual(self.counts["subento_parse"], 0)
@@ -0,0 +1,107 @@
+"""Startup of bentomaker: commands modules should only be imported when
+needed. The startup time benchmark only runs if benchmarks are enabled (see
+bento.testing.benchmark)."""
+import os
+import sys
+import time
+import shutil
+import tempfile
+import subprocess
+
+import os.path as op
+
+from bento.compat.api.moves \
+    import \
+        unittest
+
+from bento.testing.benchmark \
+    import \
+        benchmarks_enabled, BENCHMARKS_ENV
+
+import bentomakerlib.bentomaker
+
+# Modules which should not be imported by commands not using them
+LAZY_MODULES = ["bento.commands.build_egg", "bento.commands.build_wininst",
+                "bento.commands.register", "bento.commands.upload",
+                "bento.commands.sphinx_command", "bento.convert",
+                "bento.backends.yaku_backend", "yaku.task_manager"]
+
+BENTO_INFO = """\
+Name: foo
+
+Library:
+    Modules: foo
+"""
+
+_RUN_BENTOMAKER = """\
+import sys
+from bentomakerlib.bentomaker import main
+main(sys.argv[1:])
+sys.stdout.write("\\nMODULES:" + ",".join(sys.modules.keys()))
+"""
+
+_IMPORT_ALL = """\
+import bentomakerlib.bentomaker
+for module_name, in %r:
+    __import__(module_name)
+""" % ([(m,) for m in LAZY_MODULES],)
+
+_TOP = op.dirname(op.dirname(op.abspath(bentomakerlib.bentomaker.__file__)))
+
+class TestStartup(unittest.TestCase):
+    def setUp(self):
+        self.d = tempfile.mkdtemp()
+        fid = open(op.join(self.d, "bento.info"), "w")
+        try:
+            fid.write(BENTO_INFO)
+        finally:
+            fid.close()
+        self.env = dict(os.environ)
+        self.env["PYTHONPATH"] = os.pathsep.join([_TOP, self.env.get("PYTHONPATH", "")])
+
+    def tearDown(self):
+        shutil.rmtree(self.d)
+
+    def _run(self, code, argv=None):
+        if argv is None:
+            argv = []
+        t0 = time.time()
+        # bentomaker asks for confirmation when run as root
+        p = subprocess.Popen([sys.executable, "-c", code] + argv, cwd=self.d,
+                             env=self.env, stdin=subprocess.PIPE,
+                             stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        stdout, stderr = p.communicate("y\n".encode())
+        elapsed = time.time() - t0
+        self.assertEqual(p.returncode, 0, stderr.decode())
+        return elapsed, stdout.decode()
+
+    def _run_bentomaker(self, argv):
+        elapsed, stdout = self._run(_RUN_BENTOMAKER, argv)
+        modules = stdout.split("MODULES:")[-1].split(",")
+        return elapsed, modules
+
+    def _assert_lazy(self, modules):
+        for m in LAZY_MODULES:
+            self.assertTrue(m not in modules, "%s imported" % m)
+
+    def test_version(self):
+        elapsed, modules = self._run_bentomaker(["--version"])
+        self._assert_lazy(modules)
+
+    def test_help_command(self):
+        elapsed, modules = self._run_bentomaker(["help", "configure"])
+        self._assert_lazy(modules)
+        self.assertTrue("bento.commands.configure" in modules)
+
+    def test_benchmark(self):
+        if not benchmarks_enabled():
+            raise unittest.SkipTest("benchmarks disabled (set %s to run them)" % BENCHMARKS_ENV)
+        # cold: first run in a new source tree (no build directory), warm:
+        # following runs, with the package cache filled
+        cold = self._run_bentomaker(["help", "build"])[0]
+        warm = min([self._run_bentomaker(["help", "build"])[0] for i in range(3)])
+        eager = min([self._run(_IMPORT_ALL)[0] for i in range(3)])
+        msg = "warm startup: %.3fs, cold startup: %.3fs, " \
+              "importing all commands: %.3fs" % (warm, cold, eager)
+        sys.stderr.write("\n%s\n" % msg)
+        self.assertTrue(warm < eager, msg)